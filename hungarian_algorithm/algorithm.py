@@ -8,10 +8,28 @@
     License: MIT License Copyright (c) 2020 Ben Chaplin
 '''
 
-import copy
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
+import time
+
+from .auction import solve_auction
+from .bottleneck import solve_bottleneck
+from .cardinality import is_unweighted, solve_unweighted
+from .compact import CompactGraph, weight_array
+from .components import solve_components
+from .events import MatchingStats, report_phase
+from .sparse import solve_sparse
+
+# MatchingStats is re-exported so callers can pass algorithm.MatchingStats()
+# as on_event
+__all__ = ['Vertex', 'Edge', 'Graph', 'generate_feasible_labeling', 'vertex_saturated',
+		   'initial_matching', 'find_matching', 'find_matchings', 'MatchingStats']
 
 class Vertex: 
 
+	__slots__ = ('key', 'label', 'edges', 'in_left')
+
 	def __init__(self, key):
 		'''Vertex constructor.
 
@@ -21,10 +39,19 @@ class Vertex:
 		'''
 		self.key = key
 		self.label = None
-		self.neighbors = set()
-		self.indicent_edges = set()
+		self.edges = {}
 		self.in_left = None
 
+	@property
+	def neighbors(self):
+		'''Neighboring vertex keys (set-like view of the edge index).'''
+		return self.edges.keys()
+
+	@property
+	def indicent_edges(self):
+		'''Indicent edges (view of the edge index).'''
+		return self.edges.values()
+
 	def get_edge(self, neighbor):
 		'''Get indicent edge.
 
@@ -36,11 +63,7 @@ class Vertex:
 		----------
 		Edge (or False if doesn't exist)
 		'''
-		for e in self.indicent_edges:
-			if neighbor in e.vertices:
-				return e
-
-		return False
+		return self.edges.get(neighbor, False)
 
 	def set_label(self, label):
 		'''Label the vertex.'''
@@ -49,23 +72,11 @@ class Vertex:
 	def set_in_left(self, in_left):
 		self.in_left = in_left
 
-	def filter_neighbors(self):
-		'''Filter neighbors set after update to indicent edges.
-		Filter from original set down.
-		'''
-		new_neighbors = set()
-
-		for v in self.neighbors:
-			for e in self.indicent_edges:
-				if v == e.vertices[0] or v == e.vertices[1]:
-					new_neighbors.add(v)
-					break
-
-		self.neighbors = new_neighbors
-
 
 class Edge:
 
+	__slots__ = ('vertices', 'weight')
+
 	def __init__(self, v1, v2, weight = 0):
 		'''Edge constructor.
 
@@ -75,7 +86,7 @@ class Edge:
 		v2 : str, required (endpoint2 key)
 		weight : int, optional (default = 0)
 		'''
-		self.vertices = [v1, v2]
+		self.vertices = (v1, v2)
 		self.weight = weight
 
 	def __eq__(self, e):
@@ -90,8 +101,11 @@ class Edge:
 
 class Graph:
 
-	def __init__(self, G = {}, negate = False):
-		'''Graph constructor (for connected graphs).
+	def __init__(self, G = {}, negate = False, epsilon = 0):
+		'''Graph constructor (for connected graphs). Vertices and edges
+		   are objects, since the dense solver completes the graph and
+		   relabels it in place; a CompactGraph is expanded into them (see
+		   compact.py for the CSR form the other solvers use).
 
 		Parameters
 		----------
@@ -102,8 +116,25 @@ class Graph:
 						dict (weighted graph) 
 							key : neighboring vertex key
 							value : edge weight
+			or
+			CompactGraph
+		negate : bool, optional (default = False) (negate edge weights)
+		epsilon : float, optional (default = 0) (equality subgraph
+												 tolerance)
 		'''
 		self.vertices = {}
+		self.epsilon = epsilon
+		# Cached bipartition: (start vertex or True for a hint, sides)
+		self.partition = None
+
+		if isinstance(G, CompactGraph):
+			# Straight from the CSR arrays, vertices in id order
+			for v in range(len(G)):
+				if G.degree(v):
+					self.add_vertex(G.keys[v])
+			for v1, v2, weight in G.oriented_edges():
+				self.add_edge(G.keys[v1], G.keys[v2], weight, negate)
+			return
 
 		for v1 in G:
 			for v2 in G[v1]:
@@ -120,6 +151,7 @@ class Graph:
 		key : str, required
 		'''
 		self.vertices[key] = Vertex(key)
+		self.partition = None
 
 	def add_edge(self, v1, v2, weight = 1, negate = False):
 		'''Add a vertex to the graph.
@@ -130,6 +162,9 @@ class Graph:
 		v2 : str, required (endpoint2 key)
 		weight : int, optional (default = 1)
 		'''
+		if weight != weight:
+			raise ValueError('weight of edge %r-%r is NaN' % (v1, v2))
+
 		if v1 not in self.vertices:
 			self.add_vertex(v1)
 		if v2 not in self.vertices:
@@ -140,10 +175,80 @@ class Graph:
 		else:
 			e = Edge(v1, v2, weight)
 
-		self.vertices[v1].neighbors.add(v2)
-		self.vertices[v2].neighbors.add(v1)
-		self.vertices[v1].indicent_edges.add(e)
-		self.vertices[v2].indicent_edges.add(e)
+		self.vertices[v1].edges[v2] = e
+		self.vertices[v2].edges[v1] = e
+		self.partition = None
+
+	def bipartition(self, start_vertex = None, left = None, right = None):
+		'''Split the vertices into two sides in one pass over every
+		   component (start_vertex and the first vertex of each other
+		   component go left), setting in_left on each vertex. The result
+		   is cached until the graph changes. Given left and/or right,
+		   the sides are taken as they are without any traversal.
+
+		Parameters
+		----------
+		start_vertex : str, optional (default = None) (vertex key)
+		left : iterable, optional (default = None) (left vertex keys)
+		right : iterable, optional (default = None) (right vertex keys,
+													 the rest if only left
+													 is given)
+
+		Return
+		----------
+		([str], [str]) (left and right vertex keys)
+			or
+		None (not bipartite)
+		'''
+		vertices = self.vertices
+
+		if left is not None or right is not None:
+			left = set(left) if left is not None else set(vertices) - set(right)
+			right = set(right) if right is not None else set(vertices) - left
+			for v in vertices:
+				if (v in left) == (v in right):
+					raise ValueError('vertex %r must be in exactly one of left and right' % (v,))
+				vertices[v].in_left = v in left
+			self.partition = (True, ([v for v in vertices if v in left],
+									 [v for v in vertices if v not in left]))
+			return self.partition[1]
+
+		if self.partition is not None:
+			start, sides = self.partition
+			if (start is True or start == start_vertex or start_vertex is None
+				or (sides is not None and vertices[start_vertex].in_left)):
+				return sides
+
+		for v in vertices.values():
+			v.in_left = None
+
+		order = list(vertices)
+		if start_vertex is not None:
+			order.insert(0, start_vertex)
+
+		sides = ([], [])
+		for root in order:
+			if vertices[root].in_left is not None:
+				continue
+			vertices[root].in_left = True
+			sides[0].append(root)
+			stack = [root]
+
+			while stack:
+				v = vertices[stack.pop()]
+				side = not v.in_left
+				for w in v.edges:
+					u = vertices[w]
+					if u.in_left is None:
+						u.in_left = side
+						sides[not side].append(w)
+						stack.append(w)
+					elif u.in_left != side:
+						self.partition = (start_vertex, None)
+						return None
+
+		self.partition = (start_vertex, sides)
+		return sides
 
 	def is_bipartite(self, start_vertex):
 		'''Determine if graph is bipartite.
@@ -155,22 +260,7 @@ class Graph:
 		if start_vertex == None:
 			return True
 
-		self.clear_labeling()
-		self.vertices[start_vertex].set_label(1)
-		queue = []
-		queue.append(start_vertex)
-
-		while queue:
-			v = queue.pop()
-
-			for w in self.vertices[v].neighbors:
-				if self.vertices[w].label == None:
-					self.vertices[w].set_label(1 - self.vertices[v].label)
-					queue.append(w)
-				elif self.vertices[w].label == self.vertices[v].label:
-					return False
-
-		return True
+		return self.bipartition(start_vertex) is not None
 
 	def make_complete_bipartite(self, start_vertex):
 		'''Make bipartite graph complete with weight 0 edges.
@@ -182,16 +272,19 @@ class Graph:
 		if start_vertex == None:
 			return True
 
-		self.clear_labeling()
-		self.generate_feasible_labeling(start_vertex)
+		sides = self.bipartition(start_vertex)
+		if sides is None:
+			return False
+
+		partition = self.partition
+		for x in sides[0]:
+			neighbors = self.vertices[x].neighbors
+			for y in sides[1]:
+				if y not in neighbors:
+					self.add_edge(x, y, 0)
 
-		for x in self.vertices:
-			if self.vertices[x].in_left:
-				for y in self.vertices:
-					if (not self.vertices[y].in_left 
-						and y not in self.vertices[x].neighbors):
-						self.add_edge(x, y, 0)
-		self.clear_labeling()
+		# The sides are unchanged
+		self.partition = partition
 
 	def feasibly_label(self, v):
 		'''Label a vertex with smallest nonzero feasible label 
@@ -225,26 +318,14 @@ class Graph:
 		if start_vertex == None:
 			return True
 
-		self.feasibly_label(start_vertex)
-		queue = []
-		queue.append(start_vertex)
-
-		while queue:
-			v = queue.pop()
-
-			for w in self.vertices[v].neighbors:
-				if self.vertices[w].label == None:
-					if self.vertices[v].label == 0:
-						self.feasibly_label(w)
-					else:
-						self.vertices[w].set_label(0)
-						self.vertices[w].set_in_left(False)
-					queue.append(w)
-				elif ((self.vertices[w].label == 0 
-					   and self.vertices[v].label == 0)
-					  or (self.vertices[w].label != 0
-					      and self.vertices[v].label != 0)):
-					return False
+		sides = self.bipartition(start_vertex)
+		if sides is None:
+			return False
+
+		for v in sides[0]:
+			self.feasibly_label(v)
+		for v in sides[1]:
+			self.vertices[v].set_label(0)
 
 		return True
 
@@ -264,7 +345,8 @@ class Graph:
 
 	def edge_in_equality_subgraph(self, e):
 		'''Determine whether edge is in equality subgraph
-		
+		   (l(v1) + l(v2) = w(e) to within epsilon)
+
 		Parameters
 		----------
 		e : Edge, required
@@ -279,8 +361,8 @@ class Graph:
 			self.vertices[e_endpoints[1]].label == None):
 			return False
 
-		return e.weight == (self.vertices[e_endpoints[0]].label + 
-							self.vertices[e_endpoints[1]].label)
+		return abs(e.weight - (self.vertices[e_endpoints[0]].label +
+							   self.vertices[e_endpoints[1]].label)) <= self.epsilon
 
 	def equality_subgraph(self):
 		'''Create equality subgraph w/ respect to labeling.
@@ -289,16 +371,32 @@ class Graph:
 		----------
 		Graph (subgraph with all edges e where l(v1) + l(v2) = w(e))
 		'''
-		eq_H = copy.deepcopy(self)
+		eq_H = Graph(epsilon = self.epsilon)
 
-		for v in eq_H.vertices:
-			eq_H.vertices[v].indicent_edges = list(filter(
-				self.edge_in_equality_subgraph, 
-				eq_H.vertices[v].indicent_edges))
-			eq_H.vertices[v].filter_neighbors()
+		for v in self.vertices:
+			eq_H.add_vertex(v)
+			eq_H.vertices[v].set_label(self.vertices[v].label)
+			eq_H.vertices[v].set_in_left(self.vertices[v].in_left)
+
+		for v in self.vertices:
+			for e in self.vertices[v].indicent_edges:
+				if v == e.vertices[0] and self.edge_in_equality_subgraph(e):
+					eq_H.add_edge(e.vertices[0], e.vertices[1], e.weight)
 
 		return eq_H
 
+	def compact(self):
+		'''Integer-indexed CSR copy of the graph (same keys, weights and
+		   edge directions).
+
+		Return
+		----------
+		CompactGraph
+		'''
+		return CompactGraph(dict((v, dict((w, e.weight) for w, e in self.vertices[v].edges.items()
+									  if e.vertices[0] == v))
+								 for v in self.vertices))
+
 
 def generate_feasible_labeling(G, start_vertex):
 	'''Generate the initial feasible labeling.
@@ -356,12 +454,171 @@ def vertex_saturated(v, M):
 
 	return False
 
-def find_matching(_G, matching_type = 'max', return_type = 'list'):
+def initial_matching(G, rows, cols, epsilon = 0, passes = 2):
+	'''Jonker-Volgenant initialization: label the vertices and match most
+	   rows before any augmenting tree is grown. Square graphs start with
+	   column reduction (each column labeled with its largest weight and
+	   matched to that row if free) and reduction transfer (a row matched
+	   once passes its slack to its column). Augmenting row reduction then
+	   lets each free row take its best column, raising that column's
+	   label up to the row's second best so the row stays tight, and
+	   evicting the previous owner. Column labels only rise on columns
+	   that end up matched, so unmatched columns keep label 0.
+
+	Parameters
+	----------
+	G : Graph, required (complete bipartite, labels are set in place)
+	rows : [str], required (vertex keys of the smaller side)
+	cols : [str], required (vertex keys of the other side)
+	epsilon : float, optional (default = 0) (tie tolerance)
+	passes : int, optional (default = 2) (augmenting row reduction passes)
+
+	Return
+	----------
+	({str: str}, {str: str}) (row_mate, col_mate)
+	'''
+	n, m = len(rows), len(cols)
+	W = [[G.vertices[x].edges[y].weight for y in cols] for x in rows]
+	b = [0] * m
+	row_of = [-1] * m
+	col_of = [-1] * n
+
+	if n == m and n > 1:
+		# Column reduction
+		matches = [0] * n
+		for j in range(m - 1, -1, -1):
+			i_max = max(range(n), key = lambda i: W[i][j])
+			b[j] = W[i_max][j]
+			if matches[i_max] == 0:
+				col_of[i_max] = j
+				row_of[j] = i_max
+			matches[i_max] = matches[i_max] + 1
+
+		# Reduction transfer
+		for i in range(n):
+			if matches[i] == 1:
+				j1 = col_of[i]
+				mu = max(W[i][j] - b[j] for j in range(m) if j != j1)
+				b[j1] = b[j1] - mu
+
+	# Augmenting row reduction
+	free = [i for i in range(n) if col_of[i] == -1]
+	for _ in range(passes):
+		if not free:
+			break
+		queue = free[::-1]
+		free = []
+		steps = 0
+
+		while queue and steps < 4 * n:
+			i = queue.pop()
+			steps = steps + 1
+
+			# Best and second best column for row i
+			h1 = h2 = None
+			j1 = j2 = -1
+			for j in range(m):
+				h = W[i][j] - b[j]
+				if h1 is None or h > h1:
+					h1, h2, j1, j2 = h, h1, j, j1
+				elif h2 is None or h > h2:
+					h2, j2 = h, j
+			if h2 is None:
+				h2, j2 = h1, j1
+
+			if h1 - h2 > epsilon:
+				b[j1] = b[j1] + (h1 - h2)
+			elif row_of[j1] != -1:
+				j1 = j2
+
+			i0 = row_of[j1]
+			col_of[i] = j1
+			row_of[j1] = i
+
+			if i0 != -1:
+				col_of[i0] = -1
+				if h1 - h2 > epsilon:
+					# Its best column got dearer: try it again right away
+					queue.append(i0)
+				else:
+					free.append(i0)
+
+		free = free + queue
+
+	for j in range(m):
+		G.vertices[cols[j]].set_label(b[j])
+	for i in range(n):
+		if col_of[i] != -1:
+			G.vertices[rows[i]].set_label(W[i][col_of[i]] - b[col_of[i]])
+		else:
+			G.vertices[rows[i]].set_label(max(W[i][j] - b[j] for j in range(m)))
+
+	row_mate = dict((rows[i], cols[col_of[i]]) for i in range(n) if col_of[i] != -1)
+	col_mate = dict((y, x) for x, y in row_mate.items())
+
+	return row_mate, col_mate
+
+def find_matching(_G, matching_type = 'max', return_type = 'list', sparse = False, missing = 'zero',
+				  on_event = None, components = False, workers = 1, epsilon = 0, scale = None,
+				  method = 'hungarian', bidding = 'gauss-seidel', left = None, right = None):
 	'''Find maximum/minimum-weighted matching.
 
 	Parameters
 	----------
-	_G : dict, required (valid Graph dict)
+	_G : dict, required (valid Graph dict, or a CompactGraph)
+	matching_type : str, optional (default = 'max') ('max', 'min' or
+													 'bottleneck': smallest
+													 largest weight, with
+													 'total' returning that
+													 weight)
+	return_type : str, optional (default = 'list') ('list' or 'total')
+	sparse : bool, optional (default = False) (solve on the given edges
+											  only, without making the
+											  graph complete)
+	missing : str, optional (default = 'zero') (sparse / components /
+												bottleneck only:
+												'zero' treats absent pairs
+												as weight 0, 'forbidden'
+												never matches them)
+	on_event : callable, optional (default = None) (called as
+													on_event(event, value)
+													for each event:
+		'phase' : (phase name, seconds)
+		'dual_update' : alpha
+		'tree_growth' : vertex added to T
+		'augmentation' : augmenting path length
+		see MatchingStats)
+	components : bool, optional (default = False) (solve each connected
+												   component separately and
+												   merge the matchings)
+	workers : int, optional (default = 1) (components only: processes
+										   solving components, None for
+										   one per CPU)
+	epsilon : float, optional (default = 0) (float weights: labels within
+											 epsilon of an edge weight
+											 count as tight, so the total
+											 is optimal to within
+											 n * epsilon)
+	scale : int, optional (default = None) (float weights: solve on
+											round(scale * weight) in exact
+											integer arithmetic, reporting
+											the original weights)
+	method : str, optional (default = 'hungarian') ('hungarian' or
+													'auction': epsilon-scaling
+													auction on the given
+													edges only, for large
+													sparse graphs; 'max' or
+													'min' only)
+	bidding : str, optional (default = 'gauss-seidel') (auction only:
+														'gauss-seidel' bids
+														one at a time,
+														'jacobi' bids all at
+														once with NumPy)
+	left : iterable, optional (default = None) (left vertex keys: skip
+												the bipartiteness check and
+												side detection, on every
+												method and path)
+	right : iterable, optional (default = None) (right vertex keys)
 
 	Return
 	----------
@@ -370,123 +627,205 @@ def find_matching(_G, matching_type = 'max', return_type = 'list'):
 		or
 	int (total weight)
 	'''
+	if method == 'auction':
+		return solve_auction(_G, matching_type, return_type, missing, bidding, epsilon, on_event,
+							 left, right)
+	elif method != 'hungarian':
+		raise ValueError("method must be 'hungarian' or 'auction'")
+	if matching_type == 'bottleneck':
+		return solve_bottleneck(_G, return_type, missing, on_event, left, right)
+	if matching_type == 'max' and not scale and is_unweighted(_G):
+		return solve_unweighted(_G, return_type, missing if sparse or components else 'zero', on_event,
+								left, right)
+	if components:
+		return solve_components(_G, matching_type, return_type, missing, workers, on_event,
+								left, right)
+	if sparse:
+		return solve_sparse(_G, matching_type, return_type, missing, on_event, left, right)
+
+	if on_event:
+		t = time.perf_counter()
+
+	if scale:
+		# Solve on integer weights, report the original ones
+		weights = {}
+		if isinstance(_G, CompactGraph):
+			for v1, v2, weight in _G.oriented_edges():
+				weights[_G.keys[v1], _G.keys[v2]] = weights[_G.keys[v2], _G.keys[v1]] = weight
+			_G = _G.with_weights(weight_array([round(scale * w) for w in _G.weights]))
+		else:
+			for v1 in _G:
+				for v2 in _G[v1]:
+					weights[v1, v2] = weights[v2, v1] = _G[v1][v2] if type(_G[v1]) is dict else 1
+			_G = dict((v1, dict((v2, round(scale * weights[v1, v2])) for v2 in _G[v1])) for v1 in _G)
+
 	# Step 1
 	# Create a bipartite graph, make it complete
 	negate = False if matching_type == 'max' else True
-	G = Graph(_G, negate)
-	start_vertex = list(G.vertices.keys())[0]
+	G = Graph(_G, negate, epsilon)
+	if on_event:
+		t = report_phase(on_event, 'construction', t)
+
+	start_vertex = next(iter(G.vertices), None)
+	G.bipartition(start_vertex, left, right)
 	G.make_complete_bipartite(start_vertex)
+	if on_event:
+		t = report_phase(on_event, 'completion', t)
 
 	# Generate an initial feasible labeling
 	is_bipartite = G.generate_feasible_labeling(start_vertex)
+	if on_event:
+		t = report_phase(on_event, 'labeling', t)
 
 	if not is_bipartite:
 		return False
 
-	# Create the equality subgraph
-	eq_G = G.equality_subgraph()
-
-	# Create an initial matching
-	M = set()
-
-	for x in eq_G.vertices:
-		if eq_G.vertices[x].in_left and not vertex_saturated(x, M):
-			max_edge = None
-			for y in eq_G.vertices[x].neighbors:
-				if not vertex_saturated(y, M):
-					if max_edge is None or eq_G.vertices[x].get_edge(y).weight > max_edge.weight:
-						max_edge = eq_G.vertices[x].get_edge(y)
-			if max_edge is not None:
-				M.add(max_edge)
-
-	S = set()
-	T = set()
-	path_end = None
-
-	while len(M) < int(len(eq_G.vertices)/2):
-		if path_end is None:
-			# Step 2
-			# Add new augmenting tree
-			for x in eq_G.vertices:
-				if eq_G.vertices[x].in_left and not vertex_saturated(x, M):
-					S.add(x)
-					path_end = x
-					break
-		
-		# Calculate neighbors of S
-		S_nbs = set()
-		for v in S:
-			S_nbs = S_nbs | eq_G.vertices[v].neighbors
-
-		if S_nbs == T:
+	# Every vertex on the smaller side (rows) gets matched, and augmenting
+	# trees are only grown from that side
+	left = [v for v in G.vertices if G.vertices[v].in_left]
+	right = [v for v in G.vertices if not G.vertices[v].in_left]
+	rows, cols = (left, right) if len(left) <= len(right) else (right, left)
+
+	# Label the vertices and create an initial matching
+	# (row_mate[x] = y and col_mate[y] = x for each matched edge x-y)
+	row_mate, col_mate = initial_matching(G, rows, cols, epsilon)
+
+	if on_event:
+		t = report_phase(on_event, 'initial_matching', t)
+
+	for path_end in rows:
+		if path_end in row_mate:
+			continue
+
+		# Step 2
+		# Add new augmenting tree. slack[y] = min over x in S of
+		# l(x) + l(y) - w(x, y) (0 iff y is an equality subgraph neighbor
+		# of S), reached through slack_vertex[y]
+		S = [path_end]
+		# parent[y] = vertex in S through which y joined the tree (T)
+		parent = {}
+		slack = {}
+		slack_vertex = {}
+		edges = G.vertices[path_end].edges
+		label = G.vertices[path_end].label
+
+		for y in cols:
+			slack[y] = label + G.vertices[y].label - edges[y].weight
+			slack_vertex[y] = path_end
+
+		while True:
 			# Step 3
-			alpha = None
-			for x in S:
-				for y in G.vertices.keys() - T:
-					if not G.vertices[y].in_left and y in G.vertices[x].neighbors:
-						new_alpha = G.vertices[x].label + G.vertices[y].label - G.vertices[x].get_edge(y).weight
-						alpha = new_alpha if alpha is None or new_alpha < alpha else alpha
-			
-			if alpha != None:
-				# Update the labeling
+			y = min(slack, key = slack.get)
+			alpha = slack[y]
+
+			if alpha > epsilon:
+				# Update the labeling (and so the slacks)
 				for u in S:
 					G.vertices[u].label = G.vertices[u].label - alpha
-				for v in T:
+				for v in parent:
 					G.vertices[v].label = G.vertices[v].label + alpha
+				for v in slack:
+					slack[v] = slack[v] - alpha
+				if on_event:
+					on_event('dual_update', alpha)
 
-				# Update the equality subgraph
-				eq_G = G.equality_subgraph()
-
-		# Calculate neighbors of S
-		S_nbs = set()
-		for v in S:
-			S_nbs = S_nbs | eq_G.vertices[v].neighbors
-
-		# Step 4
-		if S_nbs != T:
-			y = list(S_nbs - T)[0]
-			z = vertex_saturated(y, M)
+			# Step 4
+			parent[y] = slack_vertex[y]
+			del slack[y]
+			z = col_mate.get(y)
 
 			# Part (i)
-			if not z:
-				T.add(y)
-				
-				# Augment the matching
-				y_path_last = y
-				y_path_curr = y
-				matched_nbs = True
-
-				while matched_nbs:
-					matched_nbs = False
-
-					for x in S & eq_G.vertices[y_path_curr].neighbors:
-						y_matched_nb = vertex_saturated(x, M)
-						if y_matched_nb and y_matched_nb != y_path_last:
-							matched_nbs = True
-							M.add(eq_G.vertices[y_path_curr].get_edge(x))
-							M.remove(eq_G.vertices[x].get_edge(y_matched_nb))
-							y_path_last = y_path_curr
-							y_path_curr = y_matched_nb
-							break
-
-					if not matched_nbs:
-						M.add(eq_G.vertices[y_path_curr].get_edge(path_end))
-
-				S = set()
-				T = set()
-				path_end = None
+			if z is None:
+				break
 
 			# Part (ii)
-			else:
-				# Add to augmenting tree
-				S.add(z)
-				T.add(y)
+			# Add to augmenting tree
+			S.append(z)
+			if on_event:
+				on_event('tree_growth', y)
+
+			edges = G.vertices[z].edges
+			label = G.vertices[z].label
+			for v in slack:
+				new_slack = label + G.vertices[v].label - edges[v].weight
+				if new_slack < slack[v]:
+					slack[v] = new_slack
+					slack_vertex[v] = z
+
+		# Augment the matching along the tree path to path_end
+		length = 0
+		while y is not None:
+			x = parent[y]
+			next_y = row_mate.get(x)
+			row_mate[x] = y
+			col_mate[y] = x
+			y = next_y
+			length = length + 1
+
+		if on_event:
+			on_event('augmentation', 2 * length - 1)
+
+	if on_event:
+		t = report_phase(on_event, 'augmentation', t)
+
+	M = [G.vertices[x].get_edge(row_mate[x]) for x in row_mate]
 
 	edge_multiple = -1 if matching_type == 'min' else 1;
+	if scale:
+		weight = lambda e: weights.get(e.vertices, 0)
+	else:
+		weight = lambda e: edge_multiple * e.weight
 	if return_type == 'list':
-		return list(map(lambda e: ((e.vertices[0], e.vertices[1]), edge_multiple * e.weight), M))
+		return list(map(lambda e: ((e.vertices[0], e.vertices[1]), weight(e)), M))
 	elif return_type == 'total':
 		total = 0
 		for e in M:
-			total = total + (edge_multiple * e.weight)
+			total = total + weight(e)
 		return total
+
+def find_matchings(graphs, matching_type = 'max', return_type = 'list',
+				   workers = None, chunksize = None, serial_edges = 5000, **kwargs):
+	'''Find maximum/minimum-weighted matchings of many independent graphs,
+	   spread across a process pool.
+
+	Parameters
+	----------
+	graphs : iterable of dict, required (valid Graph dicts, or CompactGraphs)
+	matching_type : str, optional (default = 'max')
+	return_type : str, optional (default = 'list')
+	workers : int, optional (default = number of CPUs)
+	chunksize : int, optional (default = about 4 chunks per worker)
+				(graphs sent to a worker at a time)
+	serial_edges : int, optional (default = 5000) (solve in this process
+												   when the batch has
+												   fewer edges in total)
+	**kwargs : other find_matching arguments
+
+	Return
+	----------
+	list (find_matching result for each graph, in input order)
+	'''
+	graphs = list(graphs)
+	workers = workers or os.cpu_count() or 1
+	solve = partial(find_matching, matching_type = matching_type,
+					return_type = return_type, **kwargs)
+
+	# Serial fast path: pool start-up and pickling would dominate
+	edges = 0
+	for G in graphs:
+		if isinstance(G, CompactGraph):
+			edges = edges + G.num_edges()
+		else:
+			edges = edges + sum(len(G[v]) for v in G)
+
+	if workers == 1 or len(graphs) < 2 or edges < serial_edges:
+		return [solve(G) for G in graphs]
+
+	# Graphs travel as plain dicts (cheaper to pickle than Graph objects),
+	# in chunks, and each worker builds its own Graph
+	workers = min(workers, len(graphs))
+	if chunksize is None:
+		chunksize = max(1, -(-len(graphs) // (4 * workers)))
+
+	with ProcessPoolExecutor(max_workers = workers) as pool:
+		return list(pool.map(solve, graphs, chunksize = chunksize))
@@ -0,0 +1,327 @@
+'''
+    File name: auction.py
+    Description: Auction algorithm with epsilon scaling (Bertsekas) for
+                 sparse assignment problems.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+import time
+
+from .compact import CompactGraph
+from .events import report_phase
+from .sparse import private_partner_cost, solve_sparse
+
+# Factor by which epsilon shrinks between scaling phases
+THETA = 5
+
+# Jacobi rounds with fewer bidders are finished one bid at a time
+JACOBI_MIN_BIDDERS = 64
+
+def reduction(CG, A, B, sign, missing):
+	'''Square sparse assignment problem whose perfect matchings are the
+	   matchings between A and B. Persons are A then a copy of B, objects
+	   are B then a copy of A: a-b has the edge's benefit, the mirror arc
+	   b'-a' has benefit 0, and a-a' / b'-b leave a / b unmatched.
+
+	Parameters
+	----------
+	CG : CompactGraph, required
+	A : [int], required (vertex ids)
+	B : [int], required (vertex ids)
+	sign : int, required (1 to maximize weight, -1 to minimize)
+	missing : str, required ('zero' or 'forbidden': every a-b arc is
+							 worth more than any set of fewer arcs)
+
+	Return
+	----------
+	([int], [int], [int]) (CSR arcs of each person: offsets, objects and
+						   benefits)
+	'''
+	a_index = {v: i for i, v in enumerate(A)}
+	b_index = {v: j for j, v in enumerate(B)}
+	n_b = len(B)
+
+	# Forbidden: an extra a-b arc outweighs any change in the others
+	bonus = private_partner_cost([CG.edges(v) for v in A], missing)
+
+	offsets = [0]
+	targets = []
+	values = []
+
+	for i, v in enumerate(A):
+		for u, w in CG.edges(v):
+			targets.append(b_index[u])
+			values.append(sign * w + bonus)
+		targets.append(n_b + i)
+		values.append(0)
+		offsets.append(len(targets))
+
+	for j, u in enumerate(B):
+		targets.append(j)
+		values.append(0)
+		for v in CG.neighbors(u):
+			targets.append(n_b + a_index[v])
+			values.append(0)
+		offsets.append(len(targets))
+
+	return offsets, targets, values
+
+def epsilon_schedule(values, n, epsilon):
+	'''Benefit scale factor and decreasing epsilons ending at the final
+	   one. Integer benefits are scaled by n + 1 so that a final epsilon
+	   of 1 is exact.
+
+	Parameters
+	----------
+	values : [int], required (benefits)
+	n : int, required (number of persons)
+	epsilon : float, required (final epsilon, 0 for exact integer
+							   results or 1e-9 of the largest benefit
+							   otherwise)
+
+	Return
+	----------
+	(int, [float]) (scale, epsilons)
+	'''
+	C = max([abs(w) for w in values] or [0])
+	exact = not epsilon and all(type(w) is int for w in values)
+
+	if exact:
+		scale, final = n + 1, 1
+		C = C * scale
+	else:
+		scale, final = 1, epsilon or 1e-9 * C or 1
+
+	epsilons = [final]
+	while epsilons[-1] * THETA < C:
+		epsilons.append(epsilons[-1] * THETA)
+
+	return scale, epsilons[::-1]
+
+def bid_gauss_seidel(offsets, targets, values, prices, eps, owner = None, unassigned = None):
+	'''One scaling phase, one bidder at a time.
+
+	Parameters
+	----------
+	offsets, targets, values : [int], required (as reduction)
+	prices : [float], required (price of each object, updated in place)
+	eps : float, required
+	owner : [int], optional (default = None) (person holding each object,
+											  -1 for none)
+	unassigned : [int], optional (default = None) (persons still to bid,
+												   all if None)
+
+	Return
+	----------
+	[int] (object of each person)
+	'''
+	n = len(prices)
+	if owner is None:
+		owner = [-1] * n
+		unassigned = list(range(n - 1, -1, -1))
+	NEG_INF = float('-inf')
+
+	while unassigned:
+		i = unassigned.pop()
+
+		# Best and second best value among i's objects
+		best = second = NEG_INF
+		best_j = -1
+		for k in range(offsets[i], offsets[i + 1]):
+			j = targets[k]
+			value = values[k] - prices[j]
+			if value > best:
+				best, second, best_j = value, best, j
+			elif value > second:
+				second = value
+
+		prices[best_j] = prices[best_j] + (best - second if second != NEG_INF else 0) + eps
+		previous = owner[best_j]
+		owner[best_j] = i
+
+		if previous != -1:
+			unassigned.append(previous)
+
+	assigned = [0] * n
+	for j in range(n):
+		assigned[owner[j]] = j
+
+	return assigned
+
+def bid_jacobi(offsets, targets, values, prices, eps):
+	'''One scaling phase, every unassigned person bidding at once
+	   (vectorized with NumPy).
+
+	Return
+	----------
+	[int] (object of each person)
+	'''
+	import numpy as np
+
+	n = len(prices)
+	offsets_ = np.asarray(offsets, dtype=np.intp)
+	targets_ = np.asarray(targets, dtype=np.intp)
+	values_ = np.asarray(values, dtype=np.float64)
+	p = np.asarray(prices, dtype=np.float64)
+	owner = np.full(n, -1, dtype=np.intp)
+	bidders = np.arange(n)
+
+	while len(bidders) > JACOBI_MIN_BIDDERS:
+		# Arcs of every bidder, one segment per bidder
+		starts = offsets_[bidders]
+		lengths = offsets_[bidders + 1] - starts
+		seg_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+		arcs = np.repeat(starts - seg_starts, lengths) + np.arange(lengths.sum())
+		segment = np.repeat(np.arange(len(bidders)), lengths)
+
+		value = values_[arcs] - p[targets_[arcs]]
+		best = np.maximum.reduceat(value, seg_starts)
+		first = np.where(value == best[segment], np.arange(len(arcs)), len(arcs))
+		best_arc = np.minimum.reduceat(first, seg_starts)
+		value[best_arc] = -np.inf
+		second = np.maximum.reduceat(value, seg_starts)
+
+		best_j = targets_[arcs[best_arc]]
+		bid = p[best_j] + np.where(np.isfinite(second), best - second, 0) + eps
+
+		# Highest bid wins each object (first bidder on ties)
+		order = np.lexsort((-bid, best_j))
+		first = np.ones(len(order), dtype=bool)
+		first[1:] = best_j[order[1:]] != best_j[order[:-1]]
+		top = order[first]
+		won = best_j[top]
+		winners = bidders[top]
+
+		outbid = owner[won]
+		losers = np.ones(len(bidders), dtype=bool)
+		losers[top] = False
+		owner[won] = winners
+		p[won] = bid[top]
+
+		bidders = np.concatenate((bidders[losers], outbid[outbid >= 0]))
+
+	# The last few bids are cheaper one at a time
+	prices[:] = p.tolist()
+
+	return bid_gauss_seidel(offsets, targets, values, prices, eps,
+							owner.tolist(), bidders.tolist())
+
+def solve_auction(_G, matching_type = 'max', return_type = 'list', missing = 'zero',
+				  bidding = 'gauss-seidel', epsilon = 0, on_event = None, left = None,
+				  right = None):
+	'''Find maximum/minimum-weighted matching with the epsilon-scaling
+	   auction algorithm, on the given edges only.
+
+	Parameters
+	----------
+	_G : dict, required (valid Graph dict, or a CompactGraph)
+	matching_type : str, optional (default = 'max') ('max' or 'min')
+	return_type : str, optional (default = 'list')
+	missing : str, optional (default = 'zero') (as solve_sparse)
+	bidding : str, optional (default = 'gauss-seidel') ('gauss-seidel':
+														one bid at a
+														time; 'jacobi':
+														all unassigned
+														persons bid at
+														once, with NumPy)
+	epsilon : float, optional (default = 0) (final epsilon: the total is
+											 optimal to within
+											 |V| * epsilon; 0 is exact
+											 for integer weights)
+	on_event : callable, optional (default = None) (as find_matching,
+													plus 'scaling_phase' :
+													epsilon)
+	left : iterable, optional (default = None) (as find_matching)
+	right : iterable, optional (default = None) (as find_matching)
+
+	Return
+	----------
+	[(str, int)] / int (as find_matching)
+		or
+	False (not bipartite)
+	'''
+	if matching_type not in ('max', 'min'):
+		raise ValueError("auction matching_type must be 'max' or 'min'")
+	if missing not in ('zero', 'forbidden'):
+		raise ValueError("missing must be 'zero' or 'forbidden'")
+	if bidding not in ('gauss-seidel', 'jacobi'):
+		raise ValueError("bidding must be 'gauss-seidel' or 'jacobi'")
+
+	if on_event:
+		t = time.perf_counter()
+
+	CG = _G if isinstance(_G, CompactGraph) else CompactGraph(_G)
+	keys = CG.keys
+	if on_event:
+		t = report_phase(on_event, 'construction', t)
+
+	in_left = CG.bipartition(left, right)
+	if on_event:
+		t = report_phase(on_event, 'labeling', t)
+
+	if in_left is None:
+		return False
+
+	left = [v for v in range(len(keys)) if in_left[v]]
+	right = [v for v in range(len(keys)) if not in_left[v]]
+
+	# Every vertex of the smaller side A is matched
+	A, B = (left, right) if len(left) <= len(right) else (right, left)
+	sign = 1 if matching_type == 'max' else -1
+	offsets, targets, values = reduction(CG, A, B, sign, missing)
+	n = len(A) + len(B)
+
+	scale, epsilons = epsilon_schedule(values, n, epsilon)
+	if scale != 1:
+		values = [w * scale for w in values]
+
+	bid = bid_gauss_seidel if bidding == 'gauss-seidel' else bid_jacobi
+	prices = [0] * n
+	for eps in epsilons:
+		assigned = bid(offsets, targets, values, prices, eps)
+		if on_event:
+			on_event('scaling_phase', eps)
+
+	pairs = []
+	unpaired = []
+	free = [True] * len(B)
+
+	for i in range(len(A)):
+		j = assigned[i]
+		if j < len(B):
+			free[j] = False
+			pairs.append((A[i], B[j], CG.get_weight(A[i], B[j], 0)))
+		elif missing == 'zero':
+			unpaired.append(A[i])
+
+	# Pair the rest at weight 0
+	free = [B[j] for j in range(len(B)) if free[j]]
+	for v in unpaired:
+		for i in range(len(free)):
+			w = CG.get_weight(v, free[i], 0)
+			if w == 0:
+				pairs.append((v, free[i], w))
+				free[i] = free[-1]
+				free.pop()
+				break
+		else:
+			# Too few non-adjacent free vertices
+			return solve_sparse(CG, matching_type, return_type, missing, on_event,
+								[keys[v] for v in left])
+
+	if on_event:
+		t = report_phase(on_event, 'augmentation', t)
+
+	M = [CG.pair(u, v, w) if in_left[u] else CG.pair(v, u, w) for u, v, w in pairs]
+
+	if return_type == 'list':
+		return M
+	elif return_type == 'total':
+		total = 0
+		for e in M:
+			total = total + e[1]
+		return total
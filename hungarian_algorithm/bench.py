@@ -0,0 +1,352 @@
+'''
+    File name: bench.py
+    Description: Benchmarks for find_matching (run with
+                 python -m hungarian_algorithm.bench).
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from .algorithm import MatchingStats, find_matching
+
+def dense_int(rng, n):
+	'''Complete n x n graph, integer weights in [0, 100].'''
+	return dict(('x%d' % i, dict(('y%d' % j, rng.randint(0, 100))
+								 for j in range(n)))
+				for i in range(n))
+
+def dense_float(rng, n):
+	'''Complete n x n graph, float weights uniform in [0, 100).'''
+	return dict(('x%d' % i, dict(('y%d' % j, rng.uniform(0, 100))
+								 for j in range(n)))
+				for i in range(n))
+
+def sparse(rng, n):
+	'''n x n graph, about max(2, n / 10) integer weighted edges per
+	   left vertex.'''
+	degree = max(2, n // 10)
+	return dict(('x%d' % i, dict(('y%d' % rng.randrange(n), rng.randint(1, 100))
+								 for d in range(degree)))
+				for i in range(n))
+
+def unbalanced(rng, n):
+	'''Complete n / 4 x n graph, integer weights in [0, 100].'''
+	return dict(('x%d' % i, dict(('y%d' % j, rng.randint(0, 100))
+								 for j in range(n)))
+				for i in range(max(1, n // 4)))
+
+def ties(rng, n):
+	'''Complete n x n graph with weights 1 or 2 (many optimal matchings).'''
+	return dict(('x%d' % i, dict(('y%d' % j, rng.choice((1, 1, 1, 2)))
+								 for j in range(n)))
+				for i in range(n))
+
+INSTANCES = {
+	'dense_int': dense_int,
+	'dense_float': dense_float,
+	'sparse': sparse,
+	'unbalanced': unbalanced,
+	'ties': ties
+}
+
+def time_phases(_G):
+	'''Time one find_matching call, phase by phase.
+
+	Parameters
+	----------
+	_G : dict, required (valid Graph dict)
+
+	Return
+	----------
+	(dict, dict) (phase : seconds, event : count)
+	'''
+	stats = MatchingStats()
+	t = time.perf_counter()
+	find_matching(_G, return_type = 'total', on_event = stats)
+	phases = dict(stats.phases)
+	phases['total'] = time.perf_counter() - t
+
+	return phases, stats.counts
+
+def peak_memory(_G):
+	'''Peak traced allocation (bytes) of one find_matching call.'''
+	tracemalloc.start()
+	try:
+		find_matching(_G, return_type = 'total')
+		return tracemalloc.get_traced_memory()[1]
+	finally:
+		tracemalloc.stop()
+
+def scaling_exponent(sizes, times):
+	'''Least-squares slope of log(time) against log(n).'''
+	points = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if t > 0]
+
+	if len(points) < 2:
+		return None
+
+	mean_x = sum(x for x, y in points) / len(points)
+	mean_y = sum(y for x, y in points) / len(points)
+	var = sum((x - mean_x) ** 2 for x, y in points)
+
+	if var == 0:
+		return None
+
+	return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+def float_int_ratio(results):
+	'''Total time of dense_float over dense_int, by n.'''
+	totals = dict(((r['kind'], r['n']), r['seconds']['total']) for r in results)
+
+	return dict((n, totals['dense_float', n] / totals['dense_int', n])
+				for kind, n in totals if kind == 'dense_int'
+				and ('dense_float', n) in totals and totals['dense_int', n] > 0)
+
+def run(kinds, sizes, seed = 0, repeat = 3, memory = True):
+	'''Benchmark find_matching on generated instances.
+
+	Parameters
+	----------
+	kinds : [str], required (keys of INSTANCES)
+	sizes : [int], required (n for each instance)
+	seed : int, optional (default = 0)
+	repeat : int, optional (default = 3) (best of repeat runs is kept)
+	memory : bool, optional (default = True) (also trace peak memory)
+
+	Return
+	----------
+	dict (JSON-serializable report)
+	'''
+	results = []
+	scaling = {}
+
+	for kind in kinds:
+		totals = []
+		for n in sizes:
+			_G = INSTANCES[kind](random.Random('%s-%d-%d' % (kind, n, seed)), n)
+			runs = [time_phases(_G) for r in range(repeat)]
+			phases, counts = min(runs, key = lambda run: run[0]['total'])
+			result = {
+				'kind': kind,
+				'n': n,
+				'edges': sum(len(_G[v]) for v in _G),
+				'seconds': phases,
+				'counts': counts
+			}
+			if memory:
+				result['peak_memory_bytes'] = peak_memory(_G)
+			results.append(result)
+			totals.append(phases['total'])
+		scaling[kind] = scaling_exponent(sizes, totals)
+
+	report = {
+		'python': platform.python_version(),
+		'seed': seed,
+		'repeat': repeat,
+		'results': results,
+		'scaling_exponent': scaling
+	}
+
+	if 'dense_int' in kinds and 'dense_float' in kinds:
+		report['float_int_ratio'] = float_int_ratio(results)
+
+	return report
+
+def page_ins():
+	'''(major page faults, blocks read) of this process so far, or None
+	   where getrusage isn't available.'''
+	try:
+		import resource
+	except ImportError:
+		return None
+
+	usage = resource.getrusage(resource.RUSAGE_SELF)
+	return usage.ru_majflt, usage.ru_inblock
+
+def evict(path):
+	'''Ask the OS to drop a file from the page cache, so the next read
+	   of it pages in from disk (best effort).'''
+	if not hasattr(os, 'posix_fadvise'):
+		return
+
+	fd = os.open(path, os.O_RDONLY)
+	try:
+		os.fsync(fd)
+		os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+	finally:
+		os.close(fd)
+
+def solve_npy(path, mapped):
+	'''Solve the .npy cost matrix at path, either memory-mapped (rows read
+	   on demand) or loaded into memory first.
+
+	Return
+	----------
+	int (bytes of costs read)
+	'''
+	import numpy as np
+	from . import matrix
+
+	M = np.load(path, mmap_mode = 'r')
+	if mapped:
+		C = matrix.MappedCosts(M)
+		matrix.shortest_augmenting_paths(C)
+		return C.values_read * M.dtype.itemsize
+
+	matrix.shortest_augmenting_paths(np.array(M, dtype = np.float64))
+	return M.size * M.dtype.itemsize
+
+def time_matrix(path, mapped, memory = True):
+	'''Time solve_npy from a cold page cache.
+
+	Return
+	----------
+	dict (seconds, page-ins, bytes of costs read and peak traced memory)
+	'''
+	evict(path)
+	before = page_ins()
+	t = time.perf_counter()
+	read = solve_npy(path, mapped)
+	result = {'seconds': time.perf_counter() - t, 'cost_bytes_read': read}
+	after = page_ins()
+
+	if before and after:
+		result['major_page_faults'] = after[0] - before[0]
+		result['blocks_read'] = after[1] - before[1]
+
+	if memory:
+		tracemalloc.start()
+		try:
+			solve_npy(path, mapped)
+			result['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+		finally:
+			tracemalloc.stop()
+
+	return result
+
+def run_matrix(sizes, seed = 0, directory = None, memory = True):
+	'''Benchmark solve_matrix on n x n float32 .npy files, memory-mapped
+	   against loaded into memory (requires numpy).
+
+	Parameters
+	----------
+	sizes : [int], required (n for each matrix)
+	seed : int, optional (default = 0)
+	directory : str, optional (default = system temporary directory)
+				(where the matrices are written)
+	memory : bool, optional (default = True) (also trace peak memory)
+
+	Return
+	----------
+	[dict] (one result per n and mode)
+	'''
+	import numpy as np
+
+	results = []
+	with tempfile.TemporaryDirectory(dir = directory) as d:
+		for n in sizes:
+			path = os.path.join(d, 'cost-%d.npy' % n)
+			np.save(path, np.random.RandomState(seed).random_sample((n, n)).astype(np.float32))
+			for mode in ('mapped', 'memory'):
+				result = {'n': n, 'mode': mode}
+				result.update(time_matrix(path, mode == 'mapped', memory))
+				results.append(result)
+
+	return results
+
+def run_workers(sizes, workers, seed = 0, repeat = 3):
+	'''Benchmark solve_matrix on dense n x n float matrices with each
+	   number of threads (requires numpy).
+
+	Parameters
+	----------
+	sizes : [int], required (n for each matrix)
+	workers : [int], required (threads for each run)
+	seed : int, optional (default = 0)
+	repeat : int, optional (default = 3) (best of repeat runs is kept)
+
+	Return
+	----------
+	[dict] (one result per n and number of threads, with the speedup over
+			the first number of threads)
+	'''
+	import numpy as np
+	from . import matrix
+
+	results = []
+	for n in sizes:
+		C = np.random.RandomState(seed).random_sample((n, n)) * 100
+		base = None
+		for w in workers:
+			best = None
+			for r in range(repeat):
+				t = time.perf_counter()
+				total = matrix.solve_matrix(C, workers = w)[2]
+				t = time.perf_counter() - t
+				best = t if best is None else min(best, t)
+			base = base or best
+			results.append({'n': n, 'workers': w, 'seconds': best, 'total': total,
+							'speedup': base / best})
+
+	return results
+
+def main(argv = None):
+	parser = argparse.ArgumentParser(
+		prog = 'python -m hungarian_algorithm.bench',
+		description = 'Benchmark find_matching and emit a JSON report.')
+	parser.add_argument('--kinds', nargs = '+', default = list(INSTANCES),
+						choices = list(INSTANCES))
+	parser.add_argument('--sizes', nargs = '+', type = int, default = [8, 16, 32, 64])
+	parser.add_argument('--seed', type = int, default = 0)
+	parser.add_argument('--repeat', type = int, default = 3)
+	parser.add_argument('--no-memory', action = 'store_true',
+						help = 'skip peak memory tracing')
+	parser.add_argument('--matrix-sizes', nargs = '+', type = int,
+						help = 'benchmark memory-mapped against in-memory '
+							   'solve_matrix on n x n .npy files instead')
+	parser.add_argument('--directory', help = 'where --matrix-sizes files are written')
+	parser.add_argument('--parallel-sizes', nargs = '+', type = int,
+						help = 'benchmark solve_matrix with each of --workers '
+							   'threads on n x n float matrices instead')
+	parser.add_argument('--workers', nargs = '+', type = int, default = [1, os.cpu_count() or 1])
+	parser.add_argument('--output', help = 'write JSON here instead of stdout')
+	args = parser.parse_args(argv)
+
+	if args.parallel_sizes:
+		report = {
+			'python': platform.python_version(),
+			'cpus': os.cpu_count(),
+			'seed': args.seed,
+			'parallel': run_workers(args.parallel_sizes, args.workers, args.seed, args.repeat)
+		}
+	elif args.matrix_sizes:
+		report = {
+			'python': platform.python_version(),
+			'seed': args.seed,
+			'matrix': run_matrix(args.matrix_sizes, args.seed, args.directory,
+								 not args.no_memory)
+		}
+	else:
+		report = run(args.kinds, args.sizes, args.seed, args.repeat, not args.no_memory)
+
+	if args.output:
+		with open(args.output, 'w') as f:
+			json.dump(report, f, indent = 2)
+	else:
+		json.dump(report, sys.stdout, indent = 2)
+		sys.stdout.write('\n')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,206 @@
+'''
+    File name: bottleneck.py
+    Description: Bottleneck (min-max) assignment by binary search over the
+                 weights with Hopcroft-Karp feasibility checks.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+import time
+
+from .cardinality import hopcroft_karp
+from .compact import CompactGraph
+from .events import report_phase
+
+def threshold_graph(edges, t):
+	'''B neighbors of each A vertex through given pairs weighing at
+	   most t.
+
+	Parameters
+	----------
+	edges : [[(int, int)]], required ((B vertex, weight) pairs of each A
+									  vertex)
+	t : int, required (threshold)
+
+	Return
+	----------
+	[[int]]
+	'''
+	return [[b for b, w in pairs if w <= t] for pairs in edges]
+
+def augment_absent(edges, adj, n_b, mate_a, mate_b, on_event = None):
+	'''Grow a matching of adj to a maximum one that may also use the pairs
+	   absent from edges (weight 0), without listing them: one breadth-first
+	   search per free A vertex, where the unvisited B vertices are kept in
+	   a set and each A vertex skips only its given pairs. O(m + n) per
+	   search.
+
+	Parameters
+	----------
+	edges : [[(int, int)]], required (as threshold_graph)
+	adj : [[int]], required (threshold_graph of edges)
+	n_b : int, required (number of B vertices)
+	mate_a, mate_b : [int], required (as hopcroft_karp, updated in place)
+	on_event : callable, optional (default = None) (as find_matching)
+
+	Return
+	----------
+	int (number of matched A vertices)
+	'''
+	present = [set(b for b, w in pairs) for pairs in edges]
+
+	for root in range(len(adj)):
+		if mate_a[root] != -1:
+			continue
+
+		unvisited = set(range(n_b))
+		# A vertex each B vertex was reached from
+		parent = {}
+		queue = [root]
+		free = -1
+		for a in queue:
+			# Light given pairs, then every absent pair (adj[a] is part of
+			# present[a], so none is listed twice)
+			reached = [b for b in adj[a] if b in unvisited]
+			reached.extend(b for b in unvisited if b not in present[a])
+			for b in reached:
+				unvisited.discard(b)
+				parent[b] = a
+				if mate_b[b] == -1:
+					free = b
+					break
+				queue.append(mate_b[b])
+			if free != -1:
+				break
+
+		if free == -1:
+			continue
+
+		# Augment along the search tree
+		b, length = free, -1
+		while b != -1:
+			a = parent[b]
+			next_b = mate_a[a]
+			mate_a[a] = b
+			mate_b[b] = a
+			b = next_b
+			length = length + 2
+		if on_event:
+			on_event('augmentation', length)
+
+	return sum(1 for b in mate_a if b != -1)
+
+def solve_bottleneck(_G, return_type = 'list', missing = 'zero', on_event = None,
+					 left = None, right = None):
+	'''Find the matching of every vertex on the smaller side (of as many
+	   vertices as possible with missing = 'forbidden') whose largest
+	   weight is smallest. O(m * sqrt(n) * log m), plus O(n * (m + n)) for
+	   each check where the given pairs fall short and absent pairs are
+	   needed (missing = 'zero').
+
+	Parameters
+	----------
+	_G : dict, required (valid Graph dict, or a CompactGraph)
+	return_type : str, optional (default = 'list') ('list' or 'total': the
+													 largest weight in the
+													 matching)
+	missing : str, optional (default = 'zero') (as solve_sparse)
+	on_event : callable, optional (default = None) (as find_matching, plus
+													'threshold' : weight
+													checked)
+	left : iterable, optional (default = None) (as find_matching)
+	right : iterable, optional (default = None) (as find_matching)
+
+	Return
+	----------
+	[(str, int)] (as find_matching)
+		or
+	int (bottleneck weight, 0 for an empty matching)
+		or
+	False (not bipartite)
+	'''
+	if missing not in ('zero', 'forbidden'):
+		raise ValueError("missing must be 'zero' or 'forbidden'")
+
+	if on_event:
+		t0 = time.perf_counter()
+
+	CG = _G if isinstance(_G, CompactGraph) else CompactGraph(_G)
+	keys = CG.keys
+	if on_event:
+		t0 = report_phase(on_event, 'construction', t0)
+
+	in_left = CG.bipartition(left, right)
+	if on_event:
+		t0 = report_phase(on_event, 'labeling', t0)
+
+	if in_left is None:
+		return False
+
+	left = [v for v in range(len(keys)) if in_left[v]]
+	right = [v for v in range(len(keys)) if not in_left[v]]
+
+	A, B = (left, right) if len(left) <= len(right) else (right, left)
+	b_index = {v: i for i, v in enumerate(B)}
+	edges = [[(b_index[w], weight) for w, weight in CG.edges(v)] for v in A]
+
+	# Candidate bottlenecks
+	weights = set(w for pairs in edges for b, w in pairs)
+	if missing == 'zero' and any(len(pairs) < len(B) for pairs in edges):
+		weights.add(0)
+	weights = sorted(weights)
+
+	mate_a = [-1] * len(A)
+	mate_b = [-1] * len(B)
+
+	if missing == 'zero':
+		target = len(A)
+	else:
+		target = hopcroft_karp(threshold_graph(edges, weights[-1] if weights else 0),
+							   len(B), list(mate_a), list(mate_b))
+
+	# Smallest candidate at which target vertices can be matched, each
+	# check starting from the previous matching minus its heavier pairs
+	best = None
+	lo, hi = 0, len(weights) - 1
+	while target and lo <= hi:
+		mid = (lo + hi) // 2
+		t = weights[mid]
+		if on_event:
+			on_event('threshold', t)
+
+		adj = threshold_graph(edges, t)
+		for a in range(len(A)):
+			b = mate_a[a]
+			if b != -1 and CG.get_weight(A[a], B[b], 0) > t:
+				mate_a[a] = -1
+				mate_b[b] = -1
+
+		matched = hopcroft_karp(adj, len(B), mate_a, mate_b, on_event)
+		if matched < target and missing == 'zero' and t >= 0:
+			# The given pairs fall short: absent pairs (weight 0) fill in
+			matched = augment_absent(edges, adj, len(B), mate_a, mate_b, on_event)
+
+		if matched == target:
+			best = list(mate_a)
+			hi = mid - 1
+		else:
+			lo = mid + 1
+
+	if on_event:
+		t0 = report_phase(on_event, 'augmentation', t0)
+
+	M = []
+	for a, b in enumerate(best or []):
+		if b != -1:
+			u, v = A[a], B[b]
+			w = CG.get_weight(u, v, 0)
+			M.append(CG.pair(u, v, w) if in_left[u] else CG.pair(v, u, w))
+
+	if return_type == 'list':
+		return M
+	elif return_type == 'total':
+		return max([e[1] for e in M] or [0])
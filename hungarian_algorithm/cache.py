@@ -0,0 +1,209 @@
+'''
+    File name: cache.py
+    Description: LRU cache of find_matching results keyed by a canonical
+                 graph fingerprint.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from collections import OrderedDict
+import hashlib
+import os
+import pickle
+
+from .algorithm import find_matching
+from .compact import CompactGraph
+
+def vertex_token(key):
+	'''Type-qualified repr of a vertex key (so 1 and '1' differ).'''
+	return '%s:%r' % (type(key).__name__, key)
+
+def fingerprint(_G):
+	'''Canonical fingerprint of a weighted graph: the same for any
+	   ordering of vertices or neighbors that keeps each edge's direction
+	   (the last one given) and each vertex's side, since find_matching
+	   reports pairs in those directions. Unweighted graphs (sets of
+	   neighbors) differ from the same edges weighted 1.
+
+	Parameters
+	----------
+	_G : dict, required (valid Graph dict, or a CompactGraph)
+
+	Return
+	----------
+	str (hex digest)
+	'''
+	CG = _G if isinstance(_G, CompactGraph) else CompactGraph(_G)
+	in_left = CG.bipartition()
+	vertices = set()
+	edges = {}
+
+	for v in range(len(CG)):
+		side = '' if in_left is None else ('<' if in_left[v] else '>')
+		vertices.add(vertex_token(CG.keys[v]) + side)
+
+	if isinstance(_G, CompactGraph):
+		for v1, v2, weight in CG.oriented_edges():
+			edges[v1, v2] = (vertex_token(CG.keys[v1]), vertex_token(CG.keys[v2]), vertex_token(weight))
+	else:
+		for v1 in _G:
+			for v2 in _G[v1]:
+				weight = _G[v1][v2] if type(_G[v1]) is dict else 1
+				# Last direction and weight given for a pair win, as in Graph
+				pair = frozenset((v1, v2))
+				edges[pair] = (vertex_token(v1), vertex_token(v2), vertex_token(weight))
+
+	h = hashlib.sha256()
+	# Sets of neighbors solve differently from weights of 1 (every 'min'
+	# pair weighs 1 rather than 0)
+	h.update(b'unweighted\1' if CG.unweighted else b'weighted\1')
+	for v in sorted(vertices):
+		h.update(v.encode() + b'\0')
+	h.update(b'\1')
+	for e in sorted('\0'.join(e) for e in edges.values()):
+		h.update(e.encode() + b'\1')
+
+	return h.hexdigest()
+
+def option_token(value):
+	'''Hashable, repr-stable form of a find_matching option (vertex
+	   collections such as left and right become sorted tuples).'''
+	if isinstance(value, (list, tuple, set, frozenset)):
+		return tuple(sorted(vertex_token(v) for v in value))
+
+	return value
+
+class MatchingCache:
+
+	def __init__(self, maxsize = 1024, maxbytes = None, path = None):
+		'''Opt-in cache of find_matching results with LRU eviction.
+
+		Parameters
+		----------
+		maxsize : int, optional (default = 1024) (entries kept in memory,
+												  None for no limit)
+		maxbytes : int, optional (default = None) (pickled bytes kept in
+												   memory, None for no
+												   limit)
+		path : str, optional (default = None) (directory also storing
+											   every result on disk)
+		'''
+		self.maxsize = maxsize
+		self.maxbytes = maxbytes
+		self.path = path
+		self.entries = OrderedDict()
+		self.nbytes = 0
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+		if path is not None:
+			os.makedirs(path, exist_ok = True)
+
+	def key(self, _G, matching_type, return_type, options):
+		'''Cache key: graph fingerprint, matching_type, return_type and
+		   any other options that change the result.'''
+		return (fingerprint(_G), matching_type, return_type,
+				tuple(sorted((k, option_token(v)) for k, v in options.items())))
+
+	def disk_path(self, key):
+		return os.path.join(self.path, hashlib.sha256(repr(key).encode()).hexdigest() + '.pickle')
+
+	def get(self, key):
+		'''Cached result for key (None if absent), refreshing its LRU position.'''
+		if key in self.entries:
+			self.entries.move_to_end(key)
+			return self.entries[key][0]
+
+		if self.path is not None:
+			try:
+				with open(self.disk_path(key), 'rb') as f:
+					value = pickle.load(f)
+			except (OSError, EOFError, pickle.UnpicklingError):
+				return None
+			self.put(key, value, disk = False)
+			return value
+
+		return None
+
+	def put(self, key, value, disk = True):
+		'''Store a result, evicting least recently used entries past the
+		   limits.'''
+		data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+		if key in self.entries:
+			self.nbytes = self.nbytes - self.entries.pop(key)[1]
+
+		if self.maxbytes is None or len(data) <= self.maxbytes:
+			self.entries[key] = (value, len(data))
+			self.nbytes = self.nbytes + len(data)
+
+		while ((self.maxsize is not None and len(self.entries) > self.maxsize)
+			   or (self.maxbytes is not None and self.nbytes > self.maxbytes)):
+			self.nbytes = self.nbytes - self.entries.popitem(last = False)[1][1]
+			self.evictions = self.evictions + 1
+
+		if disk and self.path is not None:
+			tmp = self.disk_path(key) + '.%d.tmp' % os.getpid()
+			with open(tmp, 'wb') as f:
+				f.write(data)
+			os.replace(tmp, self.disk_path(key))
+
+	def find_matching(self, _G, matching_type = 'max', return_type = 'list', **kwargs):
+		'''find_matching, answered from the cache when the same graph (up to
+		   ordering) was solved before with the same options.
+
+		Parameters
+		----------
+		_G : dict, required (valid Graph dict, or a CompactGraph)
+		matching_type : str, optional (default = 'max')
+		return_type : str, optional (default = 'list')
+		kwargs : optional (passed to find_matching)
+
+		Return
+		----------
+		as find_matching
+		'''
+		options = dict((k, v) for k, v in kwargs.items() if k not in ('on_event', 'workers'))
+		key = self.key(_G, matching_type, return_type, options)
+		value = self.get(key)
+
+		if value is not None:
+			self.hits = self.hits + 1
+		else:
+			self.misses = self.misses + 1
+			value = find_matching(_G, matching_type, return_type, **kwargs)
+			self.put(key, value)
+
+		return list(value) if type(value) is list else value
+
+	def info(self):
+		'''Counters and sizes.
+
+		Return
+		----------
+		dict
+		'''
+		return {
+			'hits': self.hits,
+			'misses': self.misses,
+			'evictions': self.evictions,
+			'entries': len(self.entries),
+			'bytes': self.nbytes
+		}
+
+	def clear(self):
+		'''Drop every entry (memory and disk) and reset the counters.'''
+		self.entries.clear()
+		self.nbytes = 0
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+		if self.path is not None:
+			for name in os.listdir(self.path):
+				if name.endswith('.pickle'):
+					os.remove(os.path.join(self.path, name))
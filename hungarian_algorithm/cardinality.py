@@ -0,0 +1,187 @@
+'''
+    File name: cardinality.py
+    Description: Maximum-cardinality bipartite matching (Hopcroft-Karp).
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+import time
+
+from .compact import CompactGraph
+from .events import report_phase
+
+def hopcroft_karp(adj, n_b, mate_a = None, mate_b = None, on_event = None):
+	'''Maximum-cardinality matching by Hopcroft-Karp: each phase finds a
+	   maximal set of vertex-disjoint shortest augmenting paths.
+	   O(m * sqrt(n)).
+
+	Parameters
+	----------
+	adj : [[int]], required (B neighbors of each A vertex)
+	n_b : int, required (number of B vertices)
+	mate_a : [int], optional (default = None) (initial matching: B vertex
+											   of each A vertex or -1,
+											   updated in place)
+	mate_b : [int], optional (default = None) (A vertex of each B vertex
+											   or -1, updated in place)
+	on_event : callable, optional (default = None) (as find_matching)
+
+	Return
+	----------
+	int (number of matched A vertices)
+	'''
+	n_a = len(adj)
+	if mate_a is None:
+		mate_a = [-1] * n_a
+		mate_b = [-1] * n_b
+	INF = float('inf')
+
+	while True:
+		# Layer the A vertices by distance from the free ones, up to the
+		# first layer that reaches a free B vertex
+		dist = [INF] * n_a
+		queue = [a for a in range(n_a) if mate_a[a] == -1]
+		for a in queue:
+			dist[a] = 0
+
+		limit = INF
+		for a in queue:
+			if dist[a] >= limit:
+				break
+			for b in adj[a]:
+				a2 = mate_b[b]
+				if a2 == -1:
+					limit = dist[a] + 1
+				elif dist[a2] == INF:
+					dist[a2] = dist[a] + 1
+					queue.append(a2)
+
+		if limit == INF:
+			break
+
+		# Vertex-disjoint augmenting paths along the layers
+		pos = [0] * n_a
+		for root in range(n_a):
+			if mate_a[root] != -1 or dist[root] != 0:
+				continue
+
+			stack = [root]
+			via = []
+			while stack:
+				a = stack[-1]
+				edges = adj[a]
+				while pos[a] < len(edges):
+					b = edges[pos[a]]
+					pos[a] = pos[a] + 1
+					a2 = mate_b[b]
+					if a2 == -1:
+						if dist[a] + 1 == limit:
+							break
+					elif dist[a2] == dist[a] + 1:
+						break
+				else:
+					# Dead end
+					dist[a] = INF
+					stack.pop()
+					if via:
+						via.pop()
+					continue
+
+				via.append(b)
+				if a2 == -1:
+					# Augment along the stack
+					for a, b in zip(stack, via):
+						mate_a[a] = b
+						mate_b[b] = a
+						dist[a] = INF
+					if on_event:
+						on_event('augmentation', 2 * len(via) - 1)
+					break
+				stack.append(a2)
+
+	return sum(1 for b in mate_a if b != -1)
+
+def is_unweighted(_G):
+	'''Whether every vertex of _G lists its neighbors as a set.'''
+	if isinstance(_G, CompactGraph):
+		return _G.unweighted
+	return all(type(_G[v]) is not dict for v in _G)
+
+def solve_unweighted(_G, return_type = 'list', missing = 'zero', on_event = None,
+					 left = None, right = None):
+	'''Find maximum-weighted matching of an unweighted graph (every edge
+	   weighs 1) as a maximum-cardinality matching of the given edges, by
+	   Hopcroft-Karp on the sparse adjacency. O(m * sqrt(n)). With
+	   missing = 'zero' the vertices left over on the smaller side are
+	   paired with leftover vertices of the other side at weight 0, as the
+	   dense solver would.
+
+	Parameters
+	----------
+	_G : dict, required (valid Graph dict of sets, or a CompactGraph)
+	return_type : str, optional (default = 'list') ('list' or 'total')
+	missing : str, optional (default = 'zero') (as solve_sparse)
+	on_event : callable, optional (default = None) (as find_matching)
+	left : iterable, optional (default = None) (as find_matching)
+	right : iterable, optional (default = None) (as find_matching)
+
+	Return
+	----------
+	[(str, int)] / int (as find_matching)
+		or
+	False (not bipartite)
+	'''
+	if missing not in ('zero', 'forbidden'):
+		raise ValueError("missing must be 'zero' or 'forbidden'")
+
+	if on_event:
+		t = time.perf_counter()
+
+	CG = _G if isinstance(_G, CompactGraph) else CompactGraph(_G)
+	keys = CG.keys
+	if on_event:
+		t = report_phase(on_event, 'construction', t)
+
+	in_left = CG.bipartition(left, right)
+	if on_event:
+		t = report_phase(on_event, 'labeling', t)
+
+	if in_left is None:
+		return False
+
+	left = [v for v in range(len(keys)) if in_left[v]]
+	right = [v for v in range(len(keys)) if not in_left[v]]
+
+	A, B = (left, right) if len(left) <= len(right) else (right, left)
+	b_index = {v: i for i, v in enumerate(B)}
+	adj = [[b_index[w] for w, weight in CG.edges(v)] for v in A]
+
+	mate_a = [-1] * len(A)
+	mate_b = [-1] * len(B)
+	hopcroft_karp(adj, len(B), mate_a, mate_b, on_event)
+
+	if on_event:
+		t = report_phase(on_event, 'augmentation', t)
+
+	pairs = [(a, b, 1) for a, b in enumerate(mate_a) if b != -1]
+	if missing == 'zero':
+		# A maximum matching leaves no edge between free vertices
+		free_b = [b for b in range(len(B)) if mate_b[b] == -1]
+		free_a = [a for a in range(len(A)) if mate_a[a] == -1]
+		pairs.extend((a, b, 0) for a, b in zip(free_a, free_b))
+
+	M = []
+	for a, b, w in pairs:
+		u, v = A[a], B[b]
+		M.append(CG.pair(u, v, w) if in_left[u] else CG.pair(v, u, w))
+
+	if return_type == 'list':
+		return M
+	elif return_type == 'total':
+		total = 0
+		for e in M:
+			total = total + e[1]
+		return total
@@ -0,0 +1,320 @@
+'''
+    File name: compact.py
+    Description: Integer-indexed CSR graph representation.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from array import array
+from bisect import bisect_left
+
+def weight_array(weights):
+	'''Typed buffer for edge weights: 64-bit ints if every weight is an
+	   int that fits, doubles otherwise.'''
+	try:
+		return array('q', weights)
+	except (TypeError, OverflowError):
+		return array('d', weights)
+
+class CompactGraph:
+
+	def __init__(self, G = {}):
+		'''Compact graph constructor. Vertex keys are mapped to dense
+		   integer ids (in order of first appearance) and the adjacency
+		   is stored once, as CSR arrays over both edge directions:
+		   the neighbors of id v are targets[offsets[v]:offsets[v + 1]]
+		   (sorted), with matching weights.
+
+		Parameters
+		----------
+		G : dict, optional (default = empty graph)
+				key : vertex key
+				value : set of neighboring vertices (unweighted graph)
+						or
+						dict (weighted graph)
+							key : neighboring vertex key
+							value : edge weight
+		'''
+		self.keys = []
+		self.ids = {}
+		self.unweighted = True
+		sources = array('q')
+		targets = array('q')
+		weights = []
+
+		for v1 in G:
+			i = self.add_key(v1)
+			weighted = type(G[v1]) is dict
+			self.unweighted = self.unweighted and not weighted
+			for v2 in G[v1]:
+				sources.append(i)
+				targets.append(self.add_key(v2))
+				weights.append(G[v1][v2] if weighted else 1)
+
+		self.build(sources, targets, weight_array(weights))
+
+	@classmethod
+	def from_edges(cls, keys, sources, targets, weights, unweighted = False,
+				   duplicates = 'last'):
+		'''Build from an edge list over integer ids.
+
+		Parameters
+		----------
+		keys : [str], required (vertex key of each id)
+		sources : array, required (endpoint1 ids)
+		targets : array, required (endpoint2 ids)
+		weights : array, required (edge weights)
+		unweighted : bool, optional (default = False)
+		duplicates : str, optional (default = 'last') (as build)
+
+		Return
+		----------
+		CompactGraph
+		'''
+		CG = cls()
+		CG.keys = list(keys)
+		CG.ids = dict((key, i) for i, key in enumerate(CG.keys))
+		CG.unweighted = unweighted
+		CG.build(sources, targets, weights, duplicates)
+		return CG
+
+	def add_key(self, key):
+		'''Vertex id for key (assigned on first use).'''
+		i = self.ids.get(key)
+
+		if i is None:
+			i = self.ids[key] = len(self.keys)
+			self.keys.append(key)
+
+		return i
+
+	def build(self, sources, targets, weights, duplicates = 'last'):
+		'''Fill the CSR arrays from an edge list. Both directions are
+		   stored once per pair.
+
+		Parameters
+		----------
+		sources : array, required (endpoint1 ids)
+		targets : array, required (endpoint2 ids)
+		weights : array, required (edge weights)
+		duplicates : str, optional (default = 'last') (weight kept for a
+													   repeated pair: 'last',
+													   'max' or 'min')
+		'''
+		if duplicates not in ('last', 'max', 'min'):
+			raise ValueError("duplicates must be 'last', 'max' or 'min'")
+
+		n = len(self.keys)
+		m = len(sources)
+		# 32-bit vertex ids unless the graph is too large for them
+		id_code = 'i' if n < 2 ** 31 else 'q'
+
+		# Counting sort of both directions by source id
+		offsets = array('q', bytes(8 * (n + 1)))
+		for i in range(m):
+			offsets[sources[i] + 1] += 1
+			offsets[targets[i] + 1] += 1
+		for v in range(n):
+			offsets[v + 1] += offsets[v]
+
+		fill = array('q', offsets)
+		adj_targets = array(id_code, bytes(array(id_code).itemsize * 2 * m))
+		adj_weights = array(weights.typecode, bytes(weights.itemsize * 2 * m))
+		adj_forward = array('b', bytes(2 * m))
+		for i in range(m):
+			for u, v, forward in ((sources[i], targets[i], 1), (targets[i], sources[i], 0)):
+				adj_targets[fill[u]] = v
+				adj_weights[fill[u]] = weights[i]
+				adj_forward[fill[u]] = forward
+				fill[u] += 1
+
+		# Sort each row by neighbor id (stable, so repeats stay in input
+		# order) and merge repeated pairs. forward[k] is 1 if the pair was
+		# last given in the direction of row -> targets[k]
+		self.offsets = array('q', [0])
+		self.targets = array(id_code)
+		self.weights = array(weights.typecode)
+		self.forward = array('b')
+
+		for v in range(n):
+			row = sorted(range(offsets[v], offsets[v + 1]), key = adj_targets.__getitem__)
+			for k, j in enumerate(row):
+				w = adj_weights[j]
+				if k > 0 and adj_targets[row[k - 1]] == adj_targets[j]:
+					if duplicates == 'last' or (w > self.weights[-1]) == (duplicates == 'max'):
+						self.weights[-1] = w
+					self.forward[-1] = adj_forward[j]
+					continue
+				self.targets.append(adj_targets[j])
+				self.weights.append(w)
+				self.forward.append(adj_forward[j])
+			self.offsets.append(len(self.targets))
+
+	def __len__(self):
+		'''Number of vertices.'''
+		return len(self.keys)
+
+	def num_edges(self):
+		'''Number of (undirected) edges.'''
+		return len(self.targets) // 2
+
+	def nbytes(self):
+		'''Bytes held by the CSR arrays.'''
+		return sum(a.itemsize * len(a) for a in (self.offsets, self.targets, self.weights, self.forward))
+
+	def degree(self, v):
+		'''Number of neighbors of id v.'''
+		return self.offsets[v + 1] - self.offsets[v]
+
+	def neighbors(self, v):
+		'''Neighbor ids of id v (sorted).'''
+		return self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+	def edges(self, v):
+		'''(neighbor id, weight) pairs of id v.'''
+		start, end = self.offsets[v], self.offsets[v + 1]
+		return zip(self.targets[start:end], self.weights[start:end])
+
+	def oriented_edges(self):
+		'''Each edge once, in the direction it was given.
+
+		Return
+		----------
+		iterator of (int, int, int) (endpoint1 id, endpoint2 id, weight)
+		'''
+		for v in range(len(self.keys)):
+			for k in range(self.offsets[v], self.offsets[v + 1]):
+				if self.forward[k]:
+					yield v, self.targets[k], self.weights[k]
+
+	def with_weights(self, weights):
+		'''Copy sharing the vertices and adjacency, with new weights.
+
+		Parameters
+		----------
+		weights : array, required (weight of each entry of targets)
+
+		Return
+		----------
+		CompactGraph
+		'''
+		CG = CompactGraph()
+		CG.keys, CG.ids, CG.unweighted = self.keys, self.ids, self.unweighted
+		CG.offsets, CG.targets, CG.forward = self.offsets, self.targets, self.forward
+		CG.weights = weights
+		return CG
+
+	def get_weight(self, v1, v2, default = None):
+		'''Weight of edge between ids v1 and v2. O(log degree).
+
+		Return
+		----------
+		int (or default if the edge doesn't exist)
+		'''
+		start, end = self.offsets[v1], self.offsets[v1 + 1]
+		i = bisect_left(self.targets, v2, start, end)
+
+		if i < end and self.targets[i] == v2:
+			return self.weights[i]
+
+		return default
+
+	def pair(self, v1, v2, weight):
+		'''Matched pair of left id v1 and right id v2 as reported by
+		   find_matching: in the direction their edge was given, left first
+		   if there is no edge (as Graph.make_complete_bipartite adds it).
+
+		Return
+		----------
+		((str, str), int) ((endpoint1 key, endpoint2 key), weight)
+		'''
+		start, end = self.offsets[v1], self.offsets[v1 + 1]
+		i = bisect_left(self.targets, v2, start, end)
+
+		if i < end and self.targets[i] == v2 and not self.forward[i]:
+			return (self.keys[v2], self.keys[v1]), weight
+
+		return (self.keys[v1], self.keys[v2]), weight
+
+	def bipartition(self, left = None, right = None):
+		'''Two-color every component, starting each component's search from
+		   its lowest id (which goes on the left). Given left and/or right,
+		   the sides are taken as they are without any traversal.
+
+		Parameters
+		----------
+		left : iterable, optional (default = None) (left vertex keys)
+		right : iterable, optional (default = None) (right vertex keys,
+													 the rest if only left
+													 is given)
+
+		Return
+		----------
+		[bool] (in_left by id, or None if not bipartite)
+		'''
+		if left is not None or right is not None:
+			left = set(left) if left is not None else set(self.keys) - set(right)
+			right = set(right) if right is not None else set(self.keys) - left
+			for v in self.keys:
+				if (v in left) == (v in right):
+					raise ValueError('vertex %r must be in exactly one of left and right' % (v,))
+			return [v in left for v in self.keys]
+
+		in_left = [None] * len(self.keys)
+
+		for start in range(len(self.keys)):
+			if in_left[start] is not None:
+				continue
+
+			in_left[start] = True
+			queue = [start]
+
+			while queue:
+				v = queue.pop()
+
+				for w in self.neighbors(v):
+					if in_left[w] is None:
+						in_left[w] = not in_left[v]
+						queue.append(w)
+					elif in_left[w] == in_left[v]:
+						return None
+
+		return in_left
+
+	def components(self):
+		'''Label the connected components, numbered in order of their
+		   lowest id.
+
+		Return
+		----------
+		([int], int) (component of each id, number of components)
+		'''
+		component = [-1] * len(self.keys)
+		count = 0
+
+		for start in range(len(self.keys)):
+			if component[start] != -1:
+				continue
+
+			component[start] = count
+			queue = [start]
+
+			while queue:
+				v = queue.pop()
+
+				for w in self.neighbors(v):
+					if component[w] == -1:
+						component[w] = count
+						queue.append(w)
+
+			count = count + 1
+
+		return component, count
+
+	def to_dict(self):
+		'''Graph dict (both directions) with the original keys.'''
+		return dict((self.keys[v], dict((self.keys[w], weight) for w, weight in self.edges(v)))
+					for v in range(len(self.keys)))
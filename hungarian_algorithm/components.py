@@ -0,0 +1,174 @@
+'''
+    File name: components.py
+    Description: Solve each connected component separately and merge
+                 the matchings.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import time
+
+from .compact import CompactGraph
+from .events import report_phase
+from .sparse import private_partner_cost, shortest_augmenting_paths, solve_sparse
+
+def solve_component(task):
+	'''Worker entry point: task = (costs, n_b, dummy_cost), as
+	   shortest_augmenting_paths.'''
+	return shortest_augmenting_paths(*task)
+
+def fill_unpaired(CG, unpaired, free, component):
+	'''Pair A vertices left to their private partner with free B
+	   vertices at weight 0: from another component (never adjacent)
+	   if possible, else a non-adjacent one from their own.
+
+	Parameters
+	----------
+	CG : CompactGraph, required
+	unpaired : [int], required (A vertex ids)
+	free : [int], required (free B vertex ids)
+	component : [int], required (component of each id)
+
+	Return
+	----------
+	[(int, int, int)] (A vertex id, B vertex id, weight)
+		or
+	None (not enough free B vertices to pair with)
+	'''
+	by_component = {}
+	for b in free:
+		by_component.setdefault(component[b], []).append(b)
+
+	pairs = []
+
+	for a in unpaired:
+		# Take from the other component with the most free vertices left
+		c = max((c for c in by_component if c != component[a] and by_component[c]),
+				key = lambda c: len(by_component[c]), default = None)
+
+		if c is not None:
+			pairs.append((a, by_component[c].pop(), 0))
+			continue
+
+		own = by_component.get(component[a], [])
+		for i in range(len(own)):
+			w = CG.get_weight(a, own[i], 0)
+			if w == 0:
+				pairs.append((a, own[i], w))
+				own[i] = own[-1]
+				own.pop()
+				break
+		else:
+			return None
+
+	return pairs
+
+def solve_components(_G, matching_type = 'max', return_type = 'list', missing = 'zero',
+					 workers = 1, on_event = None, left = None, right = None):
+	'''Find maximum/minimum-weighted matching by solving every connected
+	   component on its own. Vertices of the smaller side that are best
+	   left unmatched in their component are paired across components,
+	   where every pair has weight 0.
+
+	Parameters
+	----------
+	_G : dict, required (valid Graph dict, or a CompactGraph)
+	matching_type : str, optional (default = 'max')
+	return_type : str, optional (default = 'list')
+	missing : str, optional (default = 'zero') (as solve_sparse)
+	workers : int, optional (default = 1) (processes solving components,
+										   None for one per CPU)
+	on_event : callable, optional (default = None) (as find_matching;
+													augmentation events
+													only when workers = 1)
+	left : iterable, optional (default = None) (as find_matching)
+	right : iterable, optional (default = None) (as find_matching)
+
+	Return
+	----------
+	[(str, int)] / int (as find_matching)
+		or
+	False (not bipartite)
+	'''
+	if missing not in ('zero', 'forbidden'):
+		raise ValueError("missing must be 'zero' or 'forbidden'")
+
+	if on_event:
+		t = time.perf_counter()
+
+	CG = _G if isinstance(_G, CompactGraph) else CompactGraph(_G)
+	keys = CG.keys
+	if on_event:
+		t = report_phase(on_event, 'construction', t)
+
+	in_left = CG.bipartition(left, right)
+	if in_left is None:
+		return False
+
+	component, count = CG.components()
+	if on_event:
+		t = report_phase(on_event, 'labeling', t)
+
+	# Every vertex of the smaller side A is matched
+	a_side = sum(in_left) <= len(keys) - sum(in_left)
+	A = [[] for c in range(count)]
+	B = [[] for c in range(count)]
+	for v in range(len(keys)):
+		(A if in_left[v] == a_side else B)[component[v]].append(v)
+
+	sign = 1 if matching_type == 'min' else -1
+	tasks = []
+	for c in range(count):
+		b_index = {v: i for i, v in enumerate(B[c])}
+		costs = [[(b_index[w], sign * weight) for w, weight in CG.edges(v)] for v in A[c]]
+		tasks.append((costs, len(B[c]), private_partner_cost(costs, missing)))
+
+	workers = workers or os.cpu_count() or 1
+
+	if workers > 1 and count > 1:
+		with ProcessPoolExecutor(workers) as executor:
+			chunksize = max(1, count // (4 * workers))
+			mates = list(executor.map(solve_component, tasks, chunksize = chunksize))
+	else:
+		mates = [shortest_augmenting_paths(*task, on_event) for task in tasks]
+
+	pairs = []
+	unpaired = []
+	matched = [False] * len(keys)
+
+	for c, mate in enumerate(mates):
+		for i, b in enumerate(mate):
+			if b == -1:
+				continue
+			if b >= len(B[c]):
+				if missing == 'zero':
+					unpaired.append(A[c][i])
+			else:
+				matched[B[c][b]] = True
+				pairs.append((A[c][i], B[c][b], CG.get_weight(A[c][i], B[c][b], 0)))
+
+	if unpaired:
+		free = [v for c in range(count) for v in B[c] if not matched[v]]
+		filled = fill_unpaired(CG, unpaired, free, component)
+		if filled is None:
+			# Too few pairs of weight 0: solve as one problem
+			return solve_sparse(CG, matching_type, return_type, missing, on_event, left, right)
+		pairs = pairs + filled
+
+	if on_event:
+		t = report_phase(on_event, 'augmentation', t)
+
+	M = [CG.pair(u, v, w) if in_left[u] else CG.pair(v, u, w) for u, v, w in pairs]
+
+	if return_type == 'list':
+		return M
+	elif return_type == 'total':
+		total = 0
+		for e in M:
+			total = total + e[1]
+		return total
@@ -0,0 +1,63 @@
+'''
+    File name: events.py
+    Description: Phase timing and event collection for the solvers.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+import time
+
+def report_phase(on_event, name, start):
+	'''Send a phase timing event and restart the clock.
+
+	Parameters
+	----------
+	on_event : callable, required
+	name : str, required (phase name)
+	start : float, required (time.perf_counter() at phase start)
+
+	Return
+	----------
+	float (time.perf_counter() now)
+	'''
+	now = time.perf_counter()
+	on_event('phase', (name, now - start))
+	return now
+
+class MatchingStats:
+
+	def __init__(self):
+		'''Collector for find_matching events (pass as on_event).
+
+		phases : dict (phase name : seconds)
+		counts : dict (event name : number of events)
+		alphas : [int] (label change of each dual update)
+		'''
+		self.phases = {}
+		self.counts = {}
+		self.alphas = []
+
+	def __call__(self, event, value):
+		'''Record one event.
+
+		Parameters
+		----------
+		event : str, required
+		value : required (event data)
+		'''
+		if event == 'phase':
+			name, seconds = value
+			self.phases[name] = self.phases.get(name, 0) + seconds
+		else:
+			self.counts[event] = self.counts.get(event, 0) + 1
+			if event == 'dual_update':
+				self.alphas.append(value)
+
+	def as_dict(self):
+		'''JSON-serializable summary.'''
+		return {'phases': dict(self.phases),
+				'counts': dict(self.counts),
+				'alphas': list(self.alphas)}
@@ -0,0 +1,262 @@
+'''
+    File name: flow.py
+    Description: Capacitated (many-to-one) assignment as a min-cost flow,
+                 solved by successive shortest paths with potentials.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+import heapq
+import time
+
+from .compact import CompactGraph
+from .events import report_phase
+
+class FlowNetwork:
+
+	def __init__(self, n_a, n_b, edges, cap_a, cap_b):
+		'''Residual network source -> A -> B -> sink. Source and sink arcs
+		   carry the vertex capacities, every edge carries one unit.
+
+		Parameters
+		----------
+		n_a : int, required (number of A vertices, numbered 0..n_a-1)
+		n_b : int, required (number of B vertices, numbered n_a..n_a+n_b-1)
+		edges : [(int, int, int)], required ((A vertex, B vertex, cost))
+		cap_a : [int], required (capacity of each A vertex)
+		cap_b : [int], required (capacity of each B vertex)
+		'''
+		self.n_a = n_a
+		self.n = n_a + n_b
+		self.source = self.n
+		self.sink = self.n + 1
+
+		self.head = [a for a, b, c in edges]
+		self.tail = [b for a, b, c in edges]
+		self.cost = [c for a, b, c in edges]
+		self.flow = [0] * len(edges)
+
+		# Edge ids leaving each A vertex / entering each B vertex
+		self.incident = [[] for _ in range(self.n)]
+		for e, (a, b, c) in enumerate(edges):
+			self.incident[a].append(e)
+			self.incident[b].append(e)
+
+		# Residual capacity of the source / sink arc of each vertex
+		self.residual = list(cap_a) + list(cap_b)
+
+		# Potentials: reduced cost c(u, v) + y[u] - y[v] >= 0 on every
+		# residual arc. Arcs into the sink and out of A start at 0, so
+		# only B needs the most negative cost into it.
+		self.y = [0] * (self.n + 2)
+		for e in range(len(edges)):
+			b = self.tail[e]
+			self.y[b] = min(self.y[b], self.cost[e])
+		self.y[self.sink] = min(self.y[self.n_a:self.n] or [0])
+
+	def arcs(self, v):
+		'''Residual arcs leaving v.
+
+		Return
+		----------
+		generator of (int, int/float, int) (head vertex, cost, edge id or -1)
+		'''
+		if v == self.source:
+			for a in range(self.n_a):
+				if self.residual[a] > 0:
+					yield a, 0, -1
+		elif v < self.n_a:
+			for e in self.incident[v]:
+				if not self.flow[e]:
+					yield self.tail[e], self.cost[e], e
+		else:
+			for e in self.incident[v]:
+				if self.flow[e]:
+					yield self.head[e], -self.cost[e], e
+			if self.residual[v] > 0:
+				yield self.sink, 0, -1
+
+	def shortest_paths(self):
+		'''Dijkstra from the source over reduced costs, then move the
+		   potentials so that every shortest path has reduced cost 0.
+
+		Return
+		----------
+		dict (predecessor arc of each reached vertex: (vertex, edge id))
+			or
+		None (the sink can't be reached)
+		'''
+		y = self.y
+		INF = float('inf')
+		dist = {self.source: 0}
+		pred = {}
+		final = set()
+		heap = [(0, self.source)]
+
+		while heap:
+			d, u = heapq.heappop(heap)
+			if u in final or d != dist[u]:
+				continue
+			final.add(u)
+			if u == self.sink:
+				break
+			for v, c, e in self.arcs(u):
+				if v not in final:
+					new_dist = d + c + y[u] - y[v]
+					if new_dist < dist.get(v, INF):
+						dist[v] = new_dist
+						pred[v] = (u, e)
+						heapq.heappush(heap, (new_dist, v))
+
+		if self.sink not in final:
+			return None
+
+		D = dist[self.sink]
+		for v in range(self.n + 2):
+			y[v] += min(dist.get(v, D), D) if v in final else D
+
+		return pred
+
+	def push(self, path):
+		'''Send one unit along a source-sink path of (vertex, edge id) arcs.'''
+		for v, e in path:
+			if e == -1:
+				# Source or sink arc
+				self.residual[v if v != self.sink else path[-2][0]] -= 1
+			else:
+				self.flow[e] = 1 - self.flow[e]
+
+	def augment(self, pred):
+		'''Send one unit along the Dijkstra path, then along every other
+		   path of reduced cost 0 that a depth-first search finds.
+
+		Return
+		----------
+		[int] (number of edges of each augmenting path)
+		'''
+		y = self.y
+
+		path = []
+		v = self.sink
+		while v != self.source:
+			u, e = pred[v]
+			path.append((v, e))
+			v = u
+		path.reverse()
+		self.push(path)
+		lengths = [len(path) - 2]
+
+		# Arcs of reduced cost 0, each vertex's arcs tried at most once
+		dead = set()
+		while True:
+			stack = [(self.source, self.arcs(self.source))]
+			path = []
+			on_path = {self.source}
+
+			while stack:
+				u, arcs = stack[-1]
+				for v, c, e in arcs:
+					if v not in dead and v not in on_path and c + y[u] - y[v] <= 0:
+						path.append((v, e))
+						if v == self.sink:
+							stack = []
+						else:
+							on_path.add(v)
+							stack.append((v, self.arcs(v)))
+						break
+				else:
+					stack.pop()
+					dead.add(u)
+					if path:
+						on_path.discard(path.pop()[0])
+
+			if not path or path[-1][0] != self.sink:
+				break
+
+			self.push(path)
+			lengths.append(len(path) - 2)
+
+		return lengths
+
+def find_capacitated_matching(_G, capacities = None, matching_type = 'max', return_type = 'list',
+							  on_event = None):
+	'''Find maximum/minimum-weighted many-to-one assignment: each vertex v
+	   is matched to at most capacities[v] others, each given edge is used
+	   at most once. As many edges as possible are used, and the best total
+	   weight among those.
+
+	Parameters
+	----------
+	_G : dict, required (valid Graph dict, or a CompactGraph)
+	capacities : dict, optional (default = None) (vertex : capacity,
+												  1 for vertices not
+												  listed)
+	matching_type : str, optional (default = 'max') ('max' or 'min')
+	return_type : str, optional (default = 'list') ('list' or 'total')
+	on_event : callable, optional (default = None) (as find_matching)
+
+	Return
+	----------
+	[(str, int)] / int (as find_matching, a vertex appearing in up to
+						capacity edges)
+		or
+	False (not bipartite)
+	'''
+	capacities = capacities or {}
+	for v, c in capacities.items():
+		if c < 0:
+			raise ValueError('capacity of %r is negative' % (v,))
+
+	if on_event:
+		t = time.perf_counter()
+
+	CG = _G if isinstance(_G, CompactGraph) else CompactGraph(_G)
+	keys = CG.keys
+	if on_event:
+		t = report_phase(on_event, 'construction', t)
+
+	in_left = CG.bipartition()
+	if on_event:
+		t = report_phase(on_event, 'labeling', t)
+
+	if in_left is None:
+		return False
+
+	A = [v for v in range(len(keys)) if in_left[v]]
+	B = [v for v in range(len(keys)) if not in_left[v]]
+	index = {}
+	for i, v in enumerate(A + B):
+		index[v] = i
+
+	sign = 1 if matching_type == 'min' else -1
+	edges = [(index[v], index[w], sign * weight) for v in A for w, weight in CG.edges(v)]
+	network = FlowNetwork(len(A), len(B), edges,
+						  [capacities.get(keys[v], 1) for v in A],
+						  [capacities.get(keys[v], 1) for v in B])
+
+	while True:
+		pred = network.shortest_paths()
+		if pred is None:
+			break
+		lengths = network.augment(pred)
+		if on_event:
+			on_event('dual_update', network.y[network.sink])
+			for length in lengths:
+				on_event('augmentation', length)
+
+	if on_event:
+		t = report_phase(on_event, 'augmentation', t)
+
+	M = [CG.pair(A[a], B[b - len(A)], sign * c)
+		 for a, b, c, f in zip(network.head, network.tail, network.cost, network.flow) if f]
+
+	if return_type == 'list':
+		return M
+	elif return_type == 'total':
+		total = 0
+		for e in M:
+			total = total + e[1]
+		return total
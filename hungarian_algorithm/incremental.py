@@ -0,0 +1,307 @@
+'''
+    File name: incremental.py
+    Description: Warm-started Hungarian Method that keeps labels and
+                 matching between updates.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from .compact import CompactGraph
+
+class Dummy:
+	'''Placeholder vertex keeping both sides the same size
+	   (weight 0 to every vertex on the other side).'''
+
+	__slots__ = ()
+
+	def __repr__(self):
+		return 'Dummy()'
+
+
+class IncrementalSolver:
+
+	def __init__(self, G = {}, matching_type = 'max'):
+		'''Solve G once and keep the labeling and matching for re-solves.
+
+		Parameters
+		----------
+		G : dict, optional (default = empty graph) (valid Graph dict)
+		matching_type : str, optional (default = 'max') ('max' or 'min')
+		'''
+		self.matching_type = matching_type
+		self.sign = 1 if matching_type == 'max' else -1
+		self.weights = {}
+		self.label = {}
+		self.mate = {}
+		self.left = {}
+		self.right = {}
+
+		CG = G if isinstance(G, CompactGraph) else CompactGraph(G)
+		in_left = CG.bipartition()
+
+		if in_left is None:
+			raise ValueError('graph is not bipartite')
+
+		for i, key in enumerate(CG.keys):
+			(self.left if in_left[i] else self.right)[key] = None
+			self.weights[key] = dict((CG.keys[j], self.sign * w)
+									 for j, w in CG.edges(i))
+
+		# Pad the smaller side so a perfect matching exists
+		while len(self.left) < len(self.right):
+			self.left[Dummy()] = None
+		while len(self.right) < len(self.left):
+			self.right[Dummy()] = None
+
+		# Initial feasible labeling
+		for y in self.right:
+			self.label[y] = 0
+		for x in self.left:
+			self.label[x] = self.max_slack_label(x)
+
+		for x in self.left:
+			self.augment(x)
+
+	def weight(self, u, v):
+		'''Internal (sign-adjusted) weight of pair u-v, 0 if absent.'''
+		return self.weights[u].get(v, 0) if u in self.weights else 0
+
+	def other_side(self, v):
+		'''Vertices on the opposite side of v.'''
+		return self.right if v in self.left else self.left
+
+	def max_slack_label(self, u):
+		'''Smallest feasible label for u given the other side's labels
+		   (tight with at least one vertex).'''
+		label = None
+
+		for v in self.other_side(u):
+			new_label = self.weight(u, v) - self.label[v]
+			label = new_label if label is None or new_label > label else label
+
+		return 0 if label is None else label
+
+	def augment(self, root):
+		'''Grow a Hungarian tree from a free vertex and augment the
+		   matching along the first tight path to a free vertex. O(n^2).
+
+		Parameters
+		----------
+		root : str, required (free vertex key)
+		'''
+		rows = [root]
+		parent = {}
+		slack = {}
+		slack_vertex = {}
+
+		for v in self.other_side(root):
+			slack[v] = self.label[root] + self.label[v] - self.weight(root, v)
+			slack_vertex[v] = root
+
+		while True:
+			alpha = None
+			for v in slack:
+				if alpha is None or slack[v] < alpha:
+					alpha = slack[v]
+					y = v
+
+			if alpha > 0:
+				# Update the labeling
+				for u in rows:
+					self.label[u] = self.label[u] - alpha
+				for v in parent:
+					self.label[v] = self.label[v] + alpha
+				for v in slack:
+					slack[v] = slack[v] - alpha
+
+			parent[y] = slack_vertex[y]
+			del slack[y]
+
+			if y not in self.mate:
+				break
+
+			# Add to augmenting tree
+			u = self.mate[y]
+			rows.append(u)
+			for v in slack:
+				new_slack = self.label[u] + self.label[v] - self.weight(u, v)
+				if new_slack < slack[v]:
+					slack[v] = new_slack
+					slack_vertex[v] = u
+
+		# Augment the matching
+		while y is not None:
+			u = parent[y]
+			next_y = self.mate.get(u)
+			self.mate[u] = y
+			self.mate[y] = u
+			y = next_y
+
+	def unmatch(self, u):
+		'''Remove u's matched edge (if any).
+
+		Return
+		----------
+		str (u's former mate, or None)
+		'''
+		v = self.mate.pop(u, None)
+
+		if v is not None:
+			del self.mate[v]
+
+		return v
+
+	def repair(self, u):
+		'''Unmatch u, relabel it feasibly and re-augment from it.'''
+		self.unmatch(u)
+		self.label[u] = self.max_slack_label(u)
+		self.augment(u)
+
+	def update_weight(self, v1, v2, weight):
+		'''Change the weight of edge v1-v2 (weight 0 removes it) and
+		   re-optimize. O(n^2) at most, O(1) if the matching stays optimal.
+
+		Parameters
+		----------
+		v1 : str, required (vertex key)
+		v2 : str, required (vertex key on the other side)
+		weight : int, required
+		'''
+		if v1 not in self.label or v2 not in self.other_side(v1):
+			raise KeyError('no pair %r-%r in graph' % (v1, v2))
+
+		old = self.weight(v1, v2)
+		new = self.sign * weight
+
+		if new == 0:
+			self.weights[v1].pop(v2, None)
+			self.weights[v2].pop(v1, None)
+		else:
+			self.weights[v1][v2] = new
+			self.weights[v2][v1] = new
+
+		if self.mate.get(v1) == v2:
+			if new >= old:
+				# Matched edge stays tight and everything stays feasible
+				self.label[v1] = self.label[v1] + new - old
+				return
+		elif new <= self.label[v1] + self.label[v2]:
+			# Labeling is still feasible
+			return
+
+		self.repair(v1)
+
+	def add_vertex(self, key, neighbors = {}, in_left = None):
+		'''Add a vertex with weighted edges and re-optimize. O(n^2).
+
+		Parameters
+		----------
+		key : str, required
+		neighbors : dict, optional (default = no edges)
+				key : neighboring vertex key
+				value : edge weight
+		in_left : bool, optional (default = opposite side of neighbors)
+		'''
+		if key in self.label:
+			raise KeyError('vertex %r already in graph' % (key,))
+
+		if in_left is None:
+			if not neighbors:
+				raise ValueError('in_left is required for a vertex without neighbors')
+			in_left = next(iter(neighbors)) in self.right
+
+		side, other = (self.left, self.right) if in_left else (self.right, self.left)
+
+		for v in neighbors:
+			if v not in other:
+				raise KeyError('no vertex %r on the other side' % (v,))
+
+		self.weights[key] = {}
+		for v, w in neighbors.items():
+			if w != 0:
+				self.weights[key][v] = self.sign * w
+				self.weights[v][key] = self.sign * w
+
+		dummy = next((d for d in side if isinstance(d, Dummy)), None)
+
+		if dummy is not None:
+			# Take the place of a dummy
+			self.unmatch(dummy)
+			del side[dummy]
+			del self.label[dummy]
+			side[key] = None
+			self.label[key] = self.max_slack_label(key)
+		else:
+			# Grow the other side with a dummy
+			side[key] = None
+			self.label[key] = self.max_slack_label(key)
+			dummy = Dummy()
+			self.label[dummy] = max(-self.label[u] for u in side)
+			other[dummy] = None
+
+		self.augment(key)
+
+	def remove_vertex(self, key):
+		'''Remove a vertex and re-optimize. O(n^2).
+
+		Parameters
+		----------
+		key : str, required (vertex key)
+		'''
+		if key not in self.label or isinstance(key, Dummy):
+			raise KeyError('no vertex %r in graph' % (key,))
+
+		side, other = (self.left, self.right) if key in self.left else (self.right, self.left)
+		dummy = next((d for d in other if isinstance(d, Dummy)), None)
+		mate = self.unmatch(key)
+
+		for v in self.weights.pop(key):
+			del self.weights[v][key]
+		del side[key]
+		del self.label[key]
+
+		if dummy is not None:
+			# Drop a dummy from the other side too
+			root = self.unmatch(dummy)
+			del other[dummy]
+			del self.label[dummy]
+			if dummy != mate:
+				self.augment(root)
+		else:
+			# Take key's place with a dummy
+			dummy = Dummy()
+			side[dummy] = None
+			self.label[dummy] = self.max_slack_label(dummy)
+			self.augment(dummy)
+
+	def get_matching(self, return_type = 'list'):
+		'''Current optimal matching.
+
+		Parameters
+		----------
+		return_type : str, optional (default = 'list') ('list' or 'total')
+
+		Return
+		----------
+		[(str, int)] (list of edges in matching described as:
+					  a tuple (('x', 'y'), weight))
+			or
+		int (total weight)
+		'''
+		M = []
+
+		for x in self.left:
+			y = self.mate.get(x)
+			if not isinstance(x, Dummy) and not isinstance(y, Dummy):
+				M.append(((x, y), self.sign * self.weight(x, y)))
+
+		if return_type == 'list':
+			return M
+		elif return_type == 'total':
+			total = 0
+			for e in M:
+				total = total + e[1]
+			return total
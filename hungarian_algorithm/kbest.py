@@ -0,0 +1,156 @@
+'''
+    File name: kbest.py
+    Description: k best matchings in order of weight (Murty's algorithm).
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+import heapq
+import itertools
+
+import numpy as np
+
+from .compact import CompactGraph
+from .matrix import augment_row
+
+class Subproblem:
+	'''Solved Murty subproblem: rows before fixed keep their columns,
+	   row fixed can't take the forbidden columns.'''
+
+	__slots__ = ('cost', 'u', 'v', 'row_of', 'col_of', 'fixed', 'forbidden')
+
+	def __init__(self, cost, u, v, row_of, col_of, fixed, forbidden):
+		self.cost = cost
+		self.u = u
+		self.v = v
+		self.row_of = row_of
+		self.col_of = col_of
+		self.fixed = fixed
+		self.forbidden = forbidden
+
+def solve_child(C, parent, i):
+	'''Re-solve parent with rows before i fixed and row i's column
+	   forbidden, warm-started from the parent's labels: one augmenting
+	   path from row i.
+
+	Return
+	----------
+	Subproblem (or None if infeasible)
+	'''
+	n = C.shape[1]
+	col = parent.col_of[i]
+	forbidden = (parent.forbidden if i == parent.fixed else []) + [col]
+	allowed = np.ones(n, dtype=bool)
+	allowed[parent.col_of[:i]] = False
+
+	u = parent.u.copy()
+	v = parent.v.copy()
+	row_of = parent.row_of.copy()
+	row_of[col] = -1
+
+	if not augment_row(C, i, u, v, row_of, allowed, {i: forbidden}):
+		return None
+
+	col_of = np.empty(n, dtype=np.intp)
+	col_of[row_of] = np.arange(n)
+
+	return Subproblem(C[np.arange(n), col_of].sum(), u, v, row_of, col_of, i, forbidden)
+
+def child_bounds(C, node, p):
+	'''Lower bounds on the cost of node's children (rows fixed to p - 1).
+	   A child's matching costs node.cost plus the reduced costs of its
+	   edges, which include a new edge in row i and one in column
+	   col_of[i].'''
+	n = C.shape[1]
+	rows = np.arange(node.fixed, p)
+	cols = node.col_of[rows]
+	R = C - node.u[:, None] - node.v[None, :]
+	R[np.arange(n), node.col_of] = np.inf
+	R[:node.fixed] = np.inf
+	R[:, node.col_of[:node.fixed]] = np.inf
+	R[node.fixed, node.forbidden] = np.inf
+
+	return node.cost + R[rows].min(axis = 1) + R[:, cols].min(axis = 0)
+
+def find_k_best_matchings(_G, k, matching_type = 'max', return_type = 'list'):
+	'''Generate the k best matchings (as find_matching: absent pairs have
+	   weight 0 and every vertex on the smaller side is matched), best
+	   first. Each Murty subproblem is warm-started from its parent's
+	   labels and only solved once it could be next.
+
+	Parameters
+	----------
+	_G : dict, required (valid Graph dict, or a CompactGraph)
+	k : int, required (None for every matching)
+	matching_type : str, optional (default = 'max') ('max' or 'min')
+	return_type : str, optional (default = 'list') ('list' or 'total')
+
+	Return
+	----------
+	generator of [(str, int)] / int (as find_matching)
+	'''
+	CG = _G if isinstance(_G, CompactGraph) else CompactGraph(_G)
+	in_left = CG.bipartition()
+
+	if in_left is None:
+		raise ValueError('graph is not bipartite')
+
+	left = [v for v in range(len(CG)) if in_left[v]]
+	right = [v for v in range(len(CG)) if not in_left[v]]
+	rows, cols = (left, right) if len(left) <= len(right) else (right, left)
+
+	# Square cost matrix: dummy rows (cost 0) pad the smaller side
+	p, n = len(rows), len(cols)
+	col_index = {y: j for j, y in enumerate(cols)}
+	sign = -1 if matching_type == 'max' else 1
+	C = np.zeros((n, n))
+	for i, x in enumerate(rows):
+		for y, weight in CG.edges(x):
+			C[i, col_index[y]] = sign * weight
+
+	u = np.zeros(n)
+	v = np.zeros(n)
+	row_of = np.full(n, -1, dtype=np.intp)
+	for i in range(n):
+		augment_row(C, i, u, v, row_of)
+	col_of = np.empty(n, dtype=np.intp)
+	col_of[row_of] = np.arange(n)
+
+	root = Subproblem(C[np.arange(n), col_of].sum(), u, v, row_of, col_of, 0, [])
+	counter = itertools.count()
+	heap = [(root.cost, next(counter), root, None)]
+	found = 0
+
+	while heap and (k is None or found < k):
+		cost, tiebreak, node, i = heapq.heappop(heap)
+
+		if i is not None:
+			# Bound of an unsolved child: solve it and queue it again
+			child = solve_child(C, node, i)
+			if child is not None:
+				heapq.heappush(heap, (child.cost, next(counter), child, None))
+			continue
+
+		found = found + 1
+		M = []
+		for i in range(p):
+			x, y = rows[i], cols[node.col_of[i]]
+			w = CG.get_weight(x, y, 0)
+			M.append(CG.pair(x, y, w) if in_left[x] else CG.pair(y, x, w))
+
+		if return_type == 'list':
+			yield M
+		elif return_type == 'total':
+			total = 0
+			for e in M:
+				total = total + e[1]
+			yield total
+
+		# Murty partition of the rest of node's solutions
+		if node.fixed < p:
+			for i, bound in zip(range(node.fixed, p), child_bounds(C, node, p)):
+				if np.isfinite(bound):
+					heapq.heappush(heap, (bound, next(counter), node, i))
@@ -0,0 +1,286 @@
+'''
+    File name: lazy.py
+    Description: Assignment solver that evaluates pair weights on demand
+                 from a callback, skipping pairs the dual bounds rule out.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+import heapq
+import time
+
+from .events import report_phase
+
+class LazyCosts:
+
+	def __init__(self, rows, cols, weight, sign, swap, lb, block = None, on_event = None):
+		'''Memoized costs sign * weight(left, right) of row/column pairs.
+
+		Parameters
+		----------
+		rows : list, required (row vertices)
+		cols : list, required (column vertices)
+		weight : callable, required (weight(left, right), or
+									 weight(left, [right, ...]) if block
+									 is given)
+		sign : int, required (1 for costs = weights, -1 for costs = -weights)
+		swap : bool, required (rows are the right side)
+		lb : callable, required (lower_bound)
+		block : int, optional (default = None) (pairs per weight call)
+		on_event : callable, optional (default = None) ('cost_evaluation' :
+														number of pairs)
+		'''
+		self.rows = rows
+		self.cols = cols
+		self.weight = weight
+		self.sign = sign
+		self.swap = swap
+		self.lb = lb
+		self.block = block
+		self.on_event = on_event
+		self.memo = {}
+		self.evaluations = 0
+		# Pairs of one left vertex (a row, or a column if swap) sorted by
+		# lower bound, and the length of their evaluated prefix
+		self.order = {}
+		self.start = {}
+
+	def store(self, pairs, weights):
+		n = len(self.cols)
+		for (i, j), w in zip(pairs, weights):
+			self.memo[i * n + j] = self.sign * w
+
+		self.evaluations = self.evaluations + len(pairs)
+		if self.on_event:
+			self.on_event('cost_evaluation', len(pairs))
+
+	def evaluate(self, i, j):
+		'''Compute and memoize the cost of (i, j) with one weight call.'''
+		if self.swap:
+			w = self.weight(self.cols[j], self.rows[i])
+		else:
+			w = self.weight(self.rows[i], self.cols[j])
+
+		self.store([(i, j)], [w])
+
+	def evaluate_line(self, i, j, settled = ()):
+		'''Evaluate (i, j) in one weight(left, [right, ...]) call together
+		   with up to block - 1 other unevaluated pairs of its left vertex:
+		   row i (column j if swap), least lower bound first, other than
+		   settled columns. Each line is sorted by lower bound once, and
+		   its evaluated prefix is only scanned once.'''
+		if self.swap:
+			line, own, size = j, i, len(self.rows)
+			known = lambda k: self.get(k, j) is not None
+			key = lambda k: self.lb(self.rows[k], self.cols[j])
+			settled = ()
+		else:
+			line, own, size = i, j, len(self.cols)
+			known = lambda k: self.get(i, k) is not None
+			key = lambda k: self.lb(self.rows[i], self.cols[k])
+
+		order = self.order.get(line)
+		if order is None:
+			order = self.order[line] = sorted(range(size), key = key)
+		start = self.start.get(line, 0)
+		while start < size and known(order[start]):
+			start = start + 1
+		self.start[line] = start
+
+		ks = [own]
+		for x in range(start, size):
+			if len(ks) == self.block:
+				break
+			k = order[x]
+			if k != own and k not in settled and not known(k):
+				ks.append(k)
+
+		if self.swap:
+			weights = self.weight(self.cols[j], [self.rows[k] for k in ks])
+			self.store([(k, j) for k in ks], weights)
+		else:
+			weights = self.weight(self.rows[i], [self.cols[k] for k in ks])
+			self.store([(i, k) for k in ks], weights)
+
+	def get(self, i, j):
+		'''Cost of (i, j), or None if it hasn't been evaluated.'''
+		return self.memo.get(i * len(self.cols) + j)
+
+def lower_bound(bound, sign, swap):
+	'''Lower bound on the cost of a pair as a function of (row, column)
+	   vertices, from a bound on the weights.
+
+	Return
+	----------
+	callable
+	'''
+	if callable(bound):
+		if swap:
+			return lambda u, v: sign * bound(v, u)
+		return lambda u, v: sign * bound(u, v)
+
+	return lambda u, v: sign * bound
+
+def augment_lazy(costs, root, u, v, row_of, col_of, lb):
+	'''Shortest augmenting path from an unmatched row (Dijkstra over
+	   reduced costs c(i, j) - u[i] - v[j] >= 0). A pair enters the heap
+	   keyed by lb(i, j) - u[i] - v[j] and is only evaluated when that key
+	   comes out on top, so pairs that can't lie on a shortest path are
+	   never evaluated. Updates the potentials and the matching in place.
+
+	Parameters
+	----------
+	costs : LazyCosts, required
+	root : int, required (unmatched row)
+	u, v : [float], required (row / column potentials)
+	row_of : [int], required (row matched to each column, or -1)
+	col_of : [int], required (column matched to each row, or -1)
+	lb : callable, required (lower_bound)
+
+	Return
+	----------
+	(float, int) (distance to the free column, edges on the path)
+	'''
+	n_b = len(v)
+	rows, cols = costs.rows, costs.cols
+	settled = {}
+	reached = [(root, 0)]
+	pred = {}
+	heap = []
+
+	def scan(i, d):
+		for j in range(n_b):
+			if j not in settled:
+				c = costs.get(i, j)
+				if c is None:
+					heapq.heappush(heap, (d + lb(rows[i], cols[j]) - u[i] - v[j], False, i, j))
+				else:
+					heapq.heappush(heap, (d + c - u[i] - v[j], True, i, j))
+
+	scan(root, 0)
+	dist = {root: 0}
+
+	while True:
+		key, exact, i, j = heapq.heappop(heap)
+		if j in settled:
+			continue
+
+		if not exact:
+			if costs.get(i, j) is None:
+				if costs.block:
+					costs.evaluate_line(i, j, settled)
+				else:
+					costs.evaluate(i, j)
+			heapq.heappush(heap, (dist[i] + costs.get(i, j) - u[i] - v[j], True, i, j))
+			continue
+
+		settled[j] = key
+		pred[j] = i
+		if row_of[j] == -1:
+			break
+
+		r = row_of[j]
+		dist[r] = key
+		reached.append((r, key))
+		scan(r, key)
+
+	# Update the potentials
+	D = key
+	for r, d in reached:
+		u[r] += D - d
+	for k, d in settled.items():
+		v[k] -= D - d
+
+	# Augment the matching
+	length = 1
+	while True:
+		i = pred[j]
+		next_j = col_of[i]
+		col_of[i] = j
+		row_of[j] = i
+		if i == root:
+			break
+		j = next_j
+		length = length + 2
+
+	return D, length
+
+def find_matching_lazy(left, right, weight, bound, matching_type = 'max', return_type = 'list',
+					   block = None, on_event = None):
+	'''Find maximum/minimum-weighted matching of the complete bipartite
+	   graph on left x right, calling weight(l, r) only for the pairs the
+	   solver needs. Each computed weight is memoized. The bound on the
+	   weights gives feasible starting labels without evaluating any pair,
+	   and pairs whose bound already rules them out of every shortest
+	   augmenting path are never evaluated.
+
+	Parameters
+	----------
+	left : list, required (left vertices)
+	right : list, required (right vertices)
+	weight : callable, required (weight(l, r), or weight(l, [r, ...])
+								 returning a list if block is given)
+	bound : number or callable, required (upper bound on the weights for
+										  'max', lower bound for 'min'; a
+										  callable bound(l, r) should be
+										  cheap. Weights must respect it)
+	matching_type : str, optional (default = 'max') ('max' or 'min')
+	return_type : str, optional (default = 'list') ('list' or 'total')
+	block : int, optional (default = None) (evaluate up to block pairs of
+											a left vertex per weight call)
+	on_event : callable, optional (default = None) (as find_matching, plus
+													'cost_evaluation' :
+													number of pairs)
+
+	Return
+	----------
+	[(str, int)] / int (as find_matching)
+	'''
+	if bound is None:
+		raise ValueError('bound is required (a bound on the weights, number or bound(l, r))')
+
+	if on_event:
+		t = time.perf_counter()
+
+	# Rows are the smaller side, every row is matched
+	swap = len(right) < len(left)
+	rows, cols = (right, left) if swap else (left, right)
+	sign = 1 if matching_type == 'min' else -1
+	lb = lower_bound(bound, sign, swap)
+	costs = LazyCosts(list(rows), list(cols), weight, sign, swap, lb, block, on_event)
+	n_a, n_b = len(rows), len(cols)
+
+	# Feasible potentials: u[i] no more than any cost in row i
+	u = [min([lb(r, c) for c in costs.cols] or [0]) for r in costs.rows]
+	v = [0] * n_b
+
+	if on_event:
+		t = report_phase(on_event, 'labeling', t)
+
+	row_of = [-1] * n_b
+	col_of = [-1] * n_a
+
+	for root in range(n_a):
+		D, length = augment_lazy(costs, root, u, v, row_of, col_of, lb)
+		if on_event:
+			on_event('dual_update', D)
+			on_event('augmentation', length)
+
+	if on_event:
+		t = report_phase(on_event, 'augmentation', t)
+
+	M = []
+	for i, j in enumerate(col_of):
+		w = sign * costs.get(i, j)
+		M.append(((cols[j], rows[i]), w) if swap else ((rows[i], cols[j]), w))
+
+	if return_type == 'list':
+		return M
+	elif return_type == 'total':
+		total = 0
+		for e in M:
+			total = total + e[1]
+		return total
@@ -0,0 +1,268 @@
+'''
+    File name: loaders.py
+    Description: Streaming edge-list loaders (CSV and binary) that build
+                 a CompactGraph without an intermediate Graph dict.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from array import array
+import csv
+import io
+import mmap
+import struct
+
+from .compact import CompactGraph
+
+# Binary records: endpoint1 id, endpoint2 id (int32), weight (float64)
+EDGE_RECORD = '<iid'
+
+def pair_key(v1, v2):
+	'''Sort key of the unordered pair of ids v1, v2.'''
+	return (v1 << 32) | v2 if v1 < v2 else (v2 << 32) | v1
+
+class EdgeBuffer:
+	'''Edge list in typed arrays, with vertex keys mapped to ids
+	   as they are first seen. Incoming edges wait in a pending block;
+	   when it fills up it is sorted by pair and merged into the stored
+	   edges (kept sorted, one per pair), so memory follows the number of
+	   distinct pairs rather than the length of the stream.'''
+
+	def __init__(self, duplicates = 'last', flush_edges = 1 << 16):
+		self.keys = []
+		self.ids = {}
+		self.duplicates = duplicates
+		self.flush_edges = flush_edges
+		# Merged edges, sorted by pair_key
+		self.sources = array('i')
+		self.targets = array('i')
+		self.weights = array('q')
+		# Edges not merged yet, in stream order
+		self.pending_sources = array('i')
+		self.pending_targets = array('i')
+		self.pending_weights = array('q')
+
+	def vertex_id(self, key):
+		i = self.ids.get(key)
+
+		if i is None:
+			i = self.ids[key] = len(self.keys)
+			self.keys.append(key)
+
+		return i
+
+	def add_edge(self, v1, v2, weight):
+		self.pending_sources.append(self.vertex_id(v1))
+		self.pending_targets.append(self.vertex_id(v2))
+
+		if self.weights.typecode == 'q' and type(weight) is not int:
+			# First non-integer weight: switch to doubles
+			self.weights = array('d', self.weights)
+			self.pending_weights = array('d', self.pending_weights)
+
+		self.pending_weights.append(weight)
+
+		# Merging costs O(stored edges), so let the block grow with them
+		if len(self.pending_sources) >= max(self.flush_edges, len(self.sources) // 2):
+			self.flush()
+
+	def merge_weight(self, old, new):
+		'''Weight kept when a pair repeats (new comes later).'''
+		if self.duplicates == 'max':
+			return max(old, new)
+		elif self.duplicates == 'min':
+			return min(old, new)
+		return new
+
+	def flush(self):
+		'''Merge the pending edges into the stored ones. A repeated pair
+		   keeps its last direction and the weight chosen by duplicates.'''
+		ps, pt, pw = self.pending_sources, self.pending_targets, self.pending_weights
+		if not ps:
+			return
+
+		keys = array('q', (pair_key(ps[k], pt[k]) for k in range(len(ps))))
+		# Stable, so repeats within the block stay in stream order
+		order = sorted(range(len(ps)), key = keys.__getitem__)
+
+		ss, st, sw = self.sources, self.targets, self.weights
+		sources = array('i')
+		targets = array('i')
+		weights = array(sw.typecode)
+		i = 0
+		last = -1
+
+		for k in order:
+			key = keys[k]
+			if key == last:
+				sources[-1], targets[-1] = ps[k], pt[k]
+				weights[-1] = self.merge_weight(weights[-1], pw[k])
+				continue
+
+			while i < len(ss) and pair_key(ss[i], st[i]) < key:
+				sources.append(ss[i])
+				targets.append(st[i])
+				weights.append(sw[i])
+				i = i + 1
+
+			sources.append(ps[k])
+			targets.append(pt[k])
+			if i < len(ss) and pair_key(ss[i], st[i]) == key:
+				weights.append(self.merge_weight(sw[i], pw[k]))
+				i = i + 1
+			else:
+				weights.append(pw[k])
+			last = key
+
+		sources.extend(ss[i:])
+		targets.extend(st[i:])
+		weights.extend(sw[i:])
+
+		self.sources, self.targets, self.weights = sources, targets, weights
+		self.pending_sources = array('i')
+		self.pending_targets = array('i')
+		self.pending_weights = array(sw.typecode)
+
+	def to_compact(self, unweighted):
+		self.flush()
+		return CompactGraph.from_edges(self.keys, self.sources, self.targets, self.weights,
+									   unweighted, self.duplicates)
+
+def parse_weight(field):
+	'''int if the field is an integer, float otherwise.'''
+	try:
+		return int(field)
+	except ValueError:
+		return float(field)
+
+def read_edge_list(f, delimiter = ',', header = False, duplicates = 'last',
+				   chunksize = 1 << 16):
+	'''Stream a text edge list into a CompactGraph. Each row is
+	   endpoint1, endpoint2[, weight] (weight 1 if absent).
+
+	Parameters
+	----------
+	f : str or file, required (path or open text file)
+	delimiter : str, optional (default = ',')
+	header : bool, optional (default = False) (skip the first row)
+	duplicates : str, optional (default = 'last') (weight kept for a
+												   repeated pair: 'last',
+												   'max' or 'min')
+	chunksize : int, optional (default = 65536) (bytes read at a time)
+
+	Return
+	----------
+	CompactGraph
+	'''
+	if duplicates not in ('last', 'max', 'min'):
+		raise ValueError("duplicates must be 'last', 'max' or 'min'")
+
+	if isinstance(f, str):
+		with open(f, newline = '', buffering = chunksize) as file:
+			return read_edge_list(file, delimiter, header, duplicates, chunksize)
+
+	edges = EdgeBuffer(duplicates)
+	unweighted = True
+	rows = csv.reader(f, delimiter = delimiter)
+
+	if header:
+		next(rows, None)
+
+	for line, row in enumerate(rows, 2 if header else 1):
+		if not row:
+			continue
+		if len(row) == 2:
+			edges.add_edge(row[0], row[1], 1)
+		elif len(row) == 3:
+			try:
+				weight = parse_weight(row[2])
+			except ValueError:
+				raise ValueError('line %d: weight %r is not a number' % (line, row[2]))
+			edges.add_edge(row[0], row[1], weight)
+			unweighted = False
+		else:
+			raise ValueError('line %d: expected 2 or 3 fields, got %d' % (line, len(row)))
+
+	return edges.to_compact(unweighted)
+
+def read_binary_edges(path, duplicates = 'last', chunksize = 1 << 16, record = EDGE_RECORD,
+					  separate_ids = False):
+	'''Stream a binary edge list (fixed-size records, see EDGE_RECORD)
+	   into a CompactGraph through a read-only memory map. Vertex keys
+	   are the integer ids in the file, or ('L', id) and ('R', id) when
+	   each side is numbered on its own.
+
+	Parameters
+	----------
+	path : str, required
+	duplicates : str, optional (default = 'last') (as read_edge_list)
+	chunksize : int, optional (default = 65536) (records per chunk, and
+												 fewest edges merged at a
+												 time)
+	record : str, optional (default = EDGE_RECORD) (struct format of
+													endpoint1, endpoint2,
+													weight)
+	separate_ids : bool, optional (default = False) (endpoint1 and
+													 endpoint2 ids are
+													 numbered apart, e.g.
+													 both from 0. If False,
+													 an id found as both
+													 raises ValueError)
+
+	Return
+	----------
+	CompactGraph
+	'''
+	if duplicates not in ('last', 'max', 'min'):
+		raise ValueError("duplicates must be 'last', 'max' or 'min'")
+
+	size = struct.calcsize(record)
+	edges = EdgeBuffer(duplicates, chunksize)
+	# Ids seen as endpoint1 and as endpoint2
+	first, second = set(), set()
+
+	with open(path, 'rb') as f:
+		length = f.seek(0, io.SEEK_END)
+
+		if length % size:
+			raise ValueError('file size %d is not a multiple of the %d byte record'
+							 % (length, size))
+		if length == 0:
+			return edges.to_compact(False)
+
+		with mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as mm:
+			for start in range(0, length, chunksize * size):
+				chunk = mm[start:start + chunksize * size]
+				for v1, v2, weight in struct.iter_unpack(record, chunk):
+					if separate_ids:
+						edges.add_edge(('L', v1), ('R', v2), weight)
+					else:
+						first.add(v1)
+						second.add(v2)
+						edges.add_edge(v1, v2, weight)
+
+	shared = first & second
+	if shared:
+		raise ValueError('id %d is both an endpoint1 and an endpoint2 (pass separate_ids = True '
+						 'if each side is numbered on its own)' % min(shared))
+
+	return edges.to_compact(False)
+
+def write_binary_edges(path, edges, record = EDGE_RECORD):
+	'''Write (endpoint1, endpoint2, weight) tuples as a binary edge list
+	   readable by read_binary_edges.
+
+	Parameters
+	----------
+	path : str, required
+	edges : iterable, required ((int, int, number) tuples)
+	record : str, optional (default = EDGE_RECORD)
+	'''
+	packer = struct.Struct(record)
+
+	with open(path, 'wb') as f:
+		for e in edges:
+			f.write(packer.pack(*e))
@@ -0,0 +1,387 @@
+'''
+    File name: matrix.py
+    Description: Dense cost-matrix solver for the assignment problem.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+
+import numpy as np
+
+# Fewest columns worth handing to a thread in each step of a search
+PARALLEL_MIN_COLUMNS = 1 << 10
+
+def _as_cost_matrix(cost):
+	'''Validate a cost matrix and convert it to a float array.
+
+	Parameters
+	----------
+	cost : array_like, required (2-D)
+
+	Return
+	----------
+	numpy.ndarray (2-D, float64)
+	'''
+	C = np.asarray(cost)
+
+	if C.ndim != 2:
+		raise ValueError('cost matrix must be 2-D, got %d-D' % C.ndim)
+	if C.dtype.kind not in 'biuf':
+		raise ValueError('cost matrix must be numeric')
+
+	C = C.astype(np.float64)
+
+	if np.isnan(C).any():
+		raise ValueError('cost matrix contains NaN')
+
+	return C
+
+class MappedCosts:
+
+	def __init__(self, M, sign = 1):
+		'''Cost matrix left on disk (or in any array) whose rows are read
+		   on demand as float64, so only the rows being searched are
+		   paged in.
+
+		Parameters
+		----------
+		M : numpy.ndarray, required (2-D, typically a numpy.memmap)
+		sign : int, optional (default = 1) (-1 to negate every cost)
+		'''
+		# Plain view of the same pages (skips memmap's per-read overhead)
+		self.M = np.asarray(M)
+		self.sign = sign
+		self.shape = M.shape
+		self.values_read = 0
+		self.lock = threading.Lock()
+
+	def __getitem__(self, key):
+		R = np.asarray(self.M[key], dtype=np.float64)
+		if self.sign != 1:
+			R = self.sign * R
+		if np.isnan(R).any():
+			raise ValueError('cost matrix contains NaN')
+		with self.lock:
+			self.values_read = self.values_read + R.size
+
+		return R
+
+def _as_mapped_cost_matrix(cost):
+	'''Validate a memory-mapped cost matrix (or a .npy path, mapped
+	   read-only) without reading it.
+
+	Parameters
+	----------
+	cost : numpy.memmap or str, required (2-D)
+
+	Return
+	----------
+	numpy.memmap
+	'''
+	if not isinstance(cost, np.memmap):
+		cost = np.load(cost, mmap_mode='r')
+		if not isinstance(cost, np.memmap):
+			raise ValueError('cost matrix file must hold a single array')
+
+	if cost.ndim != 2:
+		raise ValueError('cost matrix must be 2-D, got %d-D' % cost.ndim)
+	if cost.dtype.kind not in 'biuf':
+		raise ValueError('cost matrix must be numeric')
+
+	return cost
+
+def row_minima(C, rows, u, lo, hi, forbidden = None):
+	'''Columnwise minimum of C[r, lo:hi] - u[r] over a block of rows.
+
+	Parameters
+	----------
+	C : numpy.ndarray, required (2-D)
+	rows : [int], required (row indices)
+	u : numpy.ndarray, required (row potentials)
+	lo, hi : int, required (range of columns)
+	forbidden : dict, optional (default = None) (as augment_row)
+
+	Return
+	----------
+	numpy.ndarray
+	'''
+	best = None
+	for r in rows:
+		cur = C[r, lo:hi] - u[r]
+		if forbidden and r in forbidden:
+			cur[[c - lo for c in forbidden[r] if lo <= c < hi]] = np.inf
+		if best is None:
+			best = cur
+		else:
+			np.minimum(best, cur, out=best)
+
+	return best
+
+def closest_rows(C, rows, u, cols, forbidden = None):
+	'''Row attaining the row_minima of each of a few columns.
+
+	Parameters
+	----------
+	C, rows, u, forbidden : (as row_minima)
+	cols : numpy.ndarray, required (column indices)
+
+	Return
+	----------
+	numpy.ndarray
+	'''
+	rows = np.array(rows)
+	R = C[np.ix_(rows, cols)] - u[rows, None]
+	if forbidden:
+		for k, r in enumerate(rows.tolist()):
+			if r in forbidden:
+				R[k, np.isin(cols, forbidden[r])] = np.inf
+
+	return rows[R.argmin(axis=0)]
+
+def column_chunks(m, workers = 1):
+	'''Split m columns into at most workers ranges of at least
+	   PARALLEL_MIN_COLUMNS columns (a single range if m is smaller).
+
+	Return
+	----------
+	[(int, int)] (lo, hi of each range)
+	'''
+	count = max(1, min(workers, m // PARALLEL_MIN_COLUMNS))
+	size = -(-m // count) if m else 1
+
+	return [(lo, min(lo + size, m)) for lo in range(0, m, size)] or [(0, 0)]
+
+def relax_columns(C, rows, u, v, d0, pending, way, todo, lo, hi, forbidden = None):
+	'''One Dijkstra step of augment_row on the columns lo..hi-1: lower
+	   the pending distance (and way) of each column still in todo that one
+	   of rows, reached at distance d0, gets to more cheaply.
+
+	Parameters
+	----------
+	C, rows, u, lo, hi, forbidden : (as row_minima)
+	v : numpy.ndarray, required (column potentials)
+	d0 : float, required
+	pending, way, todo : numpy.ndarray, required (as augment_row, updated
+												  in place)
+
+	Return
+	----------
+	int (column of lo..hi-1 with the smallest pending distance)
+	'''
+	cur = row_minima(C, rows, u, lo, hi, forbidden)
+	cur -= v[lo:hi]
+	cur += d0
+	better = cur < pending[lo:hi]
+	better &= todo[lo:hi]
+	np.copyto(pending[lo:hi], cur, where=better)
+	if len(rows) == 1:
+		np.copyto(way[lo:hi], rows[0], where=better)
+	else:
+		cols = np.flatnonzero(better) + lo
+		way[cols] = closest_rows(C, rows, u, cols, forbidden)
+
+	return lo + int(pending[lo:hi].argmin())
+
+def augment_row(C, i, u, v, row_of, allowed = None, forbidden = None, pool = None,
+				chunks = None):
+	'''Assign the unassigned row i of C along a shortest augmenting path
+	   (Dijkstra over reduced costs), keeping the dual potentials feasible.
+	   Slack updates are vectorized, O(n * m) overall. Columns at the same
+	   distance are settled together and their rows relaxed as one block.
+	   Each step's slack update and argmin can be split into column ranges
+	   run on the threads of pool (NumPy releases the GIL while it works on
+	   them); their minima are then combined.
+
+	Parameters
+	----------
+	C : numpy.ndarray, required (2-D float, m columns)
+	i : int, required (row to assign)
+	u : numpy.ndarray, required (row potentials, updated in place)
+	v : numpy.ndarray, required (column potentials, updated in place)
+	row_of : numpy.ndarray, required (row assigned to each column or -1,
+									  updated in place)
+	allowed : numpy.ndarray, optional (default = every column) (bool mask
+																of usable
+																columns)
+	forbidden : dict, optional (default = None)
+			key : row
+			value : columns that row can't be assigned
+	pool : concurrent.futures.Executor, optional (default = None) (threads
+																	relaxing
+																	column
+																	ranges)
+	chunks : [(int, int)], optional (default = every column at once)
+			 (column ranges, see column_chunks)
+
+	Return
+	----------
+	bool (False if row i can't be assigned)
+	'''
+	m = C.shape[1]
+	INF = np.inf
+	if pool is None or chunks is None:
+		chunks = [(0, m)]
+	# Tentative distance (over reduced costs) of every column not yet
+	# settled in todo, and the row it is reached from
+	pending = np.full(m, INF)
+	way = np.zeros(m, dtype=np.intp)
+	todo = np.ones(m, dtype=bool) if allowed is None else allowed.copy()
+	settled = []
+	dist = []
+	# Column through which each row in the tree was reached
+	via = {i: -1}
+	reached, d0 = [i], 0.0
+
+	def closest(best):
+		# First range holding the overall minimum (ties go to the lowest
+		# column, as with a single argmin)
+		if len(best) == 1:
+			return 0
+		return min(range(len(best)), key = lambda k: pending[best[k]])
+
+	while True:
+		# Relax the edges of the newly reached rows, range by range
+		args = (C, reached, u, v, d0, pending, way, todo)
+		if len(chunks) == 1:
+			best = [relax_columns(*args, 0, m, forbidden)]
+		else:
+			tasks = [pool.submit(relax_columns, *args, lo, hi, forbidden)
+					 for lo, hi in chunks[1:]]
+			best = [relax_columns(*args, *chunks[0], forbidden)] + [t.result() for t in tasks]
+
+		# Settle the closest columns, up to a free one among them
+		k = closest(best)
+		j = best[k]
+		d0 = pending[j]
+		if d0 == INF:
+			return False
+
+		reached = []
+		while row_of[j] != -1:
+			todo[j] = False
+			pending[j] = INF
+			settled.append(j)
+			dist.append(d0)
+			r = int(row_of[j])
+			via[r] = j
+			reached.append(r)
+
+			lo, hi = chunks[k]
+			best[k] = lo + int(pending[lo:hi].argmin())
+			k = closest(best)
+			j = best[k]
+			if pending[j] != d0:
+				break
+		else:
+			settled.append(j)
+			dist.append(d0)
+			break
+
+	# Update the potentials (reduced costs stay nonnegative, tree edges
+	# become tight)
+	gap = d0 - np.array(dist)
+	u[i] += d0
+	u[row_of[settled[:-1]]] += gap[:-1]
+	v[settled] -= gap
+
+	# Augment along the alternating path
+	while j != -1:
+		r = way[j]
+		row_of[j], j = r, via[r]
+
+	return True
+
+def shortest_augmenting_paths(C, pool = None, workers = 1):
+	'''Minimum-cost assignment of every row of C (rows <= columns)
+	   by successive shortest augmenting paths with dual potentials.
+
+	Parameters
+	----------
+	C : numpy.ndarray, required (2-D float, rows <= columns)
+	pool : concurrent.futures.Executor, optional (default = None) (as
+																	augment_row)
+	workers : int, optional (default = 1) (threads of pool, see
+										   column_chunks)
+
+	Return
+	----------
+	numpy.ndarray (column assigned to each row)
+	'''
+	n, m = C.shape
+	u = np.zeros(n)
+	v = np.zeros(m)
+	row_of = np.full(m, -1, dtype=np.intp)
+	chunks = column_chunks(m, workers)
+
+	for i in range(n):
+		if not augment_row(C, i, u, v, row_of, pool = pool, chunks = chunks):
+			raise ValueError('cost matrix is infeasible')
+
+	col_of = np.empty(n, dtype=np.intp)
+	matched = np.flatnonzero(row_of >= 0)
+	col_of[row_of[matched]] = matched
+
+	return col_of
+
+def solve_matrix(cost, maximize = False, workers = 1):
+	'''Find minimum/maximum-cost assignment of a dense cost matrix.
+	   A numpy.memmap (or a path to a .npy file) is never loaded whole:
+	   rows are read as the search reaches them, and the solver itself
+	   keeps O(rows + columns) memory.
+
+	Parameters
+	----------
+	cost : array_like, numpy.memmap or str, required (2-D, rows x columns,
+													 or the path of a .npy
+													 file)
+	maximize : bool, optional (default = False)
+	workers : int, optional (default = 1) (threads splitting each search
+										   step over the columns, None for
+										   one per CPU)
+
+	Return
+	----------
+	(numpy.ndarray, numpy.ndarray, number) (row indices, column indices
+											and total cost of the
+											min(rows, columns) assigned pairs)
+	'''
+	mapped = isinstance(cost, (np.memmap, str, os.PathLike))
+	if mapped:
+		cost = _as_mapped_cost_matrix(cost)
+		C = cost
+	else:
+		C = _as_cost_matrix(cost)
+	transposed = C.shape[0] > C.shape[1]
+
+	if transposed:
+		C = C.T
+	if mapped:
+		C = MappedCosts(C, -1 if maximize else 1)
+	elif maximize:
+		C = -C
+
+	if C.shape[0] == 0:
+		row_ind = np.zeros(0, dtype=np.intp)
+		col_ind = np.zeros(0, dtype=np.intp)
+	else:
+		row_ind = np.arange(C.shape[0])
+		workers = workers or os.cpu_count() or 1
+		if len(column_chunks(C.shape[1], workers)) > 1:
+			with ThreadPoolExecutor(workers - 1) as pool:
+				col_ind = shortest_augmenting_paths(C, pool, workers)
+		else:
+			col_ind = shortest_augmenting_paths(C)
+
+	if transposed:
+		order = np.argsort(col_ind)
+		row_ind, col_ind = col_ind[order], row_ind[order]
+
+	total = np.asarray(cost)[row_ind, col_ind].sum()
+
+	return row_ind, col_ind, total.item()
@@ -0,0 +1,266 @@
+'''
+    File name: sparse.py
+    Description: Sparse assignment solver (no complete bipartite padding).
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+import heapq
+import time
+
+from .compact import CompactGraph
+from .events import report_phase
+
+def shortest_augmenting_paths(costs, n_b, dummy_cost = None, on_event = None):
+	'''Minimum-cost matching of the A side by successive shortest
+	   augmenting paths (Dijkstra over reduced costs). O(k * m log n).
+
+	Parameters
+	----------
+	costs : [[(int, int)]], required (for each A vertex a list of
+									  (B vertex, cost) pairs)
+	n_b : int, required (number of B vertices)
+	dummy_cost : int, optional (default = None) (if given, every A vertex
+												 also has a private partner
+												 numbered n_b + a at this
+												 cost)
+	on_event : callable, optional (default = None) (as find_matching)
+
+	Return
+	----------
+	[int] (B vertex matched to each A vertex, or -1 if unmatched)
+	'''
+	n_a = len(costs)
+	INF = float('inf')
+
+	# Dual potentials: reduced cost c(a, b) - y_a[a] - y_b[b] >= 0,
+	# y_b stays 0 on unmatched B vertices (they need not be matched)
+	dummies = dummy_cost is not None
+	y_a = [min([c for b, c in costs[a]] + ([dummy_cost] if dummies else [])
+			   or [0]) for a in range(n_a)]
+	y_b = [0] * (n_b + n_a if dummies else n_b)
+
+	mate_a = [-1] * n_a
+	mate_b = [-1] * len(y_b)
+
+	for root in range(n_a):
+		dist = {}
+		pred = {}
+		final = set()
+		reached = [(root, 0)]
+		heap = []
+		sink = -1
+
+		a, d = root, 0
+		while True:
+			# Relax the edges of a newly reached A vertex
+			edges = costs[a]
+			if dummies:
+				edges = edges + [(n_b + a, dummy_cost)]
+			for b, c in edges:
+				if b not in final:
+					new_dist = d + c - y_a[a] - y_b[b]
+					if new_dist < dist.get(b, INF):
+						dist[b] = new_dist
+						pred[b] = a
+						heapq.heappush(heap, (new_dist, b))
+
+			# Settle the closest B vertex
+			b = -1
+			while heap:
+				d, b = heapq.heappop(heap)
+				if b not in final and d == dist[b]:
+					break
+				b = -1
+
+			if b == -1:
+				break
+
+			final.add(b)
+			if mate_b[b] == -1:
+				sink = b
+				break
+
+			a = mate_b[b]
+			reached.append((a, d))
+
+		if sink == -1:
+			# No augmenting path
+			continue
+
+		# Update the potentials
+		D = dist[sink]
+		for a, d in reached:
+			y_a[a] += D - d
+		for b in final:
+			y_b[b] -= D - dist[b]
+
+		# Augment the matching
+		b = sink
+		length = 0
+		while b != -1:
+			a = pred[b]
+			next_b = mate_a[a]
+			mate_a[a] = b
+			mate_b[b] = a
+			b = next_b
+			length = length + 1
+
+		if on_event:
+			on_event('dual_update', D)
+			on_event('augmentation', 2 * length - 1)
+
+	return mate_a
+
+def private_partner_cost(costs, missing):
+	'''Cost of leaving an A vertex to its private partner: 0 if absent
+	   pairs weigh 0, more than any matching if they are forbidden.
+
+	Parameters
+	----------
+	costs : [[(int, int)]], required (as shortest_augmenting_paths)
+	missing : str, required ('zero', 'forbidden' or None)
+
+	Return
+	----------
+	int (or None for no private partners)
+	'''
+	if missing == 'zero':
+		return 0
+	elif missing == 'forbidden':
+		return 1 + 2 * sum(max([abs(c) for b, c in edges] or [0]) for edges in costs)
+
+	return None
+
+def match_pairs(A, B, CG, costs, missing, on_event = None):
+	'''Solve and translate the matching back to vertex ids. With
+	   missing = 'zero', A vertices matched to their private partner are
+	   paired with free B vertices that aren't adjacent (or adjacent with
+	   weight 0). With missing = 'forbidden', private partners cost more
+	   than any matching so that cardinality is maximized first.
+
+	Parameters
+	----------
+	A : [int], required (vertex ids, all matched)
+	B : [int], required (vertex ids)
+	CG : CompactGraph, required
+	costs : [[(int, int)]], required (as shortest_augmenting_paths)
+	missing : str, required ('zero', 'forbidden' or None for no private
+							 partners)
+	on_event : callable, optional (default = None) (as find_matching)
+
+	Return
+	----------
+	[(int, int, int)] (A vertex id, B vertex id, weight)
+		or
+	None (not enough free B vertices to pair with)
+	'''
+	mate = shortest_augmenting_paths(costs, len(B), private_partner_cost(costs, missing),
+									 on_event)
+
+	pairs = []
+	unpaired = []
+	free = [True] * len(B)
+
+	for a, b in enumerate(mate):
+		if b == -1:
+			continue
+		if b >= len(B):
+			if missing == 'zero':
+				unpaired.append(a)
+		else:
+			free[b] = False
+			pairs.append((A[a], B[b], CG.get_weight(A[a], B[b], 0)))
+
+	free = [b for b in range(len(B)) if free[b]]
+
+	for a in unpaired:
+		for i in range(len(free)):
+			w = CG.get_weight(A[a], B[free[i]], 0)
+			if w == 0:
+				pairs.append((A[a], B[free[i]], w))
+				free[i] = free[-1]
+				free.pop()
+				break
+		else:
+			return None
+
+	return pairs
+
+def solve_sparse(_G, matching_type = 'max', return_type = 'list', missing = 'zero',
+				 on_event = None, left = None, right = None):
+	'''Find maximum/minimum-weighted matching on the given edges only.
+
+	Parameters
+	----------
+	_G : dict, required (valid Graph dict, or a CompactGraph)
+	matching_type : str, optional (default = 'max')
+	return_type : str, optional (default = 'list')
+	missing : str, optional (default = 'zero') ('zero': absent pairs have
+												weight 0, as in
+												find_matching;
+												'forbidden': absent pairs
+												can't be matched and a
+												maximum-cardinality
+												matching is returned)
+	on_event : callable, optional (default = None) (as find_matching)
+	left : iterable, optional (default = None) (as find_matching)
+	right : iterable, optional (default = None) (as find_matching)
+
+	Return
+	----------
+	[(str, int)] / int (as find_matching)
+		or
+	False (not bipartite)
+	'''
+	if missing not in ('zero', 'forbidden'):
+		raise ValueError("missing must be 'zero' or 'forbidden'")
+
+	if on_event:
+		t = time.perf_counter()
+
+	CG = _G if isinstance(_G, CompactGraph) else CompactGraph(_G)
+	keys = CG.keys
+	if on_event:
+		t = report_phase(on_event, 'construction', t)
+
+	in_left = CG.bipartition(left, right)
+	if on_event:
+		t = report_phase(on_event, 'labeling', t)
+
+	if in_left is None:
+		return False
+
+	left = [v for v in range(len(keys)) if in_left[v]]
+	right = [v for v in range(len(keys)) if not in_left[v]]
+
+	# Every vertex of the smaller side A is matched
+	A, B = (left, right) if len(left) <= len(right) else (right, left)
+	b_index = {v: i for i, v in enumerate(B)}
+	sign = 1 if matching_type == 'min' else -1
+	costs = [[(b_index[w], sign * weight) for w, weight in CG.edges(v)] for v in A]
+
+	pairs = match_pairs(A, B, CG, costs, missing, on_event)
+
+	if pairs is None:
+		# Too few non-adjacent free vertices: add the weight 0 pairs
+		for i, v in enumerate(A):
+			adjacent = set(CG.neighbors(v))
+			costs[i] = costs[i] + [(j, 0) for j, w in enumerate(B) if w not in adjacent]
+		pairs = match_pairs(A, B, CG, costs, None, on_event)
+
+	if on_event:
+		t = report_phase(on_event, 'augmentation', t)
+
+	M = [CG.pair(u, v, w) if in_left[u] else CG.pair(v, u, w) for u, v, w in pairs]
+
+	if return_type == 'list':
+		return M
+	elif return_type == 'total':
+		total = 0
+		for e in M:
+			total = total + e[1]
+		return total
@@ -8,7 +8,8 @@
     License: MIT License Copyright (c) 2020 Ben Chaplin
 '''
 
-from ..algorithm import find_matching
+from ..algorithm import Graph, find_matching, find_matchings, initial_matching
+from ..compact import CompactGraph
 import unittest
 
 ex_G = {
@@ -122,6 +123,50 @@ exp_min_matching_N = {
 	(('F', '#121'), 28)
 }
 
+ex_P = {
+	'x0': {'y0': 12, 'y1': 1, 'y2': 20, 'y3': 11, 'y4': 1},
+	'x1': {'y0': 6, 'y1': 6, 'y2': 18, 'y3': 9, 'y4': 3},
+	'x2': {'y0': 1, 'y1': 9, 'y2': 4, 'y3': 6, 'y4': 3},
+	'x3': {'y0': 9, 'y1': 6, 'y2': 10, 'y3': 11, 'y4': 4},
+	'x4': {'y0': 13, 'y1': 7, 'y2': 9, 'y3': 17, 'y4': 20}
+}
+
+exp_min_matching_P = {
+	(('x0', 'y1'), 1),
+	(('x1', 'y3'), 9),
+	(('x2', 'y0'), 1),
+	(('x3', 'y4'), 4),
+	(('x4', 'y2'), 9)
+}
+
+ex_Q = {
+	'x1': {'y1': 3, 'y2': 1},
+	'x2': {'y1': 5, 'y2': 6},
+	'x3': {'y1': 4},
+	'x4': {'y2': 2}
+}
+
+exp_max_matching_Q = {
+	(('x2', 'y2'), 6),
+	(('x3', 'y1'), 4)
+}
+
+exp_min_matching_Q = {
+	(('x3', 'y2'), 0),
+	(('x4', 'y1'), 0)
+}
+
+ex_R = {
+	'x1': {'y1': 2, 'y2': 9, 'y3': 4, 'y4': 1, 'y5': 3, 'y6': 5},
+	'x2': {'y1': 8, 'y2': 7, 'y3': 6, 'y4': 2, 'y5': 1, 'y6': 3}
+}
+
+ex_F = {
+	'x1': {'y1': 0.1, 'y2': 0.2, 'y3': 0.3},
+	'x2': {'y1': 0.2, 'y2': 0.4, 'y3': 0.7},
+	'x3': {'y1': 0.3, 'y2': 0.6, 'y3': 0.9}
+}
+
 class TestGraphMethods(unittest.TestCase):
 
 	def test_hungarian_algorithm1(self):
@@ -169,5 +214,139 @@ class TestGraphMethods(unittest.TestCase):
 	def test_hungarian_algorithm6_total_min(self):
 		self.assertEqual(find_matching(ex_N, matching_type = 'min', return_type = 'total'), 51)
 
+	def test_hungarian_algorithm8_min(self):
+		self.assertEqual(set(find_matching(ex_P, matching_type = 'min')), exp_min_matching_P)
+
+	def test_hungarian_algorithm8_total_min(self):
+		self.assertEqual(find_matching(ex_P, matching_type = 'min', return_type = 'total'), 24)
+
+	def test_find_matchings_serial(self):
+		self.assertEqual(find_matchings([ex_H, ex_J, ex_K], return_type = 'total'),
+						 [16, 31, 11])
+
+	def test_find_matchings_pool(self):
+		self.assertEqual(find_matchings([ex_H, ex_M, ex_N, ex_P], matching_type = 'min',
+										return_type = 'total', workers = 2, serial_edges = 0),
+						 [find_matching(ex_H, 'min', 'total'), 4362, 51, 24])
+
+	def test_find_matchings_pool_list(self):
+		M = find_matchings([ex_G, ex_H], workers = 2, chunksize = 1, serial_edges = 0)
+		self.assertEqual((set(M[0]), set(M[1])), (exp_matching_G, exp_matching_H))
+
+	def test_find_matchings_compact(self):
+		graphs = [CompactGraph(ex_H), CompactGraph(ex_J), ex_K]
+		self.assertEqual(find_matchings(graphs, return_type = 'total'), [16, 31, 11])
+		self.assertEqual(find_matchings(graphs, return_type = 'total', workers = 2, serial_edges = 0),
+						 [16, 31, 11])
+
+	def test_find_matchings_kwargs(self):
+		self.assertEqual(find_matchings([ex_G, ex_L], return_type = 'total', sparse = True),
+						 [12, 24])
+
+	def test_hungarian_algorithm_rectangular_wide(self):
+		self.assertEqual(set(find_matching(ex_R)), {(('x1', 'y2'), 9), (('x2', 'y1'), 8)})
+
+	def test_hungarian_algorithm_rectangular_wide_min(self):
+		self.assertEqual(find_matching(ex_R, matching_type = 'min', return_type = 'total'), 2)
+
+	def test_hungarian_algorithm_rectangular_tall(self):
+		self.assertEqual(set(find_matching(ex_Q)), exp_max_matching_Q)
+
+	def test_hungarian_algorithm_rectangular_tall_min(self):
+		self.assertEqual(set(find_matching(ex_Q, matching_type = 'min')), exp_min_matching_Q)
+
+	def test_hungarian_algorithm_float(self):
+		self.assertAlmostEqual(find_matching(ex_F, return_type = 'total'), 1.4)
+		self.assertAlmostEqual(find_matching(ex_F, matching_type = 'min', return_type = 'total'), 1.0)
+
+	def test_hungarian_algorithm_epsilon(self):
+		self.assertAlmostEqual(find_matching(ex_F, return_type = 'total', epsilon = 1e-9), 1.4)
+		self.assertAlmostEqual(find_matching(ex_F, 'min', 'total', epsilon = 1e-9), 1.0)
+
+	def test_hungarian_algorithm_scale(self):
+		self.assertEqual(set(find_matching(ex_F, matching_type = 'min', scale = 10)),
+						 {(('x1', 'y3'), 0.3), (('x2', 'y2'), 0.4), (('x3', 'y1'), 0.3)})
+		self.assertAlmostEqual(find_matching(ex_F, return_type = 'total', scale = 1000), 1.4)
+
+	def test_hungarian_algorithm_disconnected(self):
+		self.assertEqual(set(find_matching({'x1': {'y1': 5}, 'x2': {'y2': 10}})),
+						 {(('x1', 'y1'), 5), (('x2', 'y2'), 10)})
+		self.assertEqual(find_matching({'x1': {'y1': 5}, 'x2': {'y2': 3}, 'x3': {'y2': 4}},
+									   return_type = 'total'), 9)
+
+	def test_hungarian_algorithm_sides(self):
+		self.assertEqual(set(find_matching(ex_Q, left = ['x1', 'x2', 'x3', 'x4'])), exp_max_matching_Q)
+		self.assertEqual(find_matching(ex_H, return_type = 'total', right = ['y1', 'y2', 'y3']),
+						 find_matching(ex_H, return_type = 'total'))
+
+	def test_hungarian_algorithm_sides_every_path(self):
+		# Two components: by default x1 and y2 go left
+		G = {'x1': {'y1': 5}, 'y2': {'x2': 3}}
+		U = {'x1': {'y1'}, 'y2': {'x2'}}
+		for kwargs in ({}, {'sparse': True}, {'components': True}, {'method': 'auction'}):
+			self.assertEqual(set(find_matching(G, 'min', left = ['x1', 'x2'], **kwargs)),
+							 {(('x1', 'y2'), 0), (('x2', 'y1'), 0)})
+			self.assertEqual(find_matching(G, 'min', right = ['y1', 'y2'], **kwargs),
+							 find_matching(G, 'min', left = ['x1', 'x2'], **kwargs))
+			with self.assertRaises(ValueError):
+				find_matching(G, left = ['x1'], right = ['y1', 'y2'], **kwargs)
+		self.assertEqual(set(find_matching(G, 'bottleneck', left = ['x1', 'x2'])),
+						 {(('x1', 'y2'), 0), (('x2', 'y1'), 0)})
+		self.assertEqual(set(find_matching(U, left = ['x1', 'x2'])), {(('x1', 'y1'), 1), (('y2', 'x2'), 1)})
+		with self.assertRaises(ValueError):
+			find_matching(U, left = ['x1'], right = ['y1', 'y2'])
+		# Both fall back to the sparse solver: too few pairs of weight 0
+		for kwargs in ({'components': True}, {'method': 'auction'}):
+			self.assertEqual(find_matching({'a': {'x': 5, 'y': 5}}, 'min', left = ['x', 'y'], **kwargs),
+							 find_matching({'a': {'x': 5, 'y': 5}}, 'min', left = ['x', 'y'], sparse = True))
+
+	def test_hungarian_algorithm_orientation_every_path(self):
+		# Pairs keep the direction their edge was given in
+		G = {'x1': {'y1': 1}, 'y2': {'x2': 2}, 'x2': {'y1': 1}}
+		for matching_type, expected in (('max', {(('x1', 'y1'), 1), (('y2', 'x2'), 2)}),
+										('min', {(('x1', 'y2'), 0), (('x2', 'y1'), 1)})):
+			for kwargs in ({}, {'sparse': True}, {'components': True}, {'method': 'auction'}):
+				self.assertEqual(set(find_matching(G, matching_type, **kwargs)), expected)
+		self.assertEqual(set(find_matching(G, 'bottleneck')), {(('x1', 'y2'), 0), (('x2', 'y1'), 1)})
+		self.assertEqual(set(find_matching({'x1': {'y1'}, 'y2': {'x2'}, 'x2': {'y1'}})),
+						 {(('x1', 'y1'), 1), (('y2', 'x2'), 1)})
+
+	def check_initial_matching(self, _G):
+		G = Graph(_G)
+		start_vertex = list(G.vertices.keys())[0]
+		G.make_complete_bipartite(start_vertex)
+		G.generate_feasible_labeling(start_vertex)
+		left = [v for v in G.vertices if G.vertices[v].in_left]
+		right = [v for v in G.vertices if not G.vertices[v].in_left]
+		rows, cols = (left, right) if len(left) <= len(right) else (right, left)
+		row_mate, col_mate = initial_matching(G, rows, cols)
+
+		label = lambda v: G.vertices[v].label
+		for x in rows:
+			for y in cols:
+				self.assertGreaterEqual(label(x) + label(y), G.vertices[x].get_edge(y).weight)
+		for x, y in row_mate.items():
+			self.assertEqual(label(x) + label(y), G.vertices[x].get_edge(y).weight)
+			self.assertEqual(col_mate[y], x)
+		if len(rows) < len(cols):
+			# Columns left unmatched can't carry a label
+			for y in cols:
+				if y not in col_mate:
+					self.assertEqual(label(y), 0)
+
+		return row_mate
+
+	def test_initial_matching_square(self):
+		self.assertEqual(len(self.check_initial_matching(ex_N)), 6)
+		self.check_initial_matching(ex_L)
+
+	def test_initial_matching_rectangular(self):
+		self.check_initial_matching(ex_R)
+		self.check_initial_matching(ex_Q)
+
+	def test_hungarian_algorithm_nan(self):
+		with self.assertRaises(ValueError):
+			find_matching({'x1': {'y1': float('nan')}})
+
 if __name__ == '__main__':
     unittest.main()
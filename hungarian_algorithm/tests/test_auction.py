@@ -0,0 +1,137 @@
+'''
+    File name: test_auction.py
+    Description: Tests for the auction solver.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..events import MatchingStats
+from .. import auction
+from ..auction import *
+import random
+import unittest
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+ex_G = {
+	'a': {'b': 2, 'c': 7, 'e': 1},
+	'd': {'b': 5}
+}
+
+ex_L = {
+	'Ann': {'RB': 3, 'CAM': 2, 'GK': 1},
+	'Ben': {'LW': 3, 'S': 2, 'CM': 1},
+	'Cal': {'CAM': 3, 'RW': 2, 'SWP': 1},
+	'Dan': {'S': 3, 'LW': 2, 'GK': 1},
+	'Ela': {'GK': 3, 'LW': 2, 'F': 1},
+	'Fae': {'CM': 3, 'GK': 2, 'CAM': 1},
+	'Gio': {'GK': 3, 'CM': 2, 'S': 1},
+	'Hol': {'CAM': 3, 'F': 2, 'SWP': 1},
+	'Ian': {'S': 3, 'RW': 2, 'RB': 1},
+	'Jon': {'F': 3, 'LW': 2, 'CB': 1},
+	'Kay': {'GK': 3, 'RW': 2, 'LW': 1, 'LB': 0}
+}
+
+ex_N = {
+	'A': { '#191': 22, '#122': 14, '#173': 120, '#121': 21, '#128': 4, '#104': 51 },
+	'B': { '#191': 19, '#122': 12, '#173': 172, '#121': 21, '#128': 28, '#104': 43 },
+	'C': { '#191': 161, '#122': 122, '#173': 2, '#121': 50, '#128': 128, '#104': 39 },
+	'D': { '#191': 19, '#122': 22, '#173': 90, '#121': 11, '#128': 28, '#104': 4 },
+	'E': { '#191': 1, '#122': 30, '#173': 113, '#121': 14, '#128': 28, '#104': 86 },
+	'F': { '#191': 60, '#122': 70, '#173': 170, '#121': 28, '#128': 68, '#104': 104 },
+}
+
+ex_T = {
+	'x1': {'y1': 5},
+	'x2': {'y1': 6, 'y2': 2}
+}
+
+ex_U = {
+	'x1': {'y1': -2},
+	'x2': {'y1': 7, 'y2': 9},
+	'x3': {'y3': 4}
+}
+
+def random_graph(n, degree, seed, weight):
+	rng = random.Random(seed)
+	return dict(('a%d' % i, dict(('b%d' % rng.randrange(n), weight(rng)) for _ in range(degree)))
+				for i in range(n))
+
+class TestAuction(unittest.TestCase):
+
+	def test_auction_max(self):
+		self.assertEqual(set(find_matching(ex_G, method = 'auction')),
+						 {(('a', 'c'), 7), (('d', 'b'), 5)})
+		self.assertEqual(find_matching(ex_L, return_type = 'total', method = 'auction'), 24)
+
+	def test_auction_min(self):
+		self.assertEqual(find_matching(ex_N, 'min', 'total', method = 'auction'),
+						 find_matching(ex_N, 'min', 'total'))
+
+	def test_auction_forbidden(self):
+		self.assertEqual(set(find_matching(ex_T, method = 'auction', missing = 'forbidden')),
+						 {(('x1', 'y1'), 5), (('x2', 'y2'), 2)})
+
+	def test_auction_zero_pairs(self):
+		self.assertEqual(set(find_matching(ex_U, matching_type = 'min', method = 'auction')),
+						 {(('x1', 'y1'), -2), (('x2', 'y3'), 0), (('x3', 'y2'), 0)})
+
+	def test_auction_random(self):
+		for seed in range(3):
+			G = random_graph(60, 3, seed, lambda rng: rng.randint(-20, 50))
+			for mt in ('max', 'min'):
+				self.assertEqual(find_matching(G, mt, 'total', method = 'auction'),
+								 find_matching(G, mt, 'total', sparse = True))
+
+	def test_auction_float(self):
+		G = random_graph(60, 3, 0, lambda rng: rng.uniform(0, 10))
+		self.assertAlmostEqual(find_matching(G, 'max', 'total', method = 'auction', epsilon = 1e-6),
+							   find_matching(G, 'max', 'total', sparse = True), delta = 120 * 1e-6)
+
+	def test_auction_events(self):
+		stats = MatchingStats()
+		find_matching(ex_L, method = 'auction', on_event = stats)
+		self.assertGreater(stats.counts['scaling_phase'], 1)
+		self.assertIn('augmentation', stats.phases)
+
+	def test_auction_not_bipartite(self):
+		self.assertFalse(find_matching({'x': {'y': 1, 'z': 1}, 'y': {'z': 1}}, method = 'auction'))
+
+	def test_auction_invalid(self):
+		with self.assertRaises(ValueError):
+			find_matching(ex_G, method = 'simplex')
+		with self.assertRaises(ValueError):
+			find_matching(ex_G, method = 'auction', bidding = 'english')
+
+	def test_auction_bottleneck(self):
+		G = {'a': {'x': 1, 'y': 10}, 'b': {'x': 6, 'y': 6}}
+		self.assertEqual(set(find_matching(G, 'bottleneck')), {(('a', 'x'), 1), (('b', 'y'), 6)})
+		with self.assertRaises(ValueError):
+			find_matching(G, 'bottleneck', method = 'auction')
+
+	def test_epsilon_schedule(self):
+		self.assertEqual(epsilon_schedule([0, 30, -4], 3, 0), (4, [25, 5, 1]))
+		self.assertEqual(epsilon_schedule([0, 2.5], 2, 0.1), (1, [0.5, 0.1]))
+
+	@unittest.skipIf(np is None, 'numpy is not installed')
+	def test_auction_jacobi(self):
+		minimum = auction.JACOBI_MIN_BIDDERS
+		auction.JACOBI_MIN_BIDDERS = 0
+		try:
+			for seed in range(3):
+				G = random_graph(60, 3, seed, lambda rng: rng.randint(-20, 50))
+				for mt in ('max', 'min'):
+					self.assertEqual(find_matching(G, mt, 'total', method = 'auction', bidding = 'jacobi'),
+									 find_matching(G, mt, 'total', sparse = True))
+		finally:
+			auction.JACOBI_MIN_BIDDERS = minimum
+
+if __name__ == '__main__':
+    unittest.main()
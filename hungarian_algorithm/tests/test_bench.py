@@ -0,0 +1,79 @@
+'''
+    File name: test_bench.py
+    Description: Tests for the find_matching benchmarks.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..bench import *
+import json
+import os
+import random
+import tempfile
+import unittest
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+class TestBench(unittest.TestCase):
+
+	def test_instances_seeded(self):
+		for kind in INSTANCES:
+			self.assertEqual(INSTANCES[kind](random.Random(3), 6),
+							 INSTANCES[kind](random.Random(3), 6))
+
+	def test_unbalanced_shape(self):
+		G = unbalanced(random.Random(0), 8)
+		self.assertEqual((len(G), len(G['x0'])), (2, 8))
+
+	def test_time_phases(self):
+		phases, counts = time_phases(dense_int(random.Random(0), 5))
+		self.assertEqual(set(phases), {'construction', 'completion', 'labeling',
+									   'initial_matching', 'augmentation', 'total'})
+
+	def test_scaling_exponent(self):
+		self.assertAlmostEqual(scaling_exponent([10, 20, 40], [1, 8, 64]), 3)
+
+	def test_run(self):
+		report = run(['dense_int', 'ties'], [4, 8], repeat = 1)
+		self.assertEqual([(r['kind'], r['n']) for r in report['results']],
+						 [('dense_int', 4), ('dense_int', 8), ('ties', 4), ('ties', 8)])
+		self.assertTrue(all(r['peak_memory_bytes'] > 0 for r in report['results']))
+
+	def test_float_int_ratio(self):
+		report = run(['dense_int', 'dense_float'], [4], repeat = 1, memory = False)
+		self.assertEqual(list(report['float_int_ratio']), [4])
+		self.assertNotIn('float_int_ratio', run(['dense_int'], [4], repeat = 1, memory = False))
+
+	def test_main_output(self):
+		with tempfile.TemporaryDirectory() as d:
+			path = os.path.join(d, 'bench.json')
+			main(['--kinds', 'sparse', '--sizes', '4', '--repeat', '1', '--output', path])
+			with open(path) as f:
+				report = json.load(f)
+		self.assertEqual(report['results'][0]['kind'], 'sparse')
+
+	@unittest.skipIf(np is None, 'numpy is not installed')
+	def test_run_matrix(self):
+		results = run_matrix([6], memory = False)
+		self.assertEqual([r['mode'] for r in results], ['mapped', 'memory'])
+		self.assertEqual(results[1]['cost_bytes_read'], 6 * 6 * 4)
+		self.assertTrue(all(r['seconds'] >= 0 for r in results))
+
+	@unittest.skipIf(np is None, 'numpy is not installed')
+	def test_main_matrix(self):
+		with tempfile.TemporaryDirectory() as d:
+			path = os.path.join(d, 'bench.json')
+			main(['--matrix-sizes', '4', '--output', path, '--directory', d])
+			with open(path) as f:
+				report = json.load(f)
+		self.assertEqual([r['n'] for r in report['matrix']], [4, 4])
+		self.assertIn('peak_memory_bytes', report['matrix'][0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+'''
+    File name: test_bottleneck.py
+    Description: Tests for the bottleneck assignment solver.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..compact import CompactGraph
+from ..events import MatchingStats
+from ..bottleneck import *
+from ..cardinality import hopcroft_karp
+import unittest
+
+ex_N = {
+	'A': { '#191': 22, '#122': 14, '#173': 120, '#121': 21, '#128': 4, '#104': 51 },
+	'B': { '#191': 19, '#122': 12, '#173': 172, '#121': 21, '#128': 28, '#104': 43 },
+	'C': { '#191': 161, '#122': 122, '#173': 2, '#121': 50, '#128': 128, '#104': 39 },
+	'D': { '#191': 19, '#122': 22, '#173': 90, '#121': 11, '#128': 28, '#104': 4 },
+	'E': { '#191': 1, '#122': 30, '#173': 113, '#121': 14, '#128': 28, '#104': 86 },
+	'F': { '#191': 60, '#122': 70, '#173': 170, '#121': 28, '#128': 68, '#104': 104 },
+}
+
+ex_S = {
+	'x1': {'y1': 4, 'y2': 9},
+	'x2': {'y2': 7},
+	'x3': {'y2': 3}
+}
+
+class TestBottleneck(unittest.TestCase):
+
+	def test_bottleneck(self):
+		M = find_matching(ex_N, 'bottleneck')
+		self.assertEqual(len(M), 6)
+		self.assertEqual(max(w for e, w in M), 28)
+		self.assertEqual(find_matching(ex_N, 'bottleneck', 'total'), 28)
+
+	def test_bottleneck_zero_pairs(self):
+		M = find_matching(ex_S, 'bottleneck')
+		self.assertEqual((len(M), max(w for e, w in M)), (2, 3))
+		self.assertIn((('x3', 'y2'), 3), M)
+
+	def test_bottleneck_forbidden(self):
+		self.assertEqual(set(find_matching(ex_S, 'bottleneck', missing = 'forbidden')),
+						 {(('x1', 'y1'), 4), (('x3', 'y2'), 3)})
+
+	def test_bottleneck_negative(self):
+		G = {'x1': {'y1': -5, 'y2': -1}, 'x2': {'y1': -2, 'y2': -4}}
+		self.assertEqual(find_matching(G, 'bottleneck', 'total'), -4)
+		self.assertEqual(find_matching({'x1': {'y1': -5}, 'x2': {'y1': -2}}, 'bottleneck', 'total'), -5)
+
+	def test_bottleneck_thresholds(self):
+		stats = MatchingStats()
+		solve_bottleneck(CompactGraph(ex_N), on_event = stats)
+		self.assertLessEqual(stats.counts['threshold'], 6)
+
+	def test_threshold_graph(self):
+		edges = [[(0, 3), (1, -1)], [(2, 5)]]
+		self.assertEqual(threshold_graph(edges, 3), [[0, 1], []])
+		self.assertEqual(threshold_graph(edges, -1), [[1], []])
+
+	def test_augment_absent(self):
+		edges = [[(0, 3), (1, -1)], [(0, 1), (1, 1), (2, 5)], [(0, 2)]]
+		adj = threshold_graph(edges, 3)
+		mate_a, mate_b = [-1] * 3, [-1] * 3
+		self.assertEqual(hopcroft_karp(adj, 3, mate_a, mate_b), 2)
+		self.assertEqual(augment_absent(edges, adj, 3, mate_a, mate_b), 3)
+		self.assertEqual(sorted(mate_a), [0, 1, 2])
+		# Pair (1, 2) weighs 5, over the threshold
+		self.assertNotEqual(mate_a[1], 2)
+
+	def test_bottleneck_not_bipartite(self):
+		self.assertFalse(find_matching({'x': {'y': 1, 'z': 1}, 'y': {'z': 1}}, 'bottleneck'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+'''
+    File name: test_cache.py
+    Description: Tests for the result cache.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..compact import CompactGraph
+from ..cache import *
+import pickle
+import tempfile
+import unittest
+
+ex_H = {
+	'x1': {'y1': 1, 'y2': 6},
+	'x2': {'y2': 8, 'y3': 6},
+	'x3': {'y1': 4, 'y3': 1}
+}
+
+# ex_H listed in another order
+ex_H2 = {
+	'x3': {'y3': 1, 'y1': 4},
+	'x2': {'y3': 6, 'y2': 8},
+	'x1': {'y2': 6, 'y1': 1}
+}
+
+ex_X = {
+	'x': {'y', 'z'},
+	'y': {'x', 'z'},
+	'z': {'x', 'y'}
+}
+
+class TestCache(unittest.TestCase):
+
+	def test_fingerprint_order(self):
+		self.assertEqual(fingerprint(ex_H), fingerprint(ex_H2))
+		self.assertEqual(fingerprint(ex_H), fingerprint(CompactGraph(ex_H)))
+
+	def test_fingerprint_differs(self):
+		self.assertNotEqual(fingerprint(ex_H), fingerprint({**ex_H, 'x3': {'y1': 4, 'y3': 2}}))
+		self.assertNotEqual(fingerprint({1: {2: 1}}), fingerprint({'1': {'2': 1}}))
+		self.assertNotEqual(fingerprint({'a': {'b': 1}}), fingerprint({'a': {'b': 1.0}}))
+
+	def test_fingerprint_last_wins(self):
+		self.assertEqual(fingerprint({'a': {'b': 1}, 'b': {'a': 2}}), fingerprint({'a': {}, 'b': {'a': 2}}))
+
+	def test_fingerprint_direction(self):
+		self.assertNotEqual(fingerprint({'x1': {'y1': 1}}), fingerprint({'y1': {'x1': 1}}))
+		self.assertEqual(fingerprint({'y1': {'x1': 1}}), fingerprint(CompactGraph({'y1': {'x1': 1}})))
+
+	def test_cache_direction(self):
+		cache = MatchingCache()
+		for G in ({'x1': {'y1': 1}}, {'y1': {'x1': 1}}, {'x1': {'y1': 1}, 'y2': {'x2': 3}}):
+			self.assertEqual(cache.find_matching(G), find_matching(G))
+			self.assertEqual(cache.find_matching(G), find_matching(G))
+		self.assertEqual(cache.hits, 3)
+
+	def test_cache_unweighted(self):
+		S = {'L0': {'R0', 'R1'}, 'L1': {'R0'}}
+		W = {'L0': {'R0': 1, 'R1': 1}, 'L1': {'R0': 1}}
+		self.assertNotEqual(fingerprint(S), fingerprint(W))
+		cache = MatchingCache()
+		for G in (S, W, S, W):
+			self.assertEqual(cache.find_matching(G, 'min', 'total'), find_matching(G, 'min', 'total'))
+		self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+	def test_cache_side_hints(self):
+		cache = MatchingCache()
+		for kwargs in ({'left': ['x1', 'x2', 'x3']}, {'left': {'x3', 'x2', 'x1'}}, {'right': ('y1', 'y2', 'y3')}):
+			self.assertEqual(cache.find_matching(ex_H, **kwargs), find_matching(ex_H, **kwargs))
+		self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+	def test_cache_hits(self):
+		cache = MatchingCache()
+		self.assertEqual(cache.find_matching(ex_H), find_matching(ex_H))
+		self.assertEqual(set(cache.find_matching(ex_H2)), set(find_matching(ex_H)))
+		self.assertEqual(cache.find_matching(ex_H, 'min', 'total'), find_matching(ex_H, 'min', 'total'))
+		self.assertEqual(cache.find_matching(ex_H, sparse = True), find_matching(ex_H, sparse = True))
+		self.assertEqual(cache.info(), {'hits': 1, 'misses': 3, 'evictions': 0, 'entries': 3,
+										'bytes': cache.nbytes})
+
+	def test_cache_copy(self):
+		cache = MatchingCache()
+		cache.find_matching(ex_H).clear()
+		self.assertEqual(len(cache.find_matching(ex_H)), 3)
+
+	def test_cache_not_bipartite(self):
+		cache = MatchingCache()
+		self.assertFalse(cache.find_matching(ex_X))
+		self.assertFalse(cache.find_matching(ex_X))
+		self.assertEqual(cache.hits, 1)
+
+	def test_cache_maxsize(self):
+		cache = MatchingCache(maxsize = 2)
+		for mt in ('max', 'min', 'max'):
+			cache.find_matching(ex_H, mt, 'total')
+		cache.find_matching(ex_H, 'max', 'list')
+		self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 3, 1))
+		self.assertEqual(list(cache.entries), [cache.key(ex_H, 'max', 'total', {}),
+											   cache.key(ex_H, 'max', 'list', {})])
+
+	def test_cache_maxbytes(self):
+		size = len(pickle.dumps(find_matching(ex_H), pickle.HIGHEST_PROTOCOL))
+		cache = MatchingCache(maxsize = None, maxbytes = size)
+		cache.find_matching(ex_H, return_type = 'total')
+		cache.find_matching(ex_H, return_type = 'list')
+		self.assertEqual((cache.nbytes, len(cache.entries), cache.evictions), (size, 1, 1))
+
+	def test_cache_disk(self):
+		with tempfile.TemporaryDirectory() as path:
+			MatchingCache(path = path).find_matching(ex_H, return_type = 'total')
+			cache = MatchingCache(path = path)
+			self.assertEqual(cache.find_matching(ex_H2, return_type = 'total'), 16)
+			self.assertEqual((cache.hits, cache.misses), (1, 0))
+			cache.clear()
+			self.assertEqual(cache.find_matching(ex_H, return_type = 'total'), 16)
+			self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+if __name__ == '__main__':
+    unittest.main()
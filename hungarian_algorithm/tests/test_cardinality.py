@@ -0,0 +1,77 @@
+'''
+    File name: test_cardinality.py
+    Description: Tests for maximum-cardinality matching.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..cardinality import *
+from ..compact import CompactGraph
+from ..events import MatchingStats
+import unittest
+
+# Eligible shifts of each worker
+ex_U = {
+	'Ann': {'Mon', 'Tue'},
+	'Ben': {'Mon'},
+	'Cal': {'Mon'},
+	'Dan': {'Tue', 'Wed'}
+}
+
+class TestCardinality(unittest.TestCase):
+
+	def test_hopcroft_karp(self):
+		adj = [[0, 1], [0], [1, 2], [2]]
+		mate_a = [-1] * 4
+		mate_b = [-1] * 3
+		self.assertEqual(hopcroft_karp(adj, 3, mate_a, mate_b), 3)
+		self.assertTrue(all(mate_b[b] == a for a, b in enumerate(mate_a) if b != -1))
+
+	def test_hopcroft_karp_long_path(self):
+		# Only an augmenting path through every vertex completes the matching
+		n = 2000
+		adj = [[a - 1, a] if a else [0] for a in range(n)]
+		mate_a = list(range(-1, n - 1))
+		mate_b = list(range(1, n)) + [-1]
+		self.assertEqual(hopcroft_karp(adj, n, mate_a, mate_b), n)
+		self.assertEqual(mate_a, list(range(n)))
+
+	def test_hopcroft_karp_empty(self):
+		self.assertEqual(hopcroft_karp([[], []], 2), 0)
+		self.assertEqual(hopcroft_karp([], 0), 0)
+
+	def test_unweighted_detected(self):
+		self.assertTrue(is_unweighted(ex_U))
+		self.assertTrue(is_unweighted(CompactGraph(ex_U)))
+		self.assertFalse(is_unweighted({'a': {'b': 1}}))
+
+	def test_unweighted(self):
+		M = find_matching(ex_U)
+		self.assertEqual(len(M), 3)
+		self.assertEqual(sum(w for e, w in M), 3)
+		self.assertEqual(set(e[1] for e, w in M), {'Mon', 'Tue', 'Wed'})
+		self.assertEqual(find_matching(ex_U, return_type = 'total'),
+						 find_matching(ex_U, return_type = 'total', scale = 1))
+
+	def test_unweighted_leftovers(self):
+		G = {'a': {'x'}, 'b': {'x'}, 'c': {'y', 'z'}, 'd': set()}
+		M = solve_unweighted(G)
+		self.assertEqual(sorted(w for e, w in M), [0, 1, 1])
+		self.assertEqual(solve_unweighted(G, 'total', 'forbidden'), 2)
+		self.assertEqual(len(find_matching(G, sparse = True, missing = 'forbidden')), 2)
+
+	def test_unweighted_events(self):
+		stats = MatchingStats()
+		find_matching(ex_U, on_event = stats)
+		self.assertEqual(stats.counts['augmentation'], 3)
+		self.assertNotIn('completion', stats.phases)
+
+	def test_unweighted_not_bipartite(self):
+		self.assertFalse(find_matching({'x': {'y', 'z'}, 'y': {'z'}}))
+
+if __name__ == '__main__':
+    unittest.main()
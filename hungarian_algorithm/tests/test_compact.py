@@ -0,0 +1,135 @@
+'''
+    File name: test_compact.py
+    Description: Tests for the compact CSR graph representation.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import Graph, find_matching
+from ..compact import *
+from array import array
+import unittest
+
+ex_G = {
+	'a': {'b': 2, 'c': 7, 'e': 1},
+	'd': {'b': 5}
+}
+
+ex_H = {
+	'x1': {'y1': 1, 'y2': 6},
+	'x2': {'y2': 8, 'y3': 6},
+	'x3': {'y1': 4, 'y3': 1}
+}
+
+ex_X = {
+	'x': {'y', 'z'},
+	'y': {'x', 'z'},
+	'z': {'x', 'y'}
+}
+
+class TestCompact(unittest.TestCase):
+
+	def test_compact1(self):
+		CG = CompactGraph(ex_G)
+		self.assertEqual((CG.keys, list(CG.offsets), list(CG.targets), list(CG.weights)),
+						 (['a', 'b', 'c', 'e', 'd'], [0, 3, 5, 6, 7, 8],
+						  [1, 2, 3, 0, 4, 0, 0, 1], [2, 7, 1, 2, 5, 7, 1, 5]))
+
+	def test_compact_sizes(self):
+		CG = CompactGraph(ex_H)
+		self.assertEqual((len(CG), CG.num_edges(), CG.degree(CG.ids['y2'])), (6, 6, 2))
+
+	def test_compact_both_directions(self):
+		CG = CompactGraph({'a': {'b': 3}, 'b': {'a': 4}})
+		self.assertEqual((CG.num_edges(), CG.get_weight(0, 1), CG.get_weight(1, 0)), (1, 4, 4))
+
+	def test_compact_unweighted(self):
+		CG = CompactGraph(ex_X)
+		self.assertEqual((CG.unweighted, CG.num_edges(), CG.get_weight(0, 1)), (True, 3, 1))
+		self.assertFalse(CompactGraph(ex_H).unweighted)
+
+	def test_compact_float_weights(self):
+		CG = CompactGraph({'a': {'b': 1, 'c': 2.5}})
+		self.assertEqual((CG.weights.typecode, CG.get_weight(0, 2)), ('d', 2.5))
+		self.assertEqual(CompactGraph(ex_H).weights.typecode, 'q')
+
+	def test_get_weight(self):
+		CG = CompactGraph(ex_G)
+		self.assertEqual((CG.get_weight(0, 2), CG.get_weight(2, 0), CG.get_weight(1, 2),
+						  CG.get_weight(1, 2, 0)), (7, 7, None, 0))
+
+	def test_neighbors(self):
+		CG = CompactGraph(ex_G)
+		self.assertEqual((list(CG.neighbors(1)), list(CG.edges(1))), ([0, 4], [(0, 2), (4, 5)]))
+
+	def test_to_dict(self):
+		self.assertEqual(CompactGraph(ex_G).to_dict(), {
+			'a': {'b': 2, 'c': 7, 'e': 1},
+			'b': {'a': 2, 'd': 5},
+			'c': {'a': 7},
+			'e': {'a': 1},
+			'd': {'b': 5}
+		})
+
+	def test_from_edges(self):
+		CG = CompactGraph.from_edges(['a', 'b', 'c'], array('q', [0, 2, 0]), array('q', [1, 1, 1]),
+									 array('q', [4, 6, 9]))
+		self.assertEqual(CG.to_dict(), {'a': {'b': 9}, 'b': {'a': 9, 'c': 6}, 'c': {'b': 6}})
+
+	def test_bipartition1(self):
+		self.assertEqual(CompactGraph(ex_G).bipartition(), [True, False, False, False, True])
+
+	def test_bipartition_disconnected(self):
+		self.assertEqual(CompactGraph({'a': {'b': 1}, 'c': {'d': 1}}).bipartition(),
+						 [True, False, True, False])
+
+	def test_bipartition_fail(self):
+		self.assertIsNone(CompactGraph(ex_X).bipartition())
+
+	def test_bipartition_hint(self):
+		self.assertEqual(CompactGraph(ex_G).bipartition(left = ['b', 'c', 'e']), [False, True, True, True, False])
+		self.assertEqual(CompactGraph(ex_G).bipartition(right = ['a', 'd']), [False, True, True, True, False])
+		with self.assertRaises(ValueError):
+			CompactGraph(ex_G).bipartition(left = ['a'], right = ['b', 'c', 'e'])
+
+	def test_graph_compact(self):
+		self.assertEqual(Graph(ex_H).compact().to_dict(), CompactGraph(ex_H).to_dict())
+
+	def test_graph_from_compact(self):
+		G = Graph(CompactGraph(ex_H))
+		self.assertEqual((len(G.vertices), G.vertices['x2'].get_edge('y3').weight), (6, 6))
+
+	def test_find_matching_compact(self):
+		CG = CompactGraph(ex_H)
+		self.assertEqual(find_matching(CG, return_type = 'total'), 16)
+		self.assertEqual(find_matching(CG, return_type = 'total', sparse = True), 16)
+
+	def test_oriented_edges(self):
+		CG = CompactGraph({'y1': {'x1': 3}, 'x2': {'y1': 1}, 'x1': {'y1': 4}})
+		self.assertEqual(sorted((CG.keys[a], CG.keys[b], w) for a, b, w in CG.oriented_edges()),
+						 [('x1', 'y1', 4), ('x2', 'y1', 1)])
+
+	def test_graph_from_compact_orientation(self):
+		G = Graph(CompactGraph({'y1': {'x1': 3}, 'x2': {'y1': 1}}))
+		self.assertEqual((G.vertices['x1'].get_edge('y1').vertices, list(G.vertices)),
+						 (('y1', 'x1'), ['y1', 'x1', 'x2']))
+		self.assertEqual(Graph(ex_H).compact().to_dict(), CompactGraph(ex_H).to_dict())
+		self.assertEqual(list(Graph({'y': {'x': 1}}).compact().oriented_edges()), [(0, 1, 1)])
+
+	def test_find_matching_compact_same_output(self):
+		for G in (ex_H, {'x': {'y': 1}}, {'y1': {'x1': 2}, 'x2': {'y1': 5, 'y2': 1}},
+				  {'a': {'b': 1.5}, 'b': {'a': 2.5}}):
+			for kwargs in ({}, {'matching_type': 'min'}, {'scale': 10}, {'epsilon': 0.1}):
+				self.assertEqual(find_matching(CompactGraph(G), **kwargs), find_matching(G, **kwargs))
+
+	def test_nbytes(self):
+		n = 200
+		CG = CompactGraph(dict(('x%d' % i, dict(('y%d' % j, i * j) for j in range(n)))
+							   for i in range(n)))
+		self.assertEqual(CG.nbytes(), 8 * (2 * n + 1) + 13 * 2 * n * n)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+'''
+    File name: test_components.py
+    Description: Tests for the connected-component solver.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..compact import CompactGraph
+from ..components import *
+from ..events import MatchingStats
+import unittest
+
+ex_U = {
+	'x1': {'y1': -2},
+	'x2': {'y1': 7, 'y2': 9},
+	'x3': {'y3': 4}
+}
+
+ex_V = {
+	'a1': {'b1': 3, 'b2': 1},
+	'a2': {'b1': 2, 'b2': 5},
+	'c1': {'d1': 4},
+	'e1': {'f1': 6, 'f2': 2},
+	'e2': {'f1': 7}
+}
+
+ex_X = {
+	'x': {'y', 'z'},
+	'y': {'x', 'z'},
+	'z': {'x', 'y'}
+}
+
+class TestComponents(unittest.TestCase):
+
+	def test_components(self):
+		self.assertEqual(CompactGraph(ex_V).components(),
+						 ([0, 0, 0, 0, 1, 1, 2, 2, 2, 2], 3))
+
+	def test_components_max(self):
+		self.assertEqual(set(find_matching(ex_V, components = True)),
+						 {(('a1', 'b1'), 3), (('a2', 'b2'), 5), (('c1', 'd1'), 4),
+						  (('e1', 'f2'), 2), (('e2', 'f1'), 7)})
+
+	def test_components_disconnected(self):
+		self.assertEqual(find_matching(ex_U, return_type = 'total', components = True), 11)
+		self.assertEqual(find_matching(ex_U, 'min', 'total', components = True), -2)
+
+	def test_components_across(self):
+		# x1 is better off paired with y3 (weight 0) in another component
+		M = find_matching(ex_U, 'min', components = True)
+		self.assertEqual((len(M), sum(e[1] for e in M)), (3, -2))
+		self.assertIn((('x1', 'y1'), -2), M)
+
+	def test_components_forbidden(self):
+		self.assertEqual(set(find_matching(ex_U, 'min', components = True, missing = 'forbidden')),
+						 {(('x1', 'y1'), -2), (('x2', 'y2'), 9), (('x3', 'y3'), 4)})
+
+	def test_components_fallback(self):
+		# Nothing to pair x1 with at weight 0
+		self.assertEqual(find_matching({'x1': {'y1': 5}}, 'min', components = True),
+						 [(('x1', 'y1'), 5)])
+
+	def test_components_workers(self):
+		self.assertEqual(find_matching(ex_V, 'min', 'total', components = True, workers = 2),
+						 find_matching(ex_V, 'min', 'total', sparse = True))
+
+	def test_components_events(self):
+		stats = MatchingStats()
+		find_matching(ex_V, return_type = 'total', components = True, on_event = stats)
+		self.assertEqual(list(stats.phases), ['construction', 'labeling', 'augmentation'])
+		self.assertEqual(stats.counts['augmentation'], 5)
+
+	def test_components_fail(self):
+		self.assertFalse(find_matching(ex_X, components = True))
+
+	def test_fill_unpaired(self):
+		CG = CompactGraph({'a': {'b': 1}, 'c': {'d': 1}})
+		self.assertEqual(fill_unpaired(CG, [0], [1, 3], [0, 0, 1, 1]), [(0, 3, 0)])
+		self.assertIsNone(fill_unpaired(CG, [0], [1], [0, 0, 1, 1]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+'''
+    File name: test_events.py
+    Description: Tests for find_matching events and statistics.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..events import MatchingStats, report_phase
+import time
+import unittest
+
+ex_J = {
+	'x1': {'y1': 7, 'y2': 1, 'y5': 3},
+	'x2': {'y1': 8, 'y2': 7, 'y5': 5},
+	'x3': {'y2': 9, 'y3': 2},
+	'x4': {'y2': 10, 'y3': 1, 'y4': 8, 'y5': 6},
+	'x5': {'y4': 7, 'y5': 3}
+}
+
+# Needs an augmenting tree after the initial matching
+ex_K = {
+	'x0': {'y0': 7, 'y1': 2, 'y2': 8, 'y3': 3, 'y4': 5},
+	'x1': {'y0': 4, 'y1': 5, 'y2': 0, 'y3': 7, 'y4': 5},
+	'x2': {'y0': 5, 'y1': 1, 'y2': 6, 'y3': 7, 'y4': 5},
+	'x3': {'y0': 2, 'y1': 5, 'y2': 0, 'y3': 8, 'y4': 1},
+	'x4': {'y0': 2, 'y1': 5, 'y2': 0, 'y3': 6, 'y4': 2}
+}
+
+class TestEvents(unittest.TestCase):
+
+	def test_report_phase(self):
+		events = []
+		report_phase(lambda event, value: events.append((event, value[0])),
+					 'labeling', time.perf_counter())
+		self.assertEqual(events, [('phase', 'labeling')])
+
+	def test_stats_phases(self):
+		stats = MatchingStats()
+		find_matching(ex_J, on_event = stats)
+		self.assertEqual(set(stats.phases), {'construction', 'completion', 'labeling',
+											 'initial_matching', 'augmentation'})
+
+	def test_stats_counts(self):
+		stats = MatchingStats()
+		find_matching(ex_K, on_event = stats)
+		self.assertEqual(stats.counts['dual_update'], len(stats.alphas))
+		self.assertTrue(stats.counts['augmentation'] >= 1
+						and all(alpha > 0 for alpha in stats.alphas))
+
+	def test_stats_same_result(self):
+		self.assertEqual(set(find_matching(ex_J, on_event = MatchingStats())),
+						 set(find_matching(ex_J)))
+
+	def test_stats_sparse(self):
+		stats = MatchingStats()
+		find_matching(ex_J, sparse = True, on_event = stats)
+		self.assertEqual((set(stats.phases), stats.counts['augmentation']),
+						 ({'construction', 'labeling', 'augmentation'}, 5))
+
+	def test_on_event_callable(self):
+		events = []
+		find_matching(ex_J, on_event = lambda event, value: events.append(event))
+		self.assertEqual((events[0], events[-1]), ('phase', 'phase'))
+
+	def test_as_dict(self):
+		stats = MatchingStats()
+		find_matching(ex_J, on_event = stats)
+		self.assertEqual(set(stats.as_dict()), {'phases', 'counts', 'alphas'})
+
+if __name__ == '__main__':
+    unittest.main()
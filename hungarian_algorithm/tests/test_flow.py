@@ -0,0 +1,80 @@
+'''
+    File name: test_flow.py
+    Description: Tests for the capacitated assignment solver.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..compact import CompactGraph
+from ..events import MatchingStats
+from ..flow import *
+import unittest
+
+ex_H = {
+	'x1': {'y1': 1, 'y2': 6},
+	'x2': {'y2': 8, 'y3': 6},
+	'x3': {'y1': 4, 'y3': 1}
+}
+
+# Workers and shifts
+ex_W = {
+	'Ann': {'Mon': 5, 'Tue': 3},
+	'Ben': {'Mon': 4, 'Wed': 1},
+	'Cal': {'Mon': 2, 'Tue': 6},
+	'Dan': {'Tue': 1, 'Wed': 2}
+}
+
+ex_T = {
+	'x1': {'y1': 5},
+	'x2': {'y1': 6, 'y2': 2}
+}
+
+class TestFlow(unittest.TestCase):
+
+	def test_unit_capacities(self):
+		self.assertEqual(set(find_capacitated_matching(ex_H)), set(find_matching(ex_H)))
+		self.assertEqual(find_capacitated_matching(ex_H, matching_type = 'min', return_type = 'total'),
+						 find_matching(ex_H, 'min', 'total', sparse = True, missing = 'forbidden'))
+
+	def test_cardinality_first(self):
+		self.assertEqual(set(find_capacitated_matching(ex_T)), {(('x1', 'y1'), 5), (('x2', 'y2'), 2)})
+
+	def test_many_to_one(self):
+		M = find_capacitated_matching(ex_W, {'Mon': 2, 'Tue': 2})
+		self.assertEqual(set(M), {(('Ann', 'Mon'), 5), (('Ben', 'Mon'), 4),
+								  (('Cal', 'Tue'), 6), (('Dan', 'Wed'), 2)})
+
+	def test_many_to_many(self):
+		M = find_capacitated_matching(ex_W, {'Ann': 2, 'Mon': 3, 'Tue': 3, 'Wed': 0})
+		self.assertEqual(set(M), {(('Ann', 'Mon'), 5), (('Ann', 'Tue'), 3), (('Ben', 'Mon'), 4),
+								  (('Cal', 'Tue'), 6), (('Dan', 'Tue'), 1)})
+
+	def test_min(self):
+		self.assertEqual(find_capacitated_matching(ex_W, {'Mon': 3}, 'min', 'total'), 5 + 1 + 2 + 1)
+
+	def test_edges_used_once(self):
+		M = find_capacitated_matching({'a': {'b': 3}}, {'a': 5, 'b': 5})
+		self.assertEqual(M, [(('a', 'b'), 3)])
+
+	def test_compact_graph(self):
+		self.assertEqual(find_capacitated_matching(CompactGraph(ex_W), {'Mon': 2}, return_type = 'total'),
+						 find_capacitated_matching(ex_W, {'Mon': 2}, return_type = 'total'))
+
+	def test_events(self):
+		stats = MatchingStats()
+		find_capacitated_matching(ex_W, {'Mon': 2, 'Tue': 2}, on_event = stats)
+		self.assertEqual(stats.counts['augmentation'], 4)
+
+	def test_not_bipartite(self):
+		self.assertFalse(find_capacitated_matching({'x': {'y': 1, 'z': 1}, 'y': {'z': 1}}))
+
+	def test_negative_capacity(self):
+		with self.assertRaises(ValueError):
+			find_capacitated_matching(ex_W, {'Ann': -1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -58,6 +58,35 @@ class TestGraphMethods(unittest.TestCase):
 	def test_is_bipartite_fail2(self):
 		self.assertFalse(Graph(ex_Y).is_bipartite('x1'))
 
+	def test_bipartition(self):
+		left, right = Graph(ex_G).bipartition('a')
+		self.assertEqual((set(left), set(right)), ({'a', 'd'}, {'b', 'c', 'e'}))
+		left, right = Graph(ex_G).bipartition('b')
+		self.assertEqual((set(left), set(right)), ({'b', 'c', 'e'}, {'a', 'd'}))
+		self.assertIsNone(Graph(ex_Y).bipartition('x1'))
+
+	def test_bipartition_components(self):
+		G = Graph({'x1': {'y1': 1}, 'x2': {'y2': 2}, 'y3': {'x3': 3}})
+		left, right = G.bipartition('x1')
+		self.assertEqual((set(left), set(right)), ({'x1', 'x2', 'y3'}, {'y1', 'y2', 'x3'}))
+		self.assertFalse(G.vertices['x3'].in_left)
+
+	def test_bipartition_cached(self):
+		G = Graph(ex_H)
+		sides = G.bipartition('x1')
+		self.assertIs(G.bipartition('x2'), sides)
+		self.assertEqual(set(G.bipartition('y1')[0]), {'y1', 'y2', 'y3'})
+		G.add_edge('x4', 'y1', 1)
+		self.assertIn('x4', G.bipartition()[0])
+
+	def test_bipartition_hint(self):
+		G = Graph(ex_H)
+		self.assertEqual(G.bipartition(left = ['y1', 'y2', 'y3']), (['y1', 'y2', 'y3'], ['x1', 'x2', 'x3']))
+		self.assertEqual(G.bipartition('x1'), (['y1', 'y2', 'y3'], ['x1', 'x2', 'x3']))
+		self.assertEqual(Graph(ex_H).bipartition(right = ['x1', 'x2', 'x3'])[0], ['y1', 'y2', 'y3'])
+		with self.assertRaises(ValueError):
+			Graph(ex_H).bipartition(left = ['x1', 'x2'], right = ['y1', 'y2', 'y3'])
+
 	def test_make_complete_bipartite_single(self):
 		G = Graph({'a': {'b', 'd'}, 'c': {'d'}})
 		G.make_complete_bipartite('a')
@@ -218,5 +247,22 @@ class TestGraphMethods(unittest.TestCase):
 						and not eq_G.vertices['x2'].get_edge('y3')
 						and not eq_G.vertices['x3'].get_edge('y3'))
 
+	def test_get_edge1(self):
+		G = Graph(ex_H)
+		self.assertEqual(G.vertices['y2'].get_edge('x2').weight, 8)
+
+	def test_get_edge_missing(self):
+		G = Graph(ex_H)
+		self.assertFalse(G.vertices['x1'].get_edge('y3'))
+
+	def test_get_edge_shared(self):
+		G = Graph(ex_H)
+		self.assertIs(G.vertices['x1'].get_edge('y2'), G.vertices['y2'].get_edge('x1'))
+
+	def test_vertex_edge_slots(self):
+		G = Graph(ex_H)
+		self.assertFalse(hasattr(G.vertices['x1'], '__dict__')
+						 or hasattr(G.vertices['x1'].get_edge('y2'), '__dict__'))
+
 if __name__ == '__main__':
     unittest.main()
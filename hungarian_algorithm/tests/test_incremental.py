@@ -0,0 +1,105 @@
+'''
+    File name: test_incremental.py
+    Description: Tests for the warm-started incremental solver.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..incremental import IncrementalSolver
+import unittest
+
+ex_H = {
+	'x1': {'y1': 1, 'y2': 6},
+	'x2': {'y2': 8, 'y3': 6},
+	'x3': {'y1': 4, 'y3': 1}
+}
+
+exp_matching_H = {
+	(('x1', 'y2'), 6), 
+	(('x2', 'y3'), 6), 
+	(('x3', 'y1'), 4)
+}
+
+ex_N = {
+	'A': { '#191': 22, '#122': 14, '#173': 120, '#121': 21, '#128': 4, '#104': 51 },
+	'B': { '#191': 19, '#122': 12, '#173': 172, '#121': 21, '#128': 28, '#104': 43 },
+	'C': { '#191': 161, '#122': 122, '#173': 2, '#121': 50, '#128': 128, '#104': 39 },
+	'D': { '#191': 19, '#122': 22, '#173': 90, '#121': 11, '#128': 28, '#104': 4 },
+	'E': { '#191': 1, '#122': 30, '#173': 113, '#121': 14, '#128': 28, '#104': 86 },
+	'F': { '#191': 60, '#122': 70, '#173': 170, '#121': 28, '#128': 68, '#104': 104 },
+}
+
+class TestIncrementalSolver(unittest.TestCase):
+
+	def test_initial_max(self):
+		self.assertEqual(set(IncrementalSolver(ex_H).get_matching()), exp_matching_H)
+
+	def test_initial_min_total(self):
+		self.assertEqual(IncrementalSolver(ex_N, 'min').get_matching('total'), 51)
+
+	def test_update_weight_matched_down(self):
+		S = IncrementalSolver(ex_H)
+		S.update_weight('x1', 'y2', 0)
+		self.assertEqual(set(S.get_matching()),
+						 {(('x1', 'y3'), 0), (('x2', 'y2'), 8), (('x3', 'y1'), 4)})
+
+	def test_update_weight_unmatched_up(self):
+		S = IncrementalSolver(ex_H)
+		S.update_weight('y1', 'x1', 20)
+		self.assertEqual(S.get_matching('total'), 29)
+
+	def test_update_weight_matches_find_matching(self):
+		S = IncrementalSolver(ex_N, 'min')
+		S.update_weight('E', '#191', 90)
+		G = dict((k, dict(v)) for k, v in ex_N.items())
+		G['E']['#191'] = 90
+		self.assertEqual(S.get_matching('total'), find_matching(G, 'min', 'total'))
+
+	def test_update_weight_missing_pair(self):
+		with self.assertRaises(KeyError):
+			IncrementalSolver(ex_H).update_weight('x1', 'x2', 3)
+
+	def test_add_vertex_left(self):
+		S = IncrementalSolver(ex_H)
+		S.add_vertex('x4', {'y1': 9})
+		self.assertEqual(set(S.get_matching()), {(('x1', 'y2'), 6), (('x2', 'y3'), 6), (('x4', 'y1'), 9)})
+
+	def test_add_vertex_right(self):
+		S = IncrementalSolver(ex_H)
+		S.add_vertex('y4', {'x3': 7})
+		self.assertEqual(S.get_matching('total'), 19)
+
+	def test_add_vertex_then_fill(self):
+		S = IncrementalSolver(ex_H)
+		S.add_vertex('x4', {'y1': 9})
+		S.add_vertex('y4', {'x3': 7})
+		self.assertEqual((len(S.get_matching()), S.get_matching('total')), (4, 28))
+
+	def test_add_vertex_no_side(self):
+		with self.assertRaises(ValueError):
+			IncrementalSolver(ex_H).add_vertex('z')
+
+	def test_remove_vertex(self):
+		S = IncrementalSolver(ex_H)
+		S.remove_vertex('x2')
+		self.assertEqual(set(S.get_matching()), {(('x1', 'y2'), 6), (('x3', 'y1'), 4)})
+
+	def test_remove_vertex_right(self):
+		S = IncrementalSolver(ex_H)
+		S.remove_vertex('y2')
+		self.assertEqual(S.get_matching('total'), 10)
+
+	def test_remove_vertex_missing(self):
+		with self.assertRaises(KeyError):
+			IncrementalSolver(ex_H).remove_vertex('x9')
+
+	def test_not_bipartite(self):
+		with self.assertRaises(ValueError):
+			IncrementalSolver({'x': {'y': 1, 'z': 1}, 'y': {'z': 1}})
+
+if __name__ == '__main__':
+    unittest.main()
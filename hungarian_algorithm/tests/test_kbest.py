@@ -0,0 +1,76 @@
+'''
+    File name: test_kbest.py
+    Description: Tests for the k best matchings generator.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+import itertools
+import unittest
+
+try:
+	import numpy as np
+	from ..kbest import find_k_best_matchings
+except ImportError:
+	np = None
+
+ex_H = {
+	'x1': {'y1': 1, 'y2': 6},
+	'x2': {'y2': 8, 'y3': 6},
+	'x3': {'y1': 4, 'y3': 1}
+}
+
+ex_Q = {
+	'x1': {'y1': 4, 'y2': 1, 'y3': 3},
+	'x2': {'y1': 2, 'y2': 0, 'y3': 5}
+}
+
+ex_X = {
+	'x': {'y', 'z'},
+	'y': {'x', 'z'},
+	'z': {'x', 'y'}
+}
+
+def all_totals(G, rows, cols, reverse):
+	'''Total of every assignment of rows to cols, sorted.'''
+	return sorted((sum(G[x].get(y, 0) for x, y in zip(rows, perm))
+				   for perm in itertools.permutations(cols, len(rows))), reverse = reverse)
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestKBest(unittest.TestCase):
+
+	def test_k_best_first(self):
+		self.assertEqual(set(next(find_k_best_matchings(ex_H, 1))), set(find_matching(ex_H)))
+
+	def test_k_best_max(self):
+		self.assertEqual(list(find_k_best_matchings(ex_H, None, return_type = 'total')),
+						 all_totals(ex_H, ['x1', 'x2', 'x3'], ['y1', 'y2', 'y3'], True))
+
+	def test_k_best_min(self):
+		self.assertEqual(list(find_k_best_matchings(ex_H, 4, 'min', 'total')),
+						 all_totals(ex_H, ['x1', 'x2', 'x3'], ['y1', 'y2', 'y3'], False)[:4])
+
+	def test_k_best_rectangular(self):
+		self.assertEqual(list(find_k_best_matchings(ex_Q, None, return_type = 'total')),
+						 all_totals(ex_Q, ['x1', 'x2'], ['y1', 'y2', 'y3'], True))
+
+	def test_k_best_distinct(self):
+		matchings = [frozenset(M) for M in find_k_best_matchings(ex_H, None)]
+		self.assertEqual((len(matchings), len(set(matchings))), (6, 6))
+
+	def test_k_best_lazy(self):
+		gen = find_k_best_matchings(ex_H, 3, return_type = 'total')
+		self.assertEqual((next(gen), next(gen), next(gen)), (16, 12, 10))
+		with self.assertRaises(StopIteration):
+			next(gen)
+
+	def test_k_best_fail(self):
+		with self.assertRaises(ValueError):
+			next(find_k_best_matchings(ex_X, 2))
+
+if __name__ == '__main__':
+    unittest.main()
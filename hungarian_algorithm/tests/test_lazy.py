@@ -0,0 +1,110 @@
+'''
+    File name: test_lazy.py
+    Description: Tests for the lazy cost solver.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..events import MatchingStats
+from ..lazy import *
+import random
+import unittest
+
+ex_N = {
+	'A': { '#191': 22, '#122': 14, '#173': 120, '#121': 21, '#128': 4, '#104': 51 },
+	'B': { '#191': 19, '#122': 12, '#173': 172, '#121': 21, '#128': 28, '#104': 43 },
+	'C': { '#191': 161, '#122': 122, '#173': 2, '#121': 50, '#128': 128, '#104': 39 },
+	'D': { '#191': 19, '#122': 22, '#173': 90, '#121': 11, '#128': 28, '#104': 4 },
+	'E': { '#191': 1, '#122': 30, '#173': 113, '#121': 14, '#128': 28, '#104': 86 },
+	'F': { '#191': 60, '#122': 70, '#173': 170, '#121': 28, '#128': 68, '#104': 104 },
+}
+
+ex_Q = {
+	'x1': {'y1': 4, 'y2': 1, 'y3': 3},
+	'x2': {'y1': 2, 'y2': 0, 'y3': 5}
+}
+
+class Counter:
+
+	def __init__(self, G):
+		self.G = G
+		self.pairs = []
+
+	def __call__(self, l, r):
+		if type(r) is list:
+			self.pairs.extend((l, x) for x in r)
+			return [self.G[l][x] for x in r]
+		self.pairs.append((l, r))
+		return self.G[l][r]
+
+class TestLazy(unittest.TestCase):
+
+	def test_lazy_min(self):
+		weight = Counter(ex_N)
+		self.assertEqual(find_matching_lazy(list(ex_N), list(ex_N['A']), weight, 0, 'min', 'total'),
+						 find_matching(ex_N, 'min', 'total'))
+		self.assertLessEqual(len(weight.pairs), 36)
+
+	def test_lazy_bound_required(self):
+		weight = Counter(ex_N)
+		with self.assertRaises(TypeError):
+			find_matching_lazy(list(ex_N), list(ex_N['A']), weight, matching_type = 'min')
+		with self.assertRaises(ValueError):
+			find_matching_lazy(list(ex_N), list(ex_N['A']), weight, None, 'min')
+		self.assertEqual(weight.pairs, [])
+
+	def test_lazy_max(self):
+		self.assertEqual(set(find_matching_lazy(list(ex_N), list(ex_N['A']), Counter(ex_N), 172)),
+						 set(find_matching(ex_N)))
+
+	def test_lazy_rectangular(self):
+		for left, right in ((['x1', 'x2'], ['y1', 'y2', 'y3']), (['y1', 'y2', 'y3'], ['x1', 'x2'])):
+			G = ex_Q if left[0] == 'x1' else {y: {x: ex_Q[x][y] for x in ex_Q} for y in left}
+			self.assertEqual(find_matching_lazy(left, right, Counter(G), 5, return_type = 'total'), 9)
+			self.assertEqual(find_matching_lazy(left, right, Counter(G), 0, 'min', 'total', block = 2), 3)
+
+	def test_lazy_memoized(self):
+		weight = Counter(ex_N)
+		find_matching_lazy(list(ex_N), list(ex_N['A']), weight, 0, 'min')
+		self.assertEqual(len(set(weight.pairs)), len(weight.pairs))
+
+	def test_lazy_pruning(self):
+		rng = random.Random(0)
+		points = [(rng.random(), rng.random()) for _ in range(60)]
+		G = {i: {j: abs(points[i][0] - points[j][0]) + abs(points[i][1] - points[j][1])
+				 for j in range(30, 60)} for i in range(30)}
+		weight = Counter(G)
+		bound = lambda i, j: max(abs(points[i][0] - points[j][0]), abs(points[i][1] - points[j][1]))
+		M = find_matching_lazy(list(range(30)), list(range(30, 60)), weight, bound, 'min', 'total')
+		self.assertAlmostEqual(M, find_matching(G, 'min', 'total'))
+		self.assertLess(len(weight.pairs), 30 * 30 / 2)
+
+	def test_lazy_block(self):
+		weight = Counter(ex_N)
+		stats = MatchingStats()
+		self.assertEqual(find_matching_lazy(list(ex_N), list(ex_N['A']), weight, 0, 'min', 'total',
+											block = 4, on_event = stats),
+						 find_matching(ex_N, 'min', 'total'))
+		self.assertEqual(len(weight.pairs), len(set(weight.pairs)))
+		self.assertEqual(stats.counts['augmentation'], 6)
+		self.assertLess(stats.counts['cost_evaluation'], len(weight.pairs))
+
+	def test_lazy_block_swap(self):
+		# Rows are the right side: pairs are batched per left vertex
+		G = {y: {x: ex_Q[x][y] for x in ex_Q} for y in ('y1', 'y2', 'y3')}
+		weight = Counter(G)
+		calls = []
+		def batch(l, rs):
+			calls.append(len(rs))
+			return weight(l, rs)
+		self.assertEqual(find_matching_lazy(['y1', 'y2', 'y3'], ['x1', 'x2'], batch, 0, 'min', 'total',
+											block = 3), 3)
+		self.assertEqual(len(weight.pairs), len(set(weight.pairs)))
+		self.assertLess(len(calls), len(weight.pairs))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+'''
+    File name: test_loaders.py
+    Description: Tests for the streaming edge-list loaders.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..loaders import *
+import io
+import os
+import tempfile
+import unittest
+
+ex_csv = '''Ann,RB,3
+Ann,CAM,2
+Ben,RB,1
+Ben,CAM,4
+Ann,RB,5
+'''
+
+ex_H = {
+	'x1': {'y1': 1, 'y2': 6},
+	'x2': {'y2': 8, 'y3': 6},
+	'x3': {'y1': 4, 'y3': 1}
+}
+
+class TestLoaders(unittest.TestCase):
+
+	def setUp(self):
+		self.dir = tempfile.TemporaryDirectory()
+
+	def tearDown(self):
+		self.dir.cleanup()
+
+	def test_read_edge_list_last(self):
+		CG = read_edge_list(io.StringIO(ex_csv))
+		self.assertEqual(CG.to_dict()['Ann'], {'RB': 5, 'CAM': 2})
+
+	def test_read_edge_list_max(self):
+		CG = read_edge_list(io.StringIO('a,b,3\na,b,7\na,b,5\n'), duplicates = 'max')
+		self.assertEqual((CG.num_edges(), CG.to_dict()['b']), (1, {'a': 7}))
+
+	def test_read_edge_list_min(self):
+		CG = read_edge_list(io.StringIO('a,b,3\nb,a,1\na,b,5\n'), duplicates = 'min')
+		self.assertEqual(CG.to_dict(), {'a': {'b': 1}, 'b': {'a': 1}})
+
+	def test_read_edge_list_bad_policy(self):
+		with self.assertRaises(ValueError):
+			read_edge_list(io.StringIO(ex_csv), duplicates = 'first')
+
+	def test_read_edge_list_header_delimiter(self):
+		CG = read_edge_list(io.StringIO('worker\ttask\tscore\nx\ty\t2.5\n'),
+							delimiter = '\t', header = True)
+		self.assertEqual((CG.to_dict()['x'], CG.weights.typecode), ({'y': 2.5}, 'd'))
+
+	def test_read_edge_list_unweighted(self):
+		CG = read_edge_list(io.StringIO('a,b\nc,b\n'))
+		self.assertEqual((CG.unweighted, CG.to_dict()['b']), (True, {'a': 1, 'c': 1}))
+
+	def test_read_edge_list_bad_row(self):
+		with self.assertRaises(ValueError):
+			read_edge_list(io.StringIO('a,b,1\na,b,c,d\n'))
+		with self.assertRaises(ValueError):
+			read_edge_list(io.StringIO('a,b,heavy\n'))
+
+	def test_read_edge_list_path(self):
+		path = os.path.join(self.dir.name, 'edges.csv')
+		with open(path, 'w') as f:
+			for v1 in ex_H:
+				for v2 in ex_H[v1]:
+					f.write('%s,%s,%d\n' % (v1, v2, ex_H[v1][v2]))
+		CG = read_edge_list(path, chunksize = 8)
+		self.assertEqual(find_matching(CG, return_type = 'total', sparse = True),
+						 find_matching(ex_H, return_type = 'total'))
+
+	def test_binary_round_trip(self):
+		path = os.path.join(self.dir.name, 'edges.bin')
+		write_binary_edges(path, [(0, 10, 1), (0, 11, 6), (1, 11, 8), (1, 12, 6),
+								  (2, 10, 4), (2, 12, 1), (1, 12, 2)])
+		CG = read_binary_edges(path, duplicates = 'max', chunksize = 2)
+		self.assertEqual((len(CG), CG.num_edges(), CG.to_dict()[12]), (6, 6, {1: 6.0, 2: 1.0}))
+		self.assertEqual(find_matching(CG, return_type = 'total', sparse = True), 16.0)
+
+	def test_edge_buffer_merges_repeats(self):
+		edges = EdgeBuffer('max', flush_edges = 4)
+		peak = 0
+		for i in range(1000):
+			edges.add_edge('a' if i % 2 else 'b', 'c' if i % 3 else 'd', i % 7)
+			peak = max(peak, len(edges.sources) + len(edges.pending_sources))
+		self.assertLessEqual(peak, 4 + 4)
+		CG = edges.to_compact(False)
+		self.assertEqual((CG.num_edges(), CG.to_dict()['a']), (4, {'c': 6, 'd': 6}))
+
+	def test_edge_buffer_last_direction(self):
+		edges = EdgeBuffer(flush_edges = 2)
+		for v1, v2, w in (('x', 'y', 1), ('z', 'y', 2), ('y', 'x', 3), ('x', 'z', 4), ('x', 'y', 5)):
+			edges.add_edge(v1, v2, w)
+		CG = edges.to_compact(False)
+		self.assertEqual(sorted((CG.keys[a], CG.keys[b], w) for a, b, w in CG.oriented_edges()),
+						 [('x', 'y', 5), ('x', 'z', 4), ('z', 'y', 2)])
+
+	def test_binary_overlapping_ids(self):
+		path = os.path.join(self.dir.name, 'scores.bin')
+		write_binary_edges(path, [(0, 0, 5), (0, 1, 3), (1, 0, 2), (1, 1, 7)])
+		with self.assertRaises(ValueError):
+			read_binary_edges(path)
+		CG = read_binary_edges(path, separate_ids = True)
+		self.assertEqual((len(CG), CG.num_edges()), (4, 4))
+		self.assertEqual(set(find_matching(CG, sparse = True)),
+						 {((('L', 0), ('R', 0)), 5.0), ((('L', 1), ('R', 1)), 7.0)})
+
+	def test_binary_empty(self):
+		path = os.path.join(self.dir.name, 'empty.bin')
+		write_binary_edges(path, [])
+		self.assertEqual(len(read_binary_edges(path)), 0)
+
+	def test_binary_truncated(self):
+		path = os.path.join(self.dir.name, 'bad.bin')
+		with open(path, 'wb') as f:
+			f.write(b'\x00' * 17)
+		with self.assertRaises(ValueError):
+			read_binary_edges(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+'''
+    File name: test_matrix.py
+    Description: Tests for the dense cost-matrix solver.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+import os
+import tempfile
+import unittest
+
+try:
+	import numpy as np
+	from .. import matrix
+	from ..matrix import solve_matrix
+except ImportError:
+	np = None
+
+rows_N = ['A', 'B', 'C', 'D', 'E', 'F']
+cols_N = ['#191', '#122', '#173', '#121', '#128', '#104']
+ex_N = [
+	[22, 14, 120, 21, 4, 51],
+	[19, 12, 172, 21, 28, 43],
+	[161, 122, 2, 50, 128, 39],
+	[19, 22, 90, 11, 28, 4],
+	[1, 30, 113, 14, 28, 86],
+	[60, 70, 170, 28, 68, 104]
+]
+
+ex_M = [
+	[3668, 3880],
+	[482, 1825]
+]
+
+ex_R = [
+	[4, 1, 3],
+	[2, 0, 5]
+]
+
+def as_graph(cost, rows, cols):
+	return {r: {c: cost[i][j] for j, c in enumerate(cols)}
+			for i, r in enumerate(rows)}
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestSolveMatrix(unittest.TestCase):
+
+	def test_solve_matrix_min(self):
+		row_ind, col_ind, total = solve_matrix(np.array(ex_N))
+		self.assertEqual(total, 51)
+		self.assertEqual(list(row_ind), [0, 1, 2, 3, 4, 5])
+		self.assertEqual(list(col_ind), [4, 1, 2, 5, 0, 3])
+
+	def test_solve_matrix_min_matches_find_matching(self):
+		row_ind, col_ind, total = solve_matrix(np.array(ex_N))
+		self.assertEqual(
+			set(((rows_N[i], cols_N[j]), ex_N[i][j]) for i, j in zip(row_ind, col_ind)),
+			set(find_matching(as_graph(ex_N, rows_N, cols_N), matching_type = 'min')))
+
+	def test_solve_matrix_max(self):
+		self.assertEqual(solve_matrix(np.array(ex_M), maximize = True)[2], 5493)
+
+	def test_solve_matrix_min2(self):
+		self.assertEqual(solve_matrix(np.array(ex_M))[2], 4362)
+
+	def test_solve_matrix_rectangular_wide(self):
+		row_ind, col_ind, total = solve_matrix(np.array(ex_R))
+		self.assertEqual((list(row_ind), list(col_ind), total), ([0, 1], [1, 0], 3))
+
+	def test_solve_matrix_rectangular_tall(self):
+		row_ind, col_ind, total = solve_matrix(np.array(ex_R).T)
+		self.assertEqual((list(row_ind), list(col_ind), total), ([0, 1], [1, 0], 3))
+
+	def test_solve_matrix_float(self):
+		row_ind, col_ind, total = solve_matrix([[0.5, 1.25], [1.5, 0.25]])
+		self.assertAlmostEqual(total, 0.75)
+
+	def test_solve_matrix_empty(self):
+		row_ind, col_ind, total = solve_matrix(np.zeros((0, 3)))
+		self.assertEqual((len(row_ind), len(col_ind), total), (0, 0, 0))
+
+	def test_solve_matrix_infeasible(self):
+		with self.assertRaises(ValueError):
+			solve_matrix([[np.inf, np.inf], [1, 2]])
+
+	def test_solve_matrix_ties(self):
+		# Many columns at the same distance are settled together
+		C = np.random.RandomState(0).randint(0, 3, (40, 50))
+		total = solve_matrix(C)[2]
+		self.assertEqual(total, find_matching(as_graph(C.tolist(), range(40), ['c%d' % j for j in range(50)]),
+											  matching_type = 'min', return_type = 'total'))
+
+	def test_solve_matrix_workers(self):
+		columns = matrix.PARALLEL_MIN_COLUMNS
+		matrix.PARALLEL_MIN_COLUMNS = 4
+		try:
+			for C in (np.random.RandomState(1).randint(0, 5, (30, 30)), np.random.RandomState(2).rand(20, 25)):
+				self.assertAlmostEqual(solve_matrix(C, workers = 3)[2], solve_matrix(C)[2])
+				self.assertAlmostEqual(solve_matrix(C, maximize = True, workers = None)[2],
+									   solve_matrix(C, maximize = True)[2])
+		finally:
+			matrix.PARALLEL_MIN_COLUMNS = columns
+
+	def test_solve_matrix_mapped(self):
+		with tempfile.TemporaryDirectory() as d:
+			for cost in (ex_N, ex_R, np.array(ex_R).T, np.random.RandomState(3).rand(9, 7)):
+				path = os.path.join(d, 'cost.npy')
+				np.save(path, np.array(cost, dtype = np.float32))
+				for maximize in (False, True):
+					want = solve_matrix(np.array(cost, dtype = np.float32), maximize)
+					for mapped in (path, np.load(path, mmap_mode = 'r')):
+						got = solve_matrix(mapped, maximize)
+						self.assertEqual((list(got[0]), list(got[1])), (list(want[0]), list(want[1])))
+						self.assertAlmostEqual(got[2], want[2], places = 5)
+				del mapped
+
+	def test_mapped_costs_read_on_demand(self):
+		with tempfile.TemporaryDirectory() as d:
+			path = os.path.join(d, 'cost.npy')
+			np.save(path, np.array(ex_N))
+			C = matrix.MappedCosts(np.load(path, mmap_mode = 'r'), -1)
+			self.assertEqual(list(C[2]), [-x for x in ex_N[2]])
+			self.assertEqual(C.values_read, 6)
+			col_of = matrix.shortest_augmenting_paths(C)
+			self.assertEqual(sum(ex_N[i][j] for i, j in enumerate(col_of)),
+							 solve_matrix(np.array(ex_N), maximize = True)[2])
+			del C
+
+	def test_solve_matrix_mapped_nan(self):
+		with tempfile.TemporaryDirectory() as d:
+			path = os.path.join(d, 'cost.npy')
+			np.save(path, np.array([[1, np.nan], [2, 3]]))
+			with self.assertRaises(ValueError):
+				solve_matrix(path)
+
+	def test_solve_matrix_not_2d(self):
+		with self.assertRaises(ValueError):
+			solve_matrix([1, 2, 3])
+
+if __name__ == '__main__':
+    unittest.main()
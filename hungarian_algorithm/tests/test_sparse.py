@@ -0,0 +1,106 @@
+'''
+    File name: test_sparse.py
+    Description: Tests for the sparse assignment solver.
+    Author: Ben Chaplin
+    GitHub: https://github.com/benchaplin/hungarian-algorithm
+    Package: hungarian_algorithm
+    Python Version: 3.7.5
+    License: MIT License Copyright (c) 2020 Ben Chaplin
+'''
+
+from ..algorithm import find_matching
+from ..sparse import *
+import unittest
+
+ex_G = {
+	'a': {'b': 2, 'c': 7, 'e': 1},
+	'd': {'b': 5}
+}
+
+ex_L = {
+	'Ann': {'RB': 3, 'CAM': 2, 'GK': 1},
+	'Ben': {'LW': 3, 'S': 2, 'CM': 1},
+	'Cal': {'CAM': 3, 'RW': 2, 'SWP': 1},
+	'Dan': {'S': 3, 'LW': 2, 'GK': 1},
+	'Ela': {'GK': 3, 'LW': 2, 'F': 1},
+	'Fae': {'CM': 3, 'GK': 2, 'CAM': 1},
+	'Gio': {'GK': 3, 'CM': 2, 'S': 1},
+	'Hol': {'CAM': 3, 'F': 2, 'SWP': 1},
+	'Ian': {'S': 3, 'RW': 2, 'RB': 1},
+	'Jon': {'F': 3, 'LW': 2, 'CB': 1},
+	'Kay': {'GK': 3, 'RW': 2, 'LW': 1, 'LB': 0}
+}
+
+ex_N = {
+	'A': { '#191': 22, '#122': 14, '#173': 120, '#121': 21, '#128': 4, '#104': 51 },
+	'B': { '#191': 19, '#122': 12, '#173': 172, '#121': 21, '#128': 28, '#104': 43 },
+	'C': { '#191': 161, '#122': 122, '#173': 2, '#121': 50, '#128': 128, '#104': 39 },
+	'D': { '#191': 19, '#122': 22, '#173': 90, '#121': 11, '#128': 28, '#104': 4 },
+	'E': { '#191': 1, '#122': 30, '#173': 113, '#121': 14, '#128': 28, '#104': 86 },
+	'F': { '#191': 60, '#122': 70, '#173': 170, '#121': 28, '#128': 68, '#104': 104 },
+}
+
+ex_S = {
+	'x1': {'y1': 4, 'y2': 9},
+	'x2': {'y2': 7},
+	'x3': {'y2': 3}
+}
+
+ex_T = {
+	'x1': {'y1': 5},
+	'x2': {'y1': 6, 'y2': 2}
+}
+
+ex_U = {
+	'x1': {'y1': -2},
+	'x2': {'y1': 7, 'y2': 9},
+	'x3': {'y3': 4}
+}
+
+class TestSparse(unittest.TestCase):
+
+	def test_sparse_max(self):
+		self.assertEqual(set(find_matching(ex_G, sparse = True)),
+						 {(('a', 'c'), 7), (('d', 'b'), 5)})
+
+	def test_sparse_max_total(self):
+		self.assertEqual(find_matching(ex_L, return_type = 'total', sparse = True), 24)
+
+	def test_sparse_min(self):
+		self.assertEqual(set(find_matching(ex_N, matching_type = 'min', sparse = True)),
+						 set(find_matching(ex_N, matching_type = 'min')))
+
+	def test_sparse_rectangular(self):
+		self.assertEqual(set(find_matching(ex_S, sparse = True)),
+						 {(('x1', 'y1'), 4), (('x2', 'y2'), 7)})
+
+	def test_sparse_forbidden(self):
+		self.assertEqual(set(find_matching(ex_S, sparse = True, missing = 'forbidden')),
+						 {(('x1', 'y1'), 4), (('x2', 'y2'), 7)})
+
+	def test_sparse_forbidden_cardinality_first(self):
+		self.assertEqual(set(find_matching(ex_T, sparse = True, missing = 'forbidden')),
+						 {(('x1', 'y1'), 5), (('x2', 'y2'), 2)})
+
+	def test_sparse_min_zero_pairs(self):
+		self.assertEqual(set(find_matching(ex_U, matching_type = 'min', sparse = True)),
+						 {(('x1', 'y1'), -2), (('x2', 'y3'), 0), (('x3', 'y2'), 0)})
+
+	def test_sparse_complete_fallback(self):
+		self.assertEqual(find_matching({'x1': {'y1': 5}, 'x2': {'y1': 3}},
+									   matching_type = 'min', sparse = True),
+						 [(('x2', 'y1'), 3)])
+
+	def test_sparse_not_bipartite(self):
+		self.assertFalse(find_matching({'x': {'y': 1, 'z': 1}, 'y': {'z': 1}}, sparse = True))
+
+	def test_sparse_missing_invalid(self):
+		with self.assertRaises(ValueError):
+			find_matching(ex_G, sparse = True, missing = 'skip')
+
+	def test_shortest_augmenting_paths1(self):
+		self.assertEqual(shortest_augmenting_paths([[(0, 1), (1, 3)], [(0, 2), (1, 5)]], 2),
+						 [1, 0])
+
+if __name__ == '__main__':
+    unittest.main()